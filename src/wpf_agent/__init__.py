@@ -1,2 +1,2 @@
 """WPF UI Debug Automation Agent."""
-__version__ = "0.1.0"
+from wpf_agent._version import __version__
@@ -1,4 +1,105 @@
 """Allow running as python -m wpf_agent."""
-from wpf_agent.cli import main
-if __name__ == "__main__":
+import sys
+
+# Answered before click and the command registry are imported.
+_HELP = """\
+Usage: wpf-agent [OPTIONS] COMMAND [ARGS]...
+
+  WPF UI Debug Automation Agent.
+
+Options:
+  -V, --version  Show the version and exit.
+  -h, --help     Show this message and exit.
+
+Commands:
+  attach          Attach to a running process by PID.
+  close           Gracefully close a process launched by wpf-agent.
+  daemon          Keep a warm CLI process for this project (opt-in).
+  explore         AI-guided exploratory test commands.
+  init            Initialize project: create .wpf-agent/ config and...
+  install-skills  Install Claude Code slash-command skills into...
+  launch          Launch an application and connect.
+  mcp-serve       Start the MCP server (stdio transport for Claude Code).
+  personas        Manage usability-test persona presets.
+  profiles        Manage target app profiles.
+  random          Random (exploratory) test commands.
+  replay          Replay a recorded action sequence (AI-free).
+  run             Run the agent loop with a profile (interactive mode).
+  scenario        Scenario test commands.
+  tickets         Ticket management commands.
+  ui              Direct UI operations (for Claude Code to drive the UI...
+  verify          Verify a built app: launch, smoke-test, check elements,...
+"""
+
+
+def _brief_alive_pid(args: list[str]) -> int | None:
+    """Return N for ``--pid N --brief`` (either order), else None."""
+    if args.count("--brief") != 1:
+        return None
+    rest = [a for a in args if a != "--brief"]
+    if len(rest) == 2 and rest[0] == "--pid" and rest[1].isdigit():
+        return int(rest[1])
+    if len(rest) == 1 and rest[0].startswith("--pid=") and rest[0][6:].isdigit():
+        return int(rest[0][6:])
+    return None
+
+
+def _fast_path(argv: list[str]) -> bool:
+    """Handle trivially answerable invocations without importing click.
+
+    Covers bare ``--version`` / ``--help`` and the polling verbs
+    ``ui alive --pid N --brief`` and ``ui status``.
+    """
+    if len(argv) == 1:
+        if argv[0] in ("-V", "--version"):
+            from wpf_agent._version import __version__
+
+            print(f"wpf-agent, version {__version__}")
+            return True
+        if argv[0] in ("-h", "--help"):
+            sys.stdout.write(_HELP)
+            return True
+        return False
+    if sys.platform != "win32" or argv[:1] != ["ui"]:
+        return False
+    if argv[1:] == ["status"]:
+        from wpf_agent import _jsonio
+        from wpf_agent.ui_guard import get_pause_info, is_paused
+
+        if is_paused():
+            result = {"state": "paused", **(get_pause_info() or {})}
+        else:
+            result = {"state": "active"}
+        print(_jsonio.dumps(result))
+        return True
+    if argv[1:2] == ["alive"]:
+        pid = _brief_alive_pid(argv[2:])
+        if pid is None:
+            return False
+        from wpf_agent._winproc import pid_alive
+
+        if pid_alive(pid):
+            print(pid)
+        return True
+    return False
+
+
+def run() -> None:
+    """Console-script entry point: fast path, then a running daemon, then the click CLI."""
+    argv = sys.argv[1:]
+    if _fast_path(argv):
+        sys.exit(0)
+
+    from wpf_agent import daemon
+
+    code = daemon.forward(argv)
+    if code is not None:
+        sys.exit(code)
+
+    from wpf_agent.cli import main
+
     main()
+
+
+if __name__ == "__main__":
+    run()
@@ -0,0 +1,79 @@
+"""JSON file helpers: orjson when installed, stdlib json otherwise."""
+
+from __future__ import annotations
+
+import json
+from typing import IO, Any, Callable, Optional
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised when orjson is absent
+    orjson = None
+
+# Stdlib fallback encoders, built once rather than per dumps() call
+# (including the common ``default=str`` variants).  Compact output uses
+# the same separators as orjson.
+_COMPACT = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_PRETTY = json.JSONEncoder(ensure_ascii=False, indent=2)
+_COMPACT_STR = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=str)
+_PRETTY_STR = json.JSONEncoder(ensure_ascii=False, indent=2, default=str)
+
+if orjson is not None:
+    _OPT_COMPACT = orjson.OPT_NON_STR_KEYS
+    _OPT_PRETTY = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+    _OPT_LINE = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+
+
+def _encoder(indent: bool, default: Optional[Callable[[Any], Any]] = None) -> json.JSONEncoder:
+    if default is None:
+        return _PRETTY if indent else _COMPACT
+    if default is str:
+        return _PRETTY_STR if indent else _COMPACT_STR
+    if indent:
+        return json.JSONEncoder(ensure_ascii=False, indent=2, default=default)
+    return json.JSONEncoder(ensure_ascii=False, separators=(",", ":"), default=default)
+
+
+def loads(data: bytes | str) -> Any:
+    """Decode JSON from raw file bytes (or text)."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_pretty(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode *obj* as 2-space indented UTF-8 JSON, non-ASCII kept as-is."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_OPT_PRETTY)
+    return _encoder(True, default).encode(obj).encode("utf-8")
+
+
+def dumps(obj: Any, *, indent: bool = False, default: Optional[Callable[[Any], Any]] = None) -> str:
+    """Encode *obj* as a JSON string, non-ASCII kept as-is.
+
+    Compact by default; ``indent=True`` gives 2-space indentation.
+    """
+    if orjson is not None:
+        option = _OPT_PRETTY if indent else _OPT_COMPACT
+        return orjson.dumps(obj, default=default, option=option).decode("utf-8")
+    return _encoder(indent, default).encode(obj)
+
+
+def dumps_line(obj: Any, default: Optional[Callable[[Any], Any]] = None) -> bytes:
+    """Encode *obj* as one compact, newline-terminated UTF-8 JSON line."""
+    if orjson is not None:
+        return orjson.dumps(obj, default=default, option=_OPT_LINE)
+    return (_encoder(False, default).encode(obj) + "\n").encode("utf-8")
+
+
+def dump(obj: Any, fp: IO[bytes], *, indent: bool = False) -> None:
+    """Write *obj* as UTF-8 JSON to the binary stream *fp*.
+
+    The stdlib fallback streams encoder chunks instead of building the
+    whole document as one string first.
+    """
+    if orjson is not None:
+        fp.write(orjson.dumps(obj, option=_OPT_PRETTY if indent else _OPT_COMPACT))
+        return
+    for chunk in _encoder(indent).iterencode(obj):
+        fp.write(chunk.encode("utf-8"))
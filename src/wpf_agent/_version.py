@@ -0,0 +1,2 @@
+"""Package version (kept free of imports so version checks stay cheap)."""
+__version__ = "0.1.0"
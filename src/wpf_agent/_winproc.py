@@ -0,0 +1,148 @@
+"""Process and window lookups through kernel32/user32 directly (no psutil, no click).
+
+Kept import-light so the ``python -m wpf_agent`` fast path can use it.
+The DLL handles and their prototypes are bound once at import (Windows
+only) with ``use_last_error=True`` so ``ctypes.get_last_error()`` is
+reliable after a failed call.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import ctypes.wintypes as wt
+import sys
+
+PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+STILL_ACTIVE = 259
+ERROR_ACCESS_DENIED = 5
+TH32CS_SNAPPROCESS = 0x2
+WM_CLOSE = 0x0010
+INVALID_HANDLE_VALUE = ctypes.c_void_p(-1).value
+
+
+class PROCESSENTRY32W(ctypes.Structure):
+    _fields_ = [
+        ("dwSize", wt.DWORD),
+        ("cntUsage", wt.DWORD),
+        ("th32ProcessID", wt.DWORD),
+        ("th32DefaultHeapID", ctypes.c_size_t),
+        ("th32ModuleID", wt.DWORD),
+        ("cntThreads", wt.DWORD),
+        ("th32ParentProcessID", wt.DWORD),
+        ("pcPriClassBase", ctypes.c_long),
+        ("dwFlags", wt.DWORD),
+        ("szExeFile", ctypes.c_wchar * 260),
+    ]
+
+
+def _bind_kernel32():
+    k = ctypes.WinDLL("kernel32", use_last_error=True)
+    k.OpenProcess.argtypes = [wt.DWORD, wt.BOOL, wt.DWORD]
+    k.OpenProcess.restype = wt.HANDLE
+    k.GetExitCodeProcess.argtypes = [wt.HANDLE, ctypes.POINTER(wt.DWORD)]
+    k.GetExitCodeProcess.restype = wt.BOOL
+    k.CreateToolhelp32Snapshot.argtypes = [wt.DWORD, wt.DWORD]
+    k.CreateToolhelp32Snapshot.restype = wt.HANDLE
+    for fn in (k.Process32FirstW, k.Process32NextW):
+        fn.argtypes = [wt.HANDLE, ctypes.POINTER(PROCESSENTRY32W)]
+        fn.restype = wt.BOOL
+    k.CloseHandle.argtypes = [wt.HANDLE]
+    k.CloseHandle.restype = wt.BOOL
+    return k
+
+
+def _bind_user32():
+    u = ctypes.WinDLL("user32", use_last_error=True)
+    u.FindWindowExW.argtypes = [wt.HWND, wt.HWND, wt.LPCWSTR, wt.LPCWSTR]
+    u.FindWindowExW.restype = wt.HWND
+    u.GetWindowThreadProcessId.argtypes = [wt.HWND, ctypes.POINTER(wt.DWORD)]
+    u.GetWindowThreadProcessId.restype = wt.DWORD
+    u.IsWindow.argtypes = [wt.HWND]
+    u.IsWindow.restype = wt.BOOL
+    u.IsWindowVisible.argtypes = [wt.HWND]
+    u.IsWindowVisible.restype = wt.BOOL
+    u.GetWindowTextLengthW.argtypes = [wt.HWND]
+    u.GetWindowTextLengthW.restype = ctypes.c_int
+    u.PostMessageW.argtypes = [wt.HWND, wt.UINT, wt.WPARAM, wt.LPARAM]
+    u.PostMessageW.restype = wt.BOOL
+    return u
+
+
+if sys.platform == "win32":
+    _KERNEL32 = _bind_kernel32()
+    _USER32 = _bind_user32()
+else:  # pragma: no cover - Windows-only API
+    _KERNEL32 = None
+    _USER32 = None
+
+
+def pid_alive(pid: int) -> bool:
+    """Return True if *pid* names a running (not yet exited) process.
+
+    A process we may not open (protected or another session's) exists.
+    """
+    handle = _KERNEL32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return ctypes.get_last_error() == ERROR_ACCESS_DENIED
+    exit_code = wt.DWORD()
+    _KERNEL32.GetExitCodeProcess(handle, ctypes.byref(exit_code))
+    _KERNEL32.CloseHandle(handle)
+    return exit_code.value == STILL_ACTIVE
+
+
+def find_processes(image_name: str) -> list[dict]:
+    """Return ``{"pid", "process"}`` for every process named *image_name*.
+
+    Walks a Toolhelp snapshot in-process; the name compare is
+    case-insensitive, like ``tasklist /FI "IMAGENAME eq ..."``.
+    """
+    snapshot = _KERNEL32.CreateToolhelp32Snapshot(TH32CS_SNAPPROCESS, 0)
+    if snapshot is None or snapshot == INVALID_HANDLE_VALUE:
+        return []
+    wanted = image_name.casefold()
+    matches = []
+    entry = PROCESSENTRY32W()
+    entry.dwSize = ctypes.sizeof(PROCESSENTRY32W)
+    try:
+        ok = _KERNEL32.Process32FirstW(snapshot, ctypes.byref(entry))
+        while ok:
+            if entry.szExeFile.casefold() == wanted:
+                matches.append({"pid": entry.th32ProcessID, "process": entry.szExeFile})
+            ok = _KERNEL32.Process32NextW(snapshot, ctypes.byref(entry))
+    finally:
+        _KERNEL32.CloseHandle(snapshot)
+    return matches
+
+
+def window_exists(hwnd: int) -> bool:
+    """Return True if *hwnd* still names a window (handles are not reused
+    while the window lives)."""
+    return bool(_USER32.IsWindow(hwnd))
+
+
+def main_windows(pid: int) -> list[int]:
+    """Return visible, titled top-level windows owned by *pid*.
+
+    Walks the top-level siblings with ``FindWindowExW`` rather than an
+    ``EnumWindows`` Python callback; the PID check short-circuits first.
+    """
+    user32 = _USER32
+    win_pid = wt.DWORD()
+    found = []
+    hwnd = user32.FindWindowExW(None, None, None, None)
+    while hwnd:
+        user32.GetWindowThreadProcessId(hwnd, ctypes.byref(win_pid))
+        if (
+            win_pid.value == pid
+            and user32.IsWindowVisible(hwnd)
+            and user32.GetWindowTextLengthW(hwnd) > 0
+        ):
+            found.append(hwnd)
+        hwnd = user32.FindWindowExW(None, hwnd, None, None)
+    return found
+
+
+def post_close(hwnds: list[int]) -> None:
+    """Post ``WM_CLOSE`` to each window (asynchronous, no force-kill)."""
+    for hwnd in hwnds:
+        _USER32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
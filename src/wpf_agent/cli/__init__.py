@@ -0,0 +1,136 @@
+"""CLI entry point — click-based commands.
+
+Each top-level command lives in its own module under
+``wpf_agent.cli.cmds`` and is imported only when it is invoked.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+import click
+
+from wpf_agent._version import __version__
+
+
+class LazyGroup(click.Group):
+    """Click group that imports subcommands from ``module:attr`` paths on demand.
+
+    *lazy_help* maps command names to their one-line help so that listing
+    the group (``--help``) does not import every subcommand module.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: dict[str, str] | None = None,
+        lazy_help: dict[str, str] | None = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = lazy_subcommands or {}
+        self.lazy_help = lazy_help or {}
+
+    def list_commands(self, ctx: click.Context) -> list[str]:
+        return sorted({*self.commands, *self.lazy_subcommands})
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> click.Command | None:
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def format_commands(self, ctx: click.Context, formatter: click.HelpFormatter) -> None:
+        names = self.list_commands(ctx)
+        if not names:
+            return
+        limit = formatter.width - 6 - max(len(n) for n in names)
+        rows = []
+        for name in names:
+            if name in self.lazy_help and name not in self.commands:
+                rows.append((name, click.utils.make_default_short_help(self.lazy_help[name], limit)))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                rows.append((name, cmd.get_short_help_str(limit)))
+        if rows:
+            with formatter.section("Commands"):
+                formatter.write_dl(rows)
+
+    def shell_complete(self, ctx: click.Context, incomplete: str) -> list:
+        """Complete subcommand names from the help table without importing them."""
+        from click.shell_completion import CompletionItem
+
+        results = []
+        for name in self.list_commands(ctx):
+            if not name.startswith(incomplete):
+                continue
+            if name in self.lazy_help and name not in self.commands:
+                results.append(CompletionItem(name, help=self.lazy_help[name]))
+                continue
+            cmd = self.get_command(ctx, name)
+            if cmd is not None and not cmd.hidden:
+                results.append(CompletionItem(name, help=cmd.get_short_help_str()))
+        results.extend(click.Command.shell_complete(self, ctx, incomplete))
+        return results
+
+    def _load(self, cmd_name: str) -> click.Command:
+        mod_path, attr = self.lazy_subcommands[cmd_name].rsplit(":", 1)
+        cmd = getattr(importlib.import_module(mod_path), attr)
+        if not isinstance(cmd, click.Command):
+            raise TypeError(f"Lazy command '{cmd_name}' is not a click.Command: {cmd!r}")
+        return cmd
+
+
+_COMMANDS = {
+    "init": "wpf_agent.cli.cmds.init:init",
+    "install-skills": "wpf_agent.cli.cmds.install_skills:install_skills",
+    "mcp-serve": "wpf_agent.cli.cmds.mcp_serve:mcp_serve",
+    "profiles": "wpf_agent.cli.cmds.profiles:profiles",
+    "personas": "wpf_agent.cli.cmds.personas:personas",
+    "run": "wpf_agent.cli.cmds.run:run",
+    "attach": "wpf_agent.cli.cmds.attach:attach",
+    "launch": "wpf_agent.cli.cmds.launch:launch",
+    "close": "wpf_agent.cli.cmds.close:close_cmd",
+    "ui": "wpf_agent.cli.cmds.ui:ui_cmd",
+    "scenario": "wpf_agent.cli.cmds.scenario:scenario",
+    "random": "wpf_agent.cli.cmds.random_cmd:random_cmd",
+    "explore": "wpf_agent.cli.cmds.explore:explore_cmd",
+    "verify": "wpf_agent.cli.cmds.verify:verify",
+    "replay": "wpf_agent.cli.cmds.replay:replay",
+    "tickets": "wpf_agent.cli.cmds.tickets:tickets",
+    "daemon": "wpf_agent.cli.cmds.daemon:daemon_cmd",
+}
+
+
+_HELP = {
+    "init": "Initialize project: create .wpf-agent/ config and artifact directories.",
+    "install-skills": "Install Claude Code slash-command skills into .claude/skills/.",
+    "mcp-serve": "Start the MCP server (stdio transport for Claude Code).",
+    "profiles": "Manage target app profiles.",
+    "personas": "Manage usability-test persona presets.",
+    "run": "Run the agent loop with a profile (interactive mode).",
+    "attach": "Attach to a running process by PID.",
+    "launch": "Launch an application and connect.",
+    "close": "Gracefully close a process launched by wpf-agent.",
+    "ui": "Direct UI operations (for Claude Code to drive the UI loop).",
+    "scenario": "Scenario test commands.",
+    "random": "Random (exploratory) test commands.",
+    "explore": "AI-guided exploratory test commands.",
+    "verify": "Verify a built app: launch, smoke-test, check elements, and report.",
+    "replay": "Replay a recorded action sequence (AI-free).",
+    "tickets": "Ticket management commands.",
+    "daemon": "Keep a warm CLI process for this project (opt-in).",
+}
+
+
+@click.group(
+    cls=LazyGroup,
+    lazy_subcommands=_COMMANDS,
+    lazy_help=_HELP,
+    context_settings={"help_option_names": ["-h", "--help"]},
+)
+@click.version_option(__version__, "-V", "--version", prog_name="wpf-agent")
+@click.pass_context
+def main(ctx):
+    """WPF UI Debug Automation Agent."""
+    ctx.ensure_object(dict)
@@ -0,0 +1,104 @@
+"""Helpers shared by several CLI command modules."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+def option_group(*options):
+    """Combine ``click.option(...)`` decorators into one decorator.
+
+    The options appear in the given order, as if stacked by hand.
+    """
+
+    def decorate(f):
+        for option in reversed(options):
+            f = option(f)
+        return f
+
+    return decorate
+
+
+def profile_store():
+    """Return the process-wide ProfileStore."""
+    from wpf_agent.config import ProfileStore
+
+    return ProfileStore.get_instance()
+
+
+def persona_store():
+    """Return the process-wide PersonaStore."""
+    from wpf_agent.config import PersonaStore
+
+    return PersonaStore.get_instance()
+
+
+def target_registry():
+    """Return the process-wide TargetRegistry."""
+    from wpf_agent.core.target import TargetRegistry
+
+    return TargetRegistry.get_instance()
+
+
+def get_profile_or_exit(name: str):
+    """Look up profile *name*, or print an error and exit with status 1."""
+    prof = profile_store().get(name)
+    if prof is None:
+        click.echo(f"Profile '{name}' not found", err=True)
+        sys.exit(1)
+    return prof
+
+
+def do_close(pid: int, force: bool = False) -> None:
+    """Shared implementation for ``ui close`` and top-level ``close``."""
+    import time
+
+    from wpf_agent import _jsonio
+    from wpf_agent.core.target import is_launched_pid, remove_launched_pid
+
+    if not force and not is_launched_pid(pid):
+        import psutil as _ps
+
+        if _ps.pid_exists(pid):
+            try:
+                pname = _ps.Process(pid).name()
+            except _ps.AccessDenied:
+                pname = "unknown"
+            msg = (
+                f"PID {pid} ({pname}) was not started by wpf-agent. "
+                "Only processes launched via 'wpf-agent launch' or "
+                "'wpf-agent verify' can be closed with this command. "
+                "Use --force to skip this check."
+            )
+        else:
+            msg = f"PID {pid} does not exist."
+        click.echo(_jsonio.dumps({"closed": False, "error": msg}))
+        sys.exit(1)
+
+    # Find the main window(s) for this PID and send WM_CLOSE.
+    # Collect first: closing while walking can drop the sibling cursor.
+    from wpf_agent._winproc import main_windows, pid_alive, post_close
+
+    closed_hwnds = main_windows(pid)
+    post_close(closed_hwnds)
+
+    if closed_hwnds:
+        if is_launched_pid(pid):
+            remove_launched_pid(pid)
+        target_registry().forget_pid(pid)
+        # Poll for process exit (up to 3s)
+        exited = False
+        for _ in range(30):
+            if not pid_alive(pid):
+                exited = True
+                break
+            time.sleep(0.1)
+        result = {"closed": True, "pid": pid, "windows": len(closed_hwnds), "exited": exited}
+        if not exited:
+            result["warning"] = "Process still running after 3s"
+        click.echo(_jsonio.dumps(result))
+    else:
+        click.echo(_jsonio.dumps({"closed": False, "pid": pid, "error": "No visible window found"}))
+        sys.exit(1)
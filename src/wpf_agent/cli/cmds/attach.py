@@ -0,0 +1,16 @@
+"""`wpf-agent attach` — attach to a running process."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+@click.option("--pid", required=True, type=int, help="Process ID to attach to")
+def attach(pid):
+    """Attach to a running process by PID."""
+    from wpf_agent.cli._common import target_registry
+
+    registry = target_registry()
+    tid, target = registry.resolve({"pid": pid})
+    click.echo(f"Attached: {target} (target_id={tid})")
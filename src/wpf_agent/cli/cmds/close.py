@@ -0,0 +1,18 @@
+"""`wpf-agent close` — gracefully close a launched process."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent.cli._common import do_close
+
+
+@click.command("close")
+@click.option("--pid", required=True, type=int, help="PID of the process to close")
+@click.option("--force", is_flag=True, default=False, help="Skip launched-pid check (still uses WM_CLOSE, no force-kill)")
+def close_cmd(pid, force):
+    """Gracefully close a process launched by wpf-agent.
+
+    Alias for `wpf-agent ui close`. Sends WM_CLOSE to the main window.
+    """
+    do_close(pid, force=force)
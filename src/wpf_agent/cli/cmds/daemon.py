@@ -0,0 +1,35 @@
+"""`wpf-agent daemon` — resident CLI process for repeated invocations."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+@click.group("daemon")
+def daemon_cmd():
+    """Keep a warm CLI process for this project (opt-in)."""
+
+
+@daemon_cmd.command("start")
+def daemon_start():
+    """Serve CLI commands for this project until stopped (foreground)."""
+    from wpf_agent import daemon
+
+    if daemon.stop():
+        click.echo("Replaced a running daemon.", err=True)
+    click.echo(f"Serving; state file {daemon.state_path()}", err=True)
+    daemon.serve()
+
+
+@daemon_cmd.command("stop")
+def daemon_stop():
+    """Stop this project's daemon."""
+    from wpf_agent import daemon
+
+    if not daemon.stop():
+        daemon.state_path().unlink(missing_ok=True)
+        click.echo("No daemon running.", err=True)
+        sys.exit(1)
+    click.echo("Daemon stopped.")
@@ -0,0 +1,89 @@
+"""`wpf-agent explore` — AI-guided exploratory test commands."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+@click.group("explore")
+def explore_cmd():
+    """AI-guided exploratory test commands."""
+    pass
+
+
+@explore_cmd.command("run")
+@click.option("--profile", default=None, help="Profile name")
+@click.option("--goal", default="", help="Exploration goal (e.g. '全画面を探索してクラッシュを探す')")
+@click.option("--config", "config_file", default=None,
+              type=click.Path(exists=True, dir_okay=False), help="Path to explore config YAML")
+@click.option("--max-steps", default=None, type=int, help="Maximum exploration steps (overrides config)")
+@click.option("--model", default=None, help="Claude model to use (overrides config)")
+def explore_run(profile, goal, config_file, max_steps, model):
+    """Run AI-guided exploratory testing.
+
+    Uses Claude Vision to analyze screenshots and decide actions.
+    Requires ANTHROPIC_API_KEY environment variable.
+    """
+    import pathlib
+
+    from wpf_agent.cli._common import get_profile_or_exit, target_registry
+    from wpf_agent.core.session import Session
+    from wpf_agent.testing.explorer import ExploreConfig, run_explore_test
+    from wpf_agent.tickets.generator import generate_ticket_from_explore
+
+    # Load config from YAML or use defaults
+    if config_file:
+        config = ExploreConfig.from_file(pathlib.Path(config_file))
+    else:
+        config = ExploreConfig()
+
+    # CLI overrides
+    if max_steps is not None:
+        config.max_steps = max_steps
+    if goal:
+        config.goal = goal
+    if model:
+        config.model = model
+
+    # Resolve profile: CLI > config file > error
+    profile_name = profile or config.profile
+    if not profile_name:
+        click.echo("Specify --profile or set profile in config YAML", err=True)
+        sys.exit(1)
+
+    prof = get_profile_or_exit(profile_name)
+
+    # Use profile safety if config file didn't override
+    if not config_file:
+        config.safety = prof.safety
+
+    registry = target_registry()
+    _, target = registry.resolve_profile(prof)
+    session = Session()
+    click.echo(f"Starting AI-guided exploration (model={config.model}, max_steps={config.max_steps})...")
+    if config.goal:
+        click.echo(f"Goal: {config.goal}")
+
+    result = run_explore_test(target, config, session=session)
+
+    click.echo(f"Completed: {result.steps_run} steps")
+    if result.passed:
+        click.echo("PASSED — no failures detected")
+    else:
+        click.echo(f"FAILED — {len(result.failures)} failure(s)")
+        if result.failures:
+            click.echo("\n".join(
+                f"  - Step {f.get('step')}: {f.get('oracle', f.get('error', ''))}"
+                for f in result.failures
+            ))
+
+        ticket_dir = generate_ticket_from_explore(
+            session=session,
+            target=target,
+            failures=result.failures,
+            goal=config.goal,
+            profile_name=profile_name,
+        )
+        click.echo(f"Ticket generated: {ticket_dir}")
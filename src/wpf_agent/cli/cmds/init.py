@@ -0,0 +1,50 @@
+"""`wpf-agent init` — project initialization."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+def init():
+    """Initialize project: create .wpf-agent/ config and artifact directories."""
+    import pathlib
+
+    from wpf_agent.cli._common import persona_store, profile_store
+    from wpf_agent.constants import SESSION_DIR, TICKET_DIR
+
+    store = profile_store()
+    store.ensure_default()
+    click.echo(f"Created {store.path}")
+
+    personas = persona_store()
+    personas.ensure_default()
+    click.echo(f"Created {personas.path}")
+
+    for d in [SESSION_DIR, TICKET_DIR]:
+        pathlib.Path(d).mkdir(parents=True, exist_ok=True)
+        click.echo(f"Created {d}/")
+
+    _precompile_package()
+
+    click.echo("\nInitialization complete. Edit .wpf-agent/profiles.json to add your target apps.")
+    click.echo("Then register the MCP server and install skills:")
+    click.echo('  claude mcp add wpf-agent -- python -m wpf_agent mcp-serve')
+    click.echo('  wpf-agent install-skills')
+
+
+def _precompile_package() -> None:
+    """Byte-compile wpf_agent so later commands skip source compilation."""
+    import sys
+
+    if getattr(sys, "frozen", False):  # PyInstaller bundle: nothing to compile
+        return
+    import compileall
+    import pathlib
+
+    import wpf_agent
+
+    try:
+        compileall.compile_dir(pathlib.Path(wpf_agent.__file__).parent, quiet=2)
+    except OSError:
+        pass  # read-only install; modules compile on first import instead
@@ -0,0 +1,253 @@
+"""`wpf-agent install-skills` — bundled skill and CLAUDE.md installer."""
+
+from __future__ import annotations
+
+import functools
+import sys
+from typing import TYPE_CHECKING
+
+import click
+
+if TYPE_CHECKING:
+    import pathlib
+
+
+@click.command("install-skills")
+@click.option("--target", default=None, help="Target directory (default: current directory)")
+@click.option("--github", is_flag=True, default=False, help="Also install into .github/skills/ for GitHub Copilot Coding Agent")
+@click.option("--no-claude-md", is_flag=True, default=False, help="Skip updating CLAUDE.md")
+@click.option("-y", "--yes", is_flag=True, default=False, help="Skip confirmation prompt for CLAUDE.md update")
+def install_skills(target, github, no_claude_md, yes):
+    """Install Claude Code slash-command skills into .claude/skills/.
+
+    Copies bundled skill files (/wpf-setup, /wpf-ui, /wpf-test, /wpf-ticket)
+    so that Claude Code auto-detects them when launched from this directory.
+    Obsolete wpf-* skills not in the current bundle are automatically removed.
+
+    Also appends a wpf-agent guide section to CLAUDE.md (with confirmation).
+    Use --no-claude-md to skip the CLAUDE.md update.
+
+    With --github, also copies skills into .github/skills/ for GitHub
+    Copilot Coding Agent (repository-level).
+    """
+    import pathlib
+    import shutil
+
+    dest_root = pathlib.Path(target) if target else pathlib.Path.cwd()
+
+    # Locate bundled skills: try wheel-bundled _skills/ first,
+    # then fall back to .claude/skills/ in the source repo (editable install).
+    pkg_skills = _pkg_root() / "_skills"
+    if not pkg_skills.is_dir():
+        # editable install: package is at src/wpf_agent/, repo root is ../../
+        repo_root = _package_dir().parent.parent
+        pkg_skills = repo_root / ".claude" / "skills"
+
+    if not pkg_skills.is_dir():
+        click.echo("Bundled skills not found in package.", err=True)
+        sys.exit(1)
+
+    # Walk the bundle once; every destination gets the same files
+    bundled = _bundled_skills(pkg_skills)
+
+    # Build list of destination directories
+    dest_dirs = [dest_root / ".claude" / "skills"]
+    if github:
+        dest_dirs.append(dest_root / ".github" / "skills")
+
+    for dest_skills in dest_dirs:
+        installed = []
+        for skill_name, skill_md in bundled:
+            out_dir = dest_skills / skill_name
+            out_dir.mkdir(parents=True, exist_ok=True)
+
+            # Byte copy from package resource; no decode/encode round-trip
+            with skill_md.open("rb") as src, open(out_dir / "SKILL.md", "wb") as dst:
+                shutil.copyfileobj(src, dst, 64 * 1024)
+            installed.append(skill_name)
+
+        if installed:
+            click.echo(f"Installed {len(installed)} skills into {dest_skills}/:")
+            for name in installed:
+                click.echo(f"  /{name}")
+        else:
+            click.echo("No skills found to install.", err=True)
+            sys.exit(1)
+
+        # Clean up obsolete wpf- skills not in source
+        if dest_skills.is_dir():
+            bundled_names = set(installed)
+            removed = []
+            for existing in sorted(dest_skills.iterdir()):
+                if not existing.is_dir():
+                    continue
+                if existing.name.startswith("wpf-") and existing.name not in bundled_names:
+                    shutil.rmtree(existing)
+                    removed.append(existing.name)
+            if removed:
+                click.echo(f"Removed {len(removed)} obsolete skills:")
+                for name in removed:
+                    click.echo(f"  /{name}")
+
+    # ── Update CLAUDE.md with wpf-agent guide ──
+    if not no_claude_md:
+        _update_claude_md(dest_root, yes)
+
+
+def _bundled_skills(pkg_skills) -> list[tuple[str, object]]:
+    """Return ``(name, SKILL.md)`` pairs for each skill dir, sorted by name."""
+    import os
+    import pathlib
+
+    if isinstance(pkg_skills, pathlib.Path):
+        # Real directory: scandir reuses the dirent type, saving a stat per entry
+        with os.scandir(pkg_skills) as it:
+            found = [
+                (e.name, pathlib.Path(e.path, "SKILL.md"))
+                for e in it
+                if e.is_dir() and os.path.isfile(os.path.join(e.path, "SKILL.md"))
+            ]
+    else:
+        found = [
+            (d.name, d / "SKILL.md")
+            for d in pkg_skills.iterdir()
+            if d.is_dir() and (d / "SKILL.md").is_file()
+        ]
+    found.sort(key=lambda item: item[0])
+    return found
+
+
+@functools.lru_cache(maxsize=1)
+def _pkg_root():
+    """Return the ``importlib.resources`` root of the ``wpf_agent`` package."""
+    import importlib.resources
+
+    return importlib.resources.files("wpf_agent")
+
+
+def _package_dir() -> pathlib.Path:
+    """Return the source directory of the ``wpf_agent`` package."""
+    import pathlib
+
+    import wpf_agent
+
+    return pathlib.Path(wpf_agent.__file__).resolve().parent
+
+
+_MARKER_START = "<!-- wpf-agent:start -->"
+_MARKER_END = "<!-- wpf-agent:end -->"
+
+
+def _load_snippet() -> str:
+    """Load the CLAUDE.md snippet from package resources or source tree."""
+    # Try wheel-bundled file first
+    pkg_file = _pkg_root() / "_claude_md_snippet.md"
+    try:
+        return pkg_file.read_text(encoding="utf-8")
+    except (FileNotFoundError, TypeError):
+        pass
+
+    # Editable install: source tree
+    src_path = _package_dir() / "_claude_md_snippet.md"
+    if src_path.is_file():
+        return src_path.read_text(encoding="utf-8")
+
+    raise FileNotFoundError("wpf-agent CLAUDE.md snippet not found in package.")
+
+
+# CLAUDE.md files at least this large are edited in place via mmap
+_MMAP_THRESHOLD = 64 * 1024
+
+
+def _locate_section(claude_md: pathlib.Path) -> tuple[str, tuple[int, int]]:
+    """Return ``(action, (start, end))`` byte offsets for the wpf-agent section.
+
+    For ``update`` the span covers the markers and one trailing newline;
+    for ``append`` both offsets are the end of the content with trailing
+    newlines dropped.
+    """
+    import mmap
+
+    with open(claude_md, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        start = mm.find(_MARKER_START.encode())
+        end = mm.find(_MARKER_END.encode())
+        if start != -1 and end != -1:
+            end += len(_MARKER_END)
+            if mm[end:end + 2] == b"\r\n":
+                end += 2
+            elif mm[end:end + 1] == b"\n":
+                end += 1
+            return "update", (start, end)
+        cut = len(mm)
+        while cut and mm[cut - 1:cut] in (b"\n", b"\r"):
+            cut -= 1
+        return "append", (cut, cut)
+
+
+def _splice_section(claude_md: pathlib.Path, snippet: str, action: str, span: tuple[int, int]) -> None:
+    """Rewrite only the bytes from ``span[0]`` on, keeping the file's newline style."""
+    start, end = span
+    with open(claude_md, "r+b") as f:
+        head = f.read(64 * 1024)
+        nl = b"\r\n" if b"\r\n" in head else b"\n"
+        body = snippet.rstrip("\n").encode("utf-8").replace(b"\n", nl) + nl
+        if action == "append":
+            body, tail = nl + nl + body, b""
+        else:
+            f.seek(end)
+            tail = f.read()
+        f.seek(start)
+        f.write(body + tail)
+        f.truncate()
+
+
+def _update_claude_md(dest_root: pathlib.Path, skip_confirm: bool) -> None:
+    """Append or update the wpf-agent section in CLAUDE.md."""
+    snippet = _load_snippet()
+    claude_md = dest_root / "CLAUDE.md"
+    splice = None
+
+    if claude_md.is_file() and claude_md.stat().st_size >= _MMAP_THRESHOLD:
+        # Large file: find the markers without decoding it
+        action, splice = _locate_section(claude_md)
+    elif claude_md.is_file():
+        content = claude_md.read_text(encoding="utf-8")
+        start_idx = content.find(_MARKER_START)
+        end_idx = content.find(_MARKER_END)
+
+        if start_idx != -1 and end_idx != -1:
+            # Marker found — replace between markers (inclusive)
+            end_idx += len(_MARKER_END)
+            # Preserve trailing newline after end marker
+            if end_idx < len(content) and content[end_idx] == "\n":
+                end_idx += 1
+            new_content = content[:start_idx] + snippet.rstrip("\n") + "\n" + content[end_idx:]
+            action = "update"
+        else:
+            # No markers — append to end
+            new_content = content.rstrip("\n") + "\n\n" + snippet.rstrip("\n") + "\n"
+            action = "append"
+    else:
+        new_content = snippet.rstrip("\n") + "\n"
+        action = "create"
+
+    # Confirm with user before writing
+    if not skip_confirm:
+        action_msg = {
+            "create": f"Create {claude_md} with wpf-agent guide?",
+            "append": f"Append wpf-agent guide to {claude_md}?",
+            "update": f"Update wpf-agent guide in {claude_md}?",
+        }
+        if not (sys.stdin.isatty() and sys.stdout.isatty()):
+            # Non-interactive (no TTY) — accept by default
+            click.echo(f"(non-interactive) Auto-accepting: {action_msg[action]}")
+        elif not click.confirm(action_msg[action], default=True):
+            click.echo("Skipped CLAUDE.md update.")
+            return
+
+    if splice is not None:
+        _splice_section(claude_md, snippet, action, splice)
+    else:
+        claude_md.write_text(new_content, encoding="utf-8")
+    action_past = {"create": "Created", "append": "Appended to", "update": "Updated"}
+    click.echo(f"{action_past[action]} {claude_md} with wpf-agent guide.")
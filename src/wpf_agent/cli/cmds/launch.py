@@ -0,0 +1,17 @@
+"""`wpf-agent launch` — launch an application and connect."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+@click.option("--exe", required=True, help="Path to executable")
+@click.argument("args", nargs=-1)
+def launch(exe, args):
+    """Launch an application and connect."""
+    from wpf_agent.cli._common import target_registry
+
+    registry = target_registry()
+    tid, target = registry.resolve({"exe": exe, "args": list(args)})
+    click.echo(f"Launched: {target} (target_id={tid})")
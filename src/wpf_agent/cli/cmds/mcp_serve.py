@@ -0,0 +1,12 @@
+"""`wpf-agent mcp-serve` — MCP server entry."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command("mcp-serve")
+def mcp_serve():
+    """Start the MCP server (stdio transport for Claude Code)."""
+    from wpf_agent.mcp.server import run_server
+    run_server()
@@ -0,0 +1,60 @@
+"""`wpf-agent personas` — usability-test persona presets."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.group()
+def personas():
+    """Manage usability-test persona presets."""
+    pass
+
+
+@personas.command("list")
+def personas_list():
+    """List all persona presets."""
+    from wpf_agent.cli._common import persona_store
+    store = persona_store()
+    for p in store.list():
+        click.echo(f"  {p.name}: {p.description}")
+
+
+@personas.command("add")
+@click.option("--name", required=True, help="Persona preset name")
+@click.option("--description", required=True, help="Persona description text")
+def personas_add(name, description):
+    """Add a new persona preset."""
+    from wpf_agent.cli._common import persona_store
+    from wpf_agent.config import Persona
+    store = persona_store()
+    store.add(Persona(name=name, description=description))
+    click.echo(f"Added persona '{name}'")
+
+
+@personas.command("remove")
+@click.argument("name")
+def personas_remove(name):
+    """Remove a persona preset."""
+    from wpf_agent.cli._common import persona_store
+    store = persona_store()
+    if store.remove(name):
+        click.echo(f"Removed persona '{name}'")
+    else:
+        click.echo(f"Persona '{name}' not found", err=True)
+
+
+@personas.command("edit")
+@click.argument("name")
+@click.option("--description", required=True, help="New persona description text")
+def personas_edit(name, description):
+    """Edit an existing persona preset's description."""
+    from wpf_agent.cli._common import persona_store
+    store = persona_store()
+    persona = store.get(name)
+    if persona is None:
+        click.echo(f"Persona '{name}' not found", err=True)
+        return
+    persona.description = description
+    store.update(persona)
+    click.echo(f"Updated persona '{name}'")
@@ -0,0 +1,91 @@
+"""`wpf-agent profiles` — target app profile management."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent.cli._common import option_group
+
+
+@click.group()
+def profiles():
+    """Manage target app profiles."""
+    pass
+
+
+@profiles.command("list")
+def profiles_list():
+    """List all profiles."""
+    from wpf_agent.cli._common import profile_store
+    store = profile_store()
+    lines = []
+    for p in store.list():
+        lines.append(f"  {p.name}")
+        if p.match:
+            match = {k: v for k, v in vars(p.match).items() if v is not None}
+            lines.append(f"    match: {match}")
+        if p.launch:
+            lines.append(f"    launch: {p.launch.exe} {p.launch.args}")
+    if lines:
+        click.echo("\n".join(lines))
+
+
+# Match options shared by `add` and `edit`.
+_match_options = option_group(
+    click.option("--process", default=None, help="Process name (e.g. MyApp.exe)"),
+    click.option("--title-re", default=None, help="Window title regex"),
+    click.option("--pid", default=None, type=int, help="Process ID"),
+)
+
+
+@profiles.command("add")
+@click.option("--name", required=True, help="Profile name")
+@_match_options
+@click.option("--exe", default=None, help="EXE path for launch mode")
+@click.option("--match-exe", default=None, help="EXE path to match a running process")
+def profiles_add(name, process, title_re, exe, match_exe, pid):
+    """Add a new profile."""
+    from wpf_agent.cli._common import profile_store
+    from wpf_agent.config import Profile, ProfileLaunch, ProfileMatch
+
+    match = ProfileMatch(pid=pid, process=process, title_re=title_re, exe=match_exe)
+    launch = ProfileLaunch(exe=exe) if exe else None
+
+    profile = Profile(name=name, match=match, launch=launch)
+    store = profile_store()
+    store.add(profile)
+    click.echo(f"Added profile '{name}'")
+
+
+@profiles.command("remove")
+@click.argument("name")
+def profiles_remove(name):
+    """Remove a profile."""
+    from wpf_agent.cli._common import profile_store
+    store = profile_store()
+    if store.remove(name):
+        click.echo(f"Removed profile '{name}'")
+    else:
+        click.echo(f"Profile '{name}' not found", err=True)
+
+
+@profiles.command("edit")
+@click.argument("name")
+@_match_options
+@click.option("--exe", default=None, help="EXE path to match a running process")
+def profiles_edit(name, process, title_re, exe, pid):
+    """Edit an existing profile's match settings."""
+    from wpf_agent.cli._common import profile_store
+    from wpf_agent.config import ProfileMatch
+
+    store = profile_store()
+    profile = store.get(name)
+    if profile is None:
+        click.echo(f"Profile '{name}' not found", err=True)
+        return
+    changes = {"process": process, "title_re": title_re, "exe": exe, "pid": pid}
+    profile.match = (profile.match or ProfileMatch()).model_copy(
+        update={k: v for k, v in changes.items() if v is not None}
+    )
+    store.update(profile)
+    click.echo(f"Updated profile '{name}'")
@@ -0,0 +1,83 @@
+"""`wpf-agent random` — random exploratory test commands."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+@click.group("random")
+def random_cmd():
+    """Random (exploratory) test commands."""
+    pass
+
+
+@random_cmd.command("run")
+@click.option("--profile", default=None, help="Profile name")
+@click.option("--config", "config_file", default=None,
+              type=click.Path(exists=True, dir_okay=False), help="Path to random test config YAML")
+@click.option("--max-steps", default=None, type=int, help="Maximum exploration steps (overrides config)")
+@click.option("--seed", default=None, type=int, help="Random seed (overrides config)")
+def random_run(profile, config_file, max_steps, seed):
+    """Run random exploratory testing.
+
+    Configuration can be provided via --config YAML file, CLI options, or both.
+    CLI options override values from the config file.
+    """
+    import pathlib
+
+    from wpf_agent.cli._common import get_profile_or_exit, target_registry
+    from wpf_agent.core.session import Session
+    from wpf_agent.testing.random_tester import RandomConfig, run_random_test
+    from wpf_agent.tickets.generator import generate_ticket_from_random
+
+    # Load config from YAML or use defaults
+    if config_file:
+        config = RandomConfig.from_file(pathlib.Path(config_file))
+    else:
+        config = RandomConfig()
+
+    # CLI overrides
+    if max_steps is not None:
+        config.max_steps = max_steps
+    if seed is not None:
+        config.seed = seed
+
+    # Resolve profile: CLI > config file > error
+    profile_name = profile or config.profile
+    if not profile_name:
+        click.echo("Specify --profile or set profile in config YAML", err=True)
+        sys.exit(1)
+
+    prof = get_profile_or_exit(profile_name)
+
+    # Use profile safety if config file didn't override
+    if not config_file:
+        config.safety = prof.safety
+
+    registry = target_registry()
+    _, target = registry.resolve_profile(prof)
+    session = Session()
+    click.echo(f"Starting random test (seed will be logged)...")
+    result = run_random_test(target, config, session=session)
+
+    click.echo(f"Completed: {result.steps_run} steps, seed={result.seed}")
+    if result.passed:
+        click.echo("PASSED — no failures detected")
+    else:
+        click.echo(f"FAILED — {len(result.failures)} failure(s)")
+        if result.failures:
+            click.echo("\n".join(
+                f"  - Step {f.get('step')}: {f.get('oracle', f.get('error', ''))}"
+                for f in result.failures
+            ))
+
+        ticket_dir = generate_ticket_from_random(
+            session=session,
+            target=target,
+            seed=result.seed,
+            failures=result.failures,
+            profile_name=profile,
+        )
+        click.echo(f"Ticket generated: {ticket_dir}")
@@ -0,0 +1,44 @@
+"""`wpf-agent replay` — AI-free action replay."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+
+@click.command()
+@click.option("--file", "file_path", required=True,
+              type=click.Path(exists=True, dir_okay=False), help="Path to actions JSON")
+@click.option("--profile", default=None, help="Profile name")
+@click.option("--pid", default=None, type=int, help="Target PID")
+@click.option("--title-re", default=None, help="Window title regex")
+def replay(file_path, profile, pid, title_re):
+    """Replay a recorded action sequence (AI-free)."""
+    import pathlib
+
+    from wpf_agent.cli._common import get_profile_or_exit, target_registry
+    from wpf_agent.core.session import Session
+    from wpf_agent.runner.replay import load_actions, replay_actions
+
+    registry = target_registry()
+    if profile:
+        prof = get_profile_or_exit(profile)
+        _, target = registry.resolve_profile(prof)
+    elif pid:
+        _, target = registry.resolve({"pid": pid})
+    elif title_re:
+        _, target = registry.resolve({"title_re": title_re})
+    else:
+        click.echo("Specify --profile, --pid, or --title-re", err=True)
+        sys.exit(1)
+
+    actions = load_actions(pathlib.Path(file_path))
+    session = Session()
+    click.echo(f"Replaying {len(actions)} actions...")
+    results = replay_actions(actions, target, session=session)
+
+    errors = [r for r in results if "error" in r]
+    click.echo(f"Done: {len(results)} steps, {len(errors)} errors")
+    if errors:
+        click.echo("\n".join(f"  - Step {e['step']}: {e['error']}" for e in errors))
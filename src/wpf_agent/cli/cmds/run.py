@@ -0,0 +1,24 @@
+"""`wpf-agent run` — interactive agent run with a profile."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.command()
+@click.option("--profile", required=True, help="Profile name from .wpf-agent/profiles.json")
+def run(profile):
+    """Run the agent loop with a profile (interactive mode)."""
+    from wpf_agent.cli._common import get_profile_or_exit, target_registry
+    from wpf_agent.core.session import Session
+
+    prof = get_profile_or_exit(profile)
+
+    registry = target_registry()
+    tid, target = registry.resolve_profile(prof)
+    click.echo(f"Resolved: {target} (target_id={tid})")
+
+    session = Session()
+    session.start()
+    click.echo(f"Session: {session.session_id}")
+    click.echo("Target is connected. Use MCP tools via Claude Code or run scenarios.")
@@ -0,0 +1,48 @@
+"""`wpf-agent scenario` — scenario test commands."""
+
+from __future__ import annotations
+
+import click
+
+
+@click.group()
+def scenario():
+    """Scenario test commands."""
+    pass
+
+
+@scenario.command("run")
+@click.option("--file", "file_path", required=True,
+              type=click.Path(exists=True, dir_okay=False), help="Path to scenario YAML")
+@click.option("--profile", default=None, help="Override profile name")
+def scenario_run(file_path, profile):
+    """Run a scenario test from a YAML file."""
+    import pathlib
+
+    from wpf_agent.core.session import Session
+    from wpf_agent.testing.scenario import Scenario, run_scenario
+    from wpf_agent.tickets.generator import generate_ticket_from_scenario
+
+    scenario_obj = Scenario.from_file(pathlib.Path(file_path))
+    if profile:
+        scenario_obj.profile = profile
+
+    session = Session()
+    click.echo(f"Running scenario '{scenario_obj.id}'...")
+    result = run_scenario(scenario_obj, session=session)
+
+    if result.passed:
+        click.echo(f"PASSED ({result.steps_run} steps)")
+    else:
+        click.echo(f"FAILED at step {result.steps_run}")
+        if result.failures:
+            click.echo("\n".join(f"  - {f}" for f in result.failures))
+
+        ticket_dir = generate_ticket_from_scenario(
+            session=session,
+            target=None,
+            scenario_id=scenario_obj.id,
+            failures=result.failures,
+            profile_name=profile or scenario_obj.profile,
+        )
+        click.echo(f"Ticket generated: {ticket_dir}")
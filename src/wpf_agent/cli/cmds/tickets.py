@@ -0,0 +1,310 @@
+"""`wpf-agent tickets` — ticket management commands."""
+
+from __future__ import annotations
+
+import os
+import sys
+
+import click
+
+from wpf_agent import _jsonio
+
+
+@click.group()
+def tickets():
+    """Ticket management commands."""
+    pass
+
+
+def _iter_tickets(base: str, name: str = "ticket.md", depth: int = 2):
+    """Yield ``(path, mtime)`` for each *name* file at most *depth* levels below *base*.
+
+    Tickets live at ``<base>/<ticket>/`` (``tickets create``) or
+    ``<base>/<session|fix|wontfix>/<ticket>/``, so a bounded scandir walk
+    finds them all without rglob's per-entry pattern matching.
+    """
+    try:
+        entries = os.scandir(base)
+    except OSError:
+        return
+    with entries:
+        for entry in entries:
+            if not entry.is_dir():
+                continue
+            try:
+                st = os.stat(os.path.join(entry.path, name))
+            except OSError:
+                st = None
+            if st is not None:
+                yield os.path.join(entry.path, name), st.st_mtime
+            elif depth > 1:
+                yield from _iter_tickets(entry.path, name, depth - 1)
+
+
+def _newest_ticket(base, session_id: str | None = None):
+    """Most recent ticket.md, optionally limited to one session.
+
+    Reads the ticket manifest from the end; falls back to walking the
+    tree when there is no manifest or it has no matching entry (tickets
+    created before the manifest existed).
+    """
+    import pathlib
+
+    from wpf_agent.tickets import index
+
+    if os.path.isfile(os.path.join(base, index.INDEX_NAME)):
+        for entry in index.iter_entries_reversed(base):
+            if session_id is not None and entry.get("session") != session_id:
+                continue
+            md = index.locate(base, entry)
+            if md is not None:
+                return md
+
+    if session_id is None:
+        found = _iter_tickets(base)
+    else:
+        found = _iter_tickets(os.path.join(base, session_id), depth=1)
+    newest = max(found, key=lambda t: t[1], default=None)
+    return pathlib.Path(newest[0]) if newest else None
+
+
+@tickets.command("open")
+@click.option("--last", is_flag=True, help="Open the most recent ticket")
+@click.option("--session", "session_id", default=None, help="Session ID")
+def tickets_open(last, session_id):
+    """Open a generated ticket."""
+    from wpf_agent.constants import TICKET_DIR
+
+    ticket_base = TICKET_DIR
+    if not os.path.isdir(ticket_base):
+        click.echo("No tickets found", err=True)
+        return
+
+    if last:
+        ticket_path = _newest_ticket(ticket_base)
+        if ticket_path is None:
+            click.echo("No tickets found", err=True)
+            return
+    elif session_id:
+        ticket_path = _newest_ticket(ticket_base, session_id)
+        if ticket_path is None:
+            click.echo(f"No tickets found for session {session_id}", err=True)
+            return
+    else:
+        # List all tickets as they are found
+        for md, _ in _iter_tickets(ticket_base):
+            click.echo(f"  {os.path.basename(os.path.dirname(md))}: {md}")
+        return
+
+    click.echo(ticket_path.read_text(encoding="utf-8"))
+
+
+@tickets.command("create")
+@click.option("--title", required=True, help="Ticket title")
+@click.option("--summary", required=True, help="Summary (1-2 sentences)")
+@click.option("--actual", "--actual-result", required=True, help="Actual result")
+@click.option("--expected", "--expected-result", required=True, help="Expected result")
+@click.option("--repro", "--repro-steps", multiple=True, help="Repro step (repeat for multiple)")
+@click.option("--evidence", multiple=True, help="Evidence file path (repeat for multiple)")
+@click.option("--hypothesis", "--root-cause", default="", help="Root cause hypothesis")
+@click.option("--pid", default=None, type=int, help="Target PID (added to environment)")
+@click.option("--process", default=None, help="Target process name (added to environment)")
+@click.option("--profile", default=None, help="Profile name (added to environment)")
+def tickets_create(title, summary, actual, expected, repro, evidence, hypothesis, pid, process, profile):
+    """Create a ticket directory with ticket.md and ticket.json."""
+    import pathlib
+
+    from wpf_agent.constants import TICKET_DIR
+    from wpf_agent.tickets._copy import copy_into, write_files
+    from wpf_agent.tickets._stamp import dir_stamp, make_ticket_dir
+    from wpf_agent.tickets.index import record_ticket
+    from wpf_agent.tickets.templates import default_environment, render_ticket_md
+
+    timestamp = dir_stamp()
+    ticket_dir = make_ticket_dir(pathlib.Path(TICKET_DIR), f"TICKET-{timestamp}")
+
+    env = default_environment()
+    if pid:
+        env["Target PID"] = str(pid)
+    if process:
+        env["Target Process"] = process
+    if profile:
+        env["Profile"] = profile
+
+    repro_steps = list(repro) if repro else []
+    evidence_files = list(evidence) if evidence else []
+
+    # Copy evidence files into ticket dir, listed relative to it
+    packaged_evidence = [
+        f"screens/{name}" for name in copy_into(evidence_files, ticket_dir / "screens")
+    ]
+
+    md = render_ticket_md(
+        title=title,
+        summary=summary,
+        repro_steps=repro_steps,
+        actual_result=actual,
+        expected_result=expected,
+        environment=env,
+        evidence_files=packaged_evidence,
+        root_cause_hypothesis=hypothesis,
+    )
+    ticket_data = {
+        "title": title,
+        "summary": summary,
+        "repro_steps": repro_steps,
+        "actual_result": actual,
+        "expected_result": expected,
+        "environment": env,
+        "evidence_files": packaged_evidence,
+        "root_cause_hypothesis": hypothesis,
+        "timestamp": timestamp,
+    }
+    write_files({
+        # write_text's newline translation, kept for ticket.md on Windows
+        ticket_dir / "ticket.md": md.replace("\n", os.linesep).encode("utf-8"),
+        ticket_dir / "ticket.json": _jsonio.dumps_pretty(ticket_data, default=str),
+    })
+    record_ticket(TICKET_DIR, ticket_dir)
+
+    result = {
+        "ticket_dir": str(ticket_dir),
+        "ticket_md": str(ticket_dir / "ticket.md"),
+        "ticket_json": str(ticket_dir / "ticket.json"),
+    }
+    click.echo(_jsonio.dumps(result, indent=True))
+
+
+def _untriaged_ticket_jsons(base) -> list[str]:
+    """Sorted ticket.json paths under *base*, not descending into fix/ or wontfix/."""
+    base = str(base)
+    found = []
+    for dirpath, dirnames, filenames in os.walk(base):
+        if dirpath == base:
+            dirnames[:] = [d for d in dirnames if d not in ("fix", "wontfix")]
+        if "ticket.json" in filenames:
+            found.append(os.path.join(dirpath, "ticket.json"))
+    found.sort(key=lambda p: p.split(os.sep))
+    return found
+
+
+def _load_pending(ticket_json: str) -> dict | None:
+    """Summary of an untriaged ticket.json, or None if triaged/unreadable."""
+    try:
+        with open(ticket_json, "rb") as f:
+            raw = f.read()
+    except OSError:
+        return None
+
+    # Skip tickets that already have a triage decision in their JSON.
+    # Quotes inside string values are escaped, so these byte markers only
+    # occur as keys and a triaged ticket is rejected without decoding it.
+    if b'"triage"' in raw and b'"decision"' in raw:
+        return None
+    try:
+        data = _jsonio.loads(raw)
+    except ValueError:
+        return None
+    if not isinstance(data, dict) or data.get("triage"):
+        return None
+
+    return {
+        "path": os.path.dirname(ticket_json),
+        "title": data.get("title", ""),
+        "summary": data.get("summary", ""),
+        "timestamp": data.get("timestamp", ""),
+    }
+
+
+@tickets.command("list-pending")
+def tickets_list_pending():
+    """List untriaged tickets (not yet in fix/ or wontfix/)."""
+    from wpf_agent.constants import TICKET_DIR
+
+    ticket_base = TICKET_DIR
+    if not os.path.isdir(ticket_base):
+        click.echo("[]")
+        return
+
+    paths = _untriaged_ticket_jsons(ticket_base)
+    if len(paths) > 1:
+        from concurrent.futures import ThreadPoolExecutor
+
+        workers = min(32, (os.cpu_count() or 4) * 4, len(paths))
+        with ThreadPoolExecutor(max_workers=workers) as ex:
+            loaded = list(ex.map(_load_pending, paths))
+    else:
+        loaded = [_load_pending(p) for p in paths]
+    pending = [entry for entry in loaded if entry is not None]
+
+    click.echo(_jsonio.dumps(pending, indent=True))
+
+
+_DECISIONS = frozenset(("fix", "wontfix"))
+
+
+def _check_decision(ctx, param, value):
+    """Lower-case --decision once and check it against _DECISIONS."""
+    decision = value.lower()
+    if decision not in _DECISIONS:
+        raise click.BadParameter(f"{value!r} is not one of 'fix', 'wontfix'.")
+    return decision
+
+
+@tickets.command("triage")
+@click.option("--ticket", required=True, help="Path to ticket directory")
+@click.option(
+    "--decision",
+    required=True,
+    metavar="[fix|wontfix]",
+    callback=_check_decision,
+    help="Triage decision",
+)
+@click.option("--reason", default="", help="Reason for the decision")
+def tickets_triage(ticket, decision, reason):
+    """Triage a ticket: add decision and move to fix/ or wontfix/."""
+    import pathlib
+    import shutil
+
+    from wpf_agent.constants import TICKET_DIR
+    from wpf_agent.tickets._stamp import iso_stamp
+
+    ticket_dir = pathlib.Path(ticket)
+    ticket_json_path = ticket_dir / "ticket.json"
+
+    if not ticket_json_path.exists():
+        click.echo(f"ticket.json not found in {ticket_dir}", err=True)
+        sys.exit(1)
+
+    # Update ticket.json with triage info
+    try:
+        data = _jsonio.loads(ticket_json_path.read_bytes())
+    except (ValueError, OSError) as exc:
+        click.echo(f"Failed to read ticket.json: {exc}", err=True)
+        sys.exit(1)
+
+    data["triage"] = {
+        "decision": decision,
+        "reason": reason,
+        "timestamp": iso_stamp(),
+    }
+    ticket_json_path.write_bytes(_jsonio.dumps_pretty(data, default=str))
+
+    # Move ticket directory to fix/ or wontfix/
+    dest_parent = pathlib.Path(TICKET_DIR) / decision
+    dest_parent.mkdir(parents=True, exist_ok=True)
+    dest = dest_parent / ticket_dir.name
+
+    try:
+        shutil.move(str(ticket_dir), str(dest))
+    except (OSError, shutil.Error) as exc:
+        click.echo(f"Failed to move ticket: {exc}", err=True)
+        sys.exit(1)
+
+    result = {
+        "ticket": ticket_dir.name,
+        "decision": decision,
+        "reason": reason,
+        "moved_to": str(dest),
+    }
+    click.echo(_jsonio.dumps(result, indent=True))
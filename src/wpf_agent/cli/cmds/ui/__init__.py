@@ -0,0 +1,60 @@
+"""`wpf-agent ui` — direct UI operations.
+
+Subcommands live in sibling modules grouped by kind and are imported
+only when invoked, like the top-level commands.
+"""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent.cli import LazyGroup
+
+_UI_COMMANDS = {
+    "alive": "wpf_agent.cli.cmds.ui.process:ui_alive",
+    "click": "wpf_agent.cli.cmds.ui.actions:ui_click",
+    "close": "wpf_agent.cli.cmds.ui.process:ui_close",
+    "controls": "wpf_agent.cli.cmds.ui.query:ui_controls",
+    "drag": "wpf_agent.cli.cmds.ui.actions:ui_drag",
+    "focus": "wpf_agent.cli.cmds.ui.actions:ui_focus",
+    "init-session": "wpf_agent.cli.cmds.ui.session:ui_init_session",
+    "read": "wpf_agent.cli.cmds.ui.query:ui_read",
+    "resume": "wpf_agent.cli.cmds.ui.guard:ui_resume",
+    "screenshot": "wpf_agent.cli.cmds.ui.query:ui_screenshot",
+    "select-combo": "wpf_agent.cli.cmds.ui.actions:ui_select_combo",
+    "send-keys": "wpf_agent.cli.cmds.ui.actions:ui_send_keys",
+    "state": "wpf_agent.cli.cmds.ui.query:ui_state",
+    "status": "wpf_agent.cli.cmds.ui.guard:ui_status",
+    "toggle": "wpf_agent.cli.cmds.ui.actions:ui_toggle",
+    "type": "wpf_agent.cli.cmds.ui.actions:ui_type",
+    "windows": "wpf_agent.cli.cmds.ui.query:ui_windows",
+}
+
+_UI_HELP = {
+    "alive": "Check if a process is running (by PID or process name).",
+    "click": "Click a UI element.",
+    "close": "Gracefully close a process launched by wpf-agent.",
+    "controls": "List UI controls as JSON (or brief table with --brief).",
+    "drag": "Drag from one UI element to another.",
+    "focus": "Focus the target window.",
+    "init-session": "Create a timestamped session workspace under artifacts/sessions/.",
+    "read": "Read text from a UI element.",
+    "resume": "Clear the pause state so UI commands can run again.",
+    "screenshot": "Capture a screenshot of the target window.",
+    "select-combo": "Select an item from a ComboBox.",
+    "send-keys": "Send keyboard keys (shortcuts, special keys) to target window or element.",
+    "state": "Get state of a UI element (enabled, visible, value, etc.).",
+    "status": "Show current guard state (active or paused).",
+    "toggle": "Toggle a checkbox or toggle button.",
+    "type": "Type text into a UI element.",
+    "windows": "List visible top-level windows (PID, title, handle).",
+}
+
+
+@click.group("ui", cls=LazyGroup, lazy_subcommands=_UI_COMMANDS, lazy_help=_UI_HELP)
+@click.option("--no-guard", is_flag=True, default=False, help="Skip mouse-movement guard check")
+@click.pass_context
+def ui_cmd(ctx, no_guard):
+    """Direct UI operations (for Claude Code to drive the UI loop)."""
+    ctx.ensure_object(dict)
+    ctx.obj["no_guard"] = no_guard
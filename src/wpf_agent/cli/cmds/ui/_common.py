@@ -0,0 +1,100 @@
+"""Helpers shared by the `wpf-agent ui` subcommand modules."""
+
+from __future__ import annotations
+
+import functools
+import sys
+
+import click
+
+from wpf_agent import _jsonio
+from wpf_agent.cli._common import option_group
+
+
+# Options shared by most ui subcommands.
+target_options = option_group(
+    click.option("--pid", default=None, type=int, help="Target process ID"),
+    click.option("--title-re", default=None, help="Window title regex"),
+)
+selector_options = option_group(
+    click.option("--aid", default=None, help="Automation ID"),
+    click.option("--name", default=None, help="Element name"),
+    click.option("--control-type", default=None, help="Control type"),
+)
+
+
+@functools.cache
+def uia_engine():
+    """Return the UIAEngine class, importing pywinauto on first use."""
+    from wpf_agent.uia.engine import UIAEngine
+
+    return UIAEngine
+
+
+def resolve_ui_target(pid, title_re):
+    """Resolve a target from --pid or --title-re CLI options."""
+    from wpf_agent.cli._common import target_registry
+
+    if not pid and not title_re:
+        click.echo("Specify --pid or --title-re", err=True)
+        sys.exit(1)
+
+    registry = target_registry()
+    spec = {}
+    if pid:
+        spec["pid"] = pid
+    elif title_re:
+        from wpf_agent.core.target import compile_title_re
+
+        spec["title_re"] = compile_title_re(title_re)
+    _, target = registry.resolve(spec)
+    return target
+
+
+@functools.lru_cache(maxsize=512)
+def _cached_selector(aid, name, control_type):
+    from wpf_agent.uia.selector import Selector
+
+    return Selector(automation_id=aid, name=name, control_type=control_type)
+
+
+def build_selector(aid, name, control_type):
+    """Build a Selector from --aid, --name, --control-type CLI options.
+
+    Selectors are never mutated after construction, so identical option
+    tuples share one cached instance.
+    """
+    if not aid and not name and not control_type:
+        click.echo("Specify at least --aid, --name, or --control-type", err=True)
+        sys.exit(1)
+
+    return _cached_selector(aid, name, control_type)
+
+
+@functools.cache
+def _guard_api():
+    """Return ``(check_guard, UserInterruptError)``, importing ui_guard on first use."""
+    from wpf_agent.core.errors import UserInterruptError
+    from wpf_agent.ui_guard import check_guard
+
+    return check_guard, UserInterruptError
+
+
+def run_guard(ctx, command_name: str) -> None:
+    """Run guard check; on interrupt, print JSON and exit with code 2."""
+    if ctx.obj.get("no_guard"):
+        return
+    check_guard, UserInterruptError = _guard_api()
+
+    try:
+        check_guard(command_name)
+    except UserInterruptError as exc:
+        result = {
+            "interrupted": True,
+            "reason": exc.reason,
+            "detail": exc.detail,
+            "command": command_name,
+            "action": "Run 'wpf-agent ui resume' to continue.",
+        }
+        click.echo(_jsonio.dumps(result))
+        sys.exit(2)
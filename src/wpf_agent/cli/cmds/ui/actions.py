@@ -0,0 +1,134 @@
+"""`wpf-agent ui` input actions: focus, click, drag, type, toggle, select-combo, send-keys."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent import _jsonio
+from wpf_agent.cli.cmds.ui._common import (
+    build_selector,
+    resolve_ui_target,
+    run_guard,
+    selector_options,
+    target_options,
+    uia_engine,
+)
+
+
+@click.command("focus")
+@target_options
+@click.pass_context
+def ui_focus(ctx, pid, title_re):
+    """Focus the target window."""
+    run_guard(ctx, "focus")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    result = UIAEngine.focus_window(target)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("click")
+@target_options
+@selector_options
+@click.option("--double", is_flag=True, default=False, help="Double-click instead of single click")
+@click.option("--method", type=click.Choice(["mouse", "invoke", "keys"]), default="mouse", help="Click method: mouse (default), invoke (UIA InvokePattern), keys (focus + SPACE)")
+@click.pass_context
+def ui_click(ctx, pid, title_re, aid, name, control_type, double, method):
+    """Click a UI element."""
+    run_guard(ctx, "click")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.click(target, selector, double=double, method=method)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("drag")
+@target_options
+@click.option("--aid", default=None, help="Source element automation ID")
+@click.option("--name", default=None, help="Source element name")
+@click.option("--control-type", default=None, help="Source element control type")
+@click.option("--dst-aid", default=None, help="Destination element automation ID")
+@click.option("--dst-name", default=None, help="Destination element name")
+@click.option("--dst-control-type", default=None, help="Destination element control type")
+@click.pass_context
+def ui_drag(ctx, pid, title_re, aid, name, control_type, dst_aid, dst_name, dst_control_type):
+    """Drag from one UI element to another."""
+    run_guard(ctx, "drag")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    src_selector = build_selector(aid, name, control_type)
+    dst_selector = build_selector(dst_aid, dst_name, dst_control_type)
+    result = UIAEngine.drag(target, src_selector, dst_selector)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("type")
+@target_options
+@selector_options
+@click.option("--text", required=True, help="Text to type")
+@click.option("--clear/--no-clear", default=True, help="Clear field before typing")
+@click.option("--method", default="keyboard", type=click.Choice(["keyboard", "value_pattern"]), help="Input method: keyboard (fires WPF bindings) or value_pattern (fast, may skip bindings)")
+@click.pass_context
+def ui_type(ctx, pid, title_re, aid, name, control_type, text, clear, method):
+    """Type text into a UI element."""
+    run_guard(ctx, "type")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.type_text(target, selector, text, clear=clear, method=method)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("toggle")
+@target_options
+@selector_options
+@click.option("--state", default=None, type=bool, help="Target state (true/false)")
+@click.pass_context
+def ui_toggle(ctx, pid, title_re, aid, name, control_type, state):
+    """Toggle a checkbox or toggle button."""
+    run_guard(ctx, "toggle")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.toggle(target, selector, state=state)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("select-combo")
+@target_options
+@selector_options
+@click.option("--item", required=True, help="Item text to select")
+@click.pass_context
+def ui_select_combo(ctx, pid, title_re, aid, name, control_type, item):
+    """Select an item from a ComboBox."""
+    run_guard(ctx, "select-combo")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.select_combo(target, selector, item)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("send-keys")
+@target_options
+@click.option("--aid", default=None, help="Automation ID (optional, to focus element first)")
+@click.option("--name", default=None, help="Element name (optional)")
+@click.option("--control-type", default=None, help="Control type (optional)")
+@click.option("--keys", required=True, help='Keys in pywinauto notation, e.g. "{ENTER}", "^a"')
+@click.pass_context
+def ui_send_keys(ctx, pid, title_re, aid, name, control_type, keys):
+    """Send keyboard keys (shortcuts, special keys) to target window or element."""
+    run_guard(ctx, "send-keys")
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type) if (aid or name or control_type) else None
+    result = UIAEngine.send_keys(target, keys, selector=selector)
+    click.echo(_jsonio.dumps(result))
@@ -0,0 +1,31 @@
+"""`wpf-agent ui` guard state: resume, status."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent import _jsonio
+
+
+@click.command("resume")
+def ui_resume():
+    """Clear the pause state so UI commands can run again."""
+    from wpf_agent.ui_guard import clear_pause, get_pause_info
+
+    info = get_pause_info()
+    existed = clear_pause()
+    result = {"resumed": existed, "previous_pause": info}
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("status")
+def ui_status():
+    """Show current guard state (active or paused)."""
+    from wpf_agent.ui_guard import get_pause_info, is_paused
+
+    if is_paused():
+        info = get_pause_info() or {}
+        result = {"state": "paused", **info}
+    else:
+        result = {"state": "active"}
+    click.echo(_jsonio.dumps(result))
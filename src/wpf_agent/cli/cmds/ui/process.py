@@ -0,0 +1,63 @@
+"""`wpf-agent ui` process helpers: alive, close."""
+
+from __future__ import annotations
+
+import sys
+
+import click
+
+from wpf_agent import _jsonio
+from wpf_agent.cli._common import do_close
+
+
+@click.command("alive")
+@click.option("--pid", default=None, type=int, help="Process ID to check")
+@click.option("--process", default=None, help="Process name to find (e.g. MyApp or MyApp.exe)")
+@click.option("--brief", is_flag=True, default=False, help="Output PID(s) only, one per line")
+def ui_alive(pid, process, brief):
+    """Check if a process is running (by PID or process name).
+
+    With --brief, outputs only PID number(s) for easy scripting.
+    """
+    if not pid and not process:
+        click.echo("Specify --pid or --process", err=True)
+        sys.exit(1)
+
+    if process:
+        # Search by process name
+        from wpf_agent._winproc import find_processes
+
+        name = process if process.lower().endswith(".exe") else process + ".exe"
+        matches = find_processes(name)
+
+        if brief:
+            for m in matches:
+                click.echo(m["pid"])
+        else:
+            result = {"process": name, "alive": len(matches) > 0, "matches": matches}
+            click.echo(_jsonio.dumps(result))
+    else:
+        # Check by PID
+        from wpf_agent._winproc import pid_alive
+
+        alive = pid_alive(pid)
+
+        if brief:
+            if alive:
+                click.echo(pid)
+        else:
+            result = {"pid": pid, "alive": alive}
+            click.echo(_jsonio.dumps(result))
+
+
+@click.command("close")
+@click.option("--pid", required=True, type=int, help="PID of the process to close")
+@click.option("--force", is_flag=True, default=False, help="Skip launched-pid check (still uses WM_CLOSE, no force-kill)")
+def ui_close(pid, force):
+    """Gracefully close a process launched by wpf-agent.
+
+    Processes started via `wpf-agent launch` or `wpf-agent verify --no-close`
+    can be closed.  Sends WM_CLOSE to the main window (does not force-kill).
+    Use --force to close processes not launched by wpf-agent (e.g. IDE-launched).
+    """
+    do_close(pid, force=force)
@@ -0,0 +1,152 @@
+"""`wpf-agent ui` read-only queries: screenshot, controls, read, state, windows."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent import _jsonio
+from wpf_agent.cli.cmds.ui._common import (
+    build_selector,
+    resolve_ui_target,
+    selector_options,
+    target_options,
+    uia_engine,
+)
+
+
+@click.command("screenshot")
+@target_options
+@click.option("--save", "save_path", default=None, help="Save path for screenshot PNG")
+def ui_screenshot(pid, title_re, save_path):
+    """Capture a screenshot of the target window."""
+    import pathlib
+
+    from wpf_agent.uia.screenshot import capture_screenshot
+
+    target = resolve_ui_target(pid, title_re)
+    dest = pathlib.Path(save_path) if save_path else None
+    result_path = capture_screenshot(target=target, save_path=dest)
+    click.echo(str(result_path))
+
+
+_CONTROL_ROW = "{:20s} aid={:25s} name={:35s} rect=({},{},{},{})\n".format
+_WINDOW_ROW = "pid={:<8d} handle={:<10d} title={}\n".format
+
+
+@click.command("controls")
+@target_options
+@click.option("--depth", default=4, type=int, help="Traversal depth")
+@click.option("--type-filter", default=None, help="Filter by control_type (comma-separated, e.g. Button,Edit,ComboBox)")
+@click.option("--name-filter", default=None, help="Filter by name (comma-separated OR, substring match, case-insensitive)")
+@click.option("--aid-filter", default=None, help="Filter by automation_id (comma-separated OR, substring match, case-insensitive)")
+@click.option("--search", default=None, help="Search name, automation_id, and value (comma-separated OR, substring match, case-insensitive)")
+@click.option("--has-name", is_flag=True, default=False, help="Only show controls with non-empty name")
+@click.option("--has-aid", is_flag=True, default=False, help="Only show controls with non-empty automation_id")
+@click.option("--brief", is_flag=True, default=False, help="Compact table output instead of JSON")
+@click.option("--pretty", is_flag=True, default=False, help="Indent JSON output (compact by default)")
+def ui_controls(pid, title_re, depth, type_filter, name_filter, aid_filter, search, has_name, has_aid, brief, pretty):
+    """List UI controls as JSON (or brief table with --brief)."""
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    controls = UIAEngine.list_controls(target, depth=depth, search=search or None)
+
+    # Apply all filters in one pass
+    keep = _control_filter(type_filter, name_filter, aid_filter, has_name, has_aid)
+    if keep is not None:
+        controls = [c for c in controls if keep(c)]
+
+    if brief:
+        lines = []
+        for c in controls:
+            r = c.get("rect") or {}
+            lines.append(_CONTROL_ROW(
+                c.get("control_type") or "", c.get("automation_id") or "", c.get("name") or "",
+                r.get("left", 0), r.get("top", 0), r.get("right", 0), r.get("bottom", 0),
+            ))
+        click.echo("".join(lines), nl=False)
+    else:
+        _write_json(controls, pretty)
+
+
+def _write_json(obj, pretty: bool) -> None:
+    """Stream *obj* as JSON to stdout (large trees skip the str round-trip)."""
+    out = click.get_binary_stream("stdout")
+    _jsonio.dump(obj, out, indent=pretty)
+    out.write(b"\n")
+    out.flush()
+
+
+def _terms(csv: str | None) -> list[str]:
+    return [t.strip().casefold() for t in (csv or "").split(",") if t.strip()]
+
+
+def _control_filter(type_filter, name_filter, aid_filter, has_name, has_aid):
+    """Build one predicate for the ``ui controls`` filters, or None if unfiltered."""
+    allowed_types = {t.strip() for t in type_filter.split(",")} if type_filter else None
+    name_terms = _terms(name_filter) if name_filter else None
+    aid_terms = _terms(aid_filter) if aid_filter else None
+    if allowed_types is None and name_terms is None and aid_terms is None and not (has_name or has_aid):
+        return None
+
+    def keep(c: dict) -> bool:
+        if allowed_types is not None and c.get("control_type", "") not in allowed_types:
+            return False
+        name = c.get("name") or ""
+        aid = c.get("automation_id") or ""
+        if has_name and not name.strip():
+            return False
+        if has_aid and not aid.strip():
+            return False
+        if name_terms is not None:
+            lowered = name.casefold()
+            if not any(t in lowered for t in name_terms):
+                return False
+        if aid_terms is not None:
+            lowered = aid.casefold()
+            if not any(t in lowered for t in aid_terms):
+                return False
+        return True
+
+    return keep
+
+
+@click.command("read")
+@target_options
+@selector_options
+def ui_read(pid, title_re, aid, name, control_type):
+    """Read text from a UI element."""
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.read_text(target, selector)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("state")
+@target_options
+@selector_options
+def ui_state(pid, title_re, aid, name, control_type):
+    """Get state of a UI element (enabled, visible, value, etc.)."""
+    UIAEngine = uia_engine()
+
+    target = resolve_ui_target(pid, title_re)
+    selector = build_selector(aid, name, control_type)
+    result = UIAEngine.get_state(target, selector)
+    click.echo(_jsonio.dumps(result))
+
+
+@click.command("windows")
+@click.option("--brief", is_flag=True, default=False, help="Compact table output instead of JSON")
+@click.option("--pretty", is_flag=True, default=False, help="Indent JSON output (compact by default)")
+def ui_windows(brief, pretty):
+    """List visible top-level windows (PID, title, handle)."""
+    UIAEngine = uia_engine()
+
+    windows = UIAEngine.list_windows(visible_only=True)
+
+    if brief:
+        click.echo("".join(_WINDOW_ROW(w["pid"], w["handle"], w["title"]) for w in windows), nl=False)
+    else:
+        _write_json(windows, pretty)
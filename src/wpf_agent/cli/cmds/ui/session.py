@@ -0,0 +1,27 @@
+"""`wpf-agent ui init-session` — session workspace creation."""
+
+from __future__ import annotations
+
+import click
+
+from wpf_agent import _jsonio
+
+
+@click.command("init-session")
+@click.option("--prefix", default="session", help="Session directory prefix (e.g. usability, explore)")
+def ui_init_session(prefix):
+    """Create a timestamped session workspace under artifacts/sessions/.
+
+    Returns the created directory path as JSON.
+    Example: wpf-agent ui init-session --prefix usability
+    → artifacts/sessions/usability_20260301_153045/
+    """
+    import os
+    import time
+
+    from wpf_agent.constants import SESSION_DIR
+
+    timestamp = time.strftime("%Y%m%d_%H%M%S")
+    session_dir = os.path.join(SESSION_DIR, f"{prefix}_{timestamp}")
+    os.makedirs(session_dir, exist_ok=True)
+    click.echo(_jsonio.dumps({"path": session_dir}))
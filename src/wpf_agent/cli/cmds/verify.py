@@ -0,0 +1,81 @@
+"""`wpf-agent verify` — post-build verification."""
+
+from __future__ import annotations
+
+import click
+
+
+def _split_args(text: str) -> list[str]:
+    """Split --args on whitespace, honouring quotes but not backslash escapes.
+
+    Backslashes are left alone so Windows paths survive intact.
+    """
+    import shlex
+
+    lex = shlex.shlex(text, posix=True)
+    lex.whitespace_split = True
+    lex.escape = ""
+    lex.commenters = ""
+    return list(lex)
+
+
+@click.command()
+@click.option("--exe", required=True, help="Path to app executable")
+@click.option("--args", "app_args", default="", help="App arguments (space-separated; quote values containing spaces)")
+@click.option("--title-re", default=None, help="Window title regex for detection")
+@click.option("--spec", default=None,
+              type=click.Path(exists=True, dir_okay=False), help="Path to verification spec YAML")
+@click.option("--timeout", default=5000, type=int, help="Startup wait ms")
+@click.option("--no-close", is_flag=True, help="Don't close app after verification")
+def verify(exe, app_args, title_re, spec, timeout, no_close):
+    """Verify a built app: launch, smoke-test, check elements, and report."""
+    import pathlib
+
+    from wpf_agent.core.session import Session
+    from wpf_agent.testing.verifier import VerifyConfig, run_verify
+
+    if spec:
+        config = VerifyConfig.from_file(pathlib.Path(spec))
+        # CLI overrides
+        if exe:
+            config.exe = exe
+        if title_re:
+            config.title_re = title_re
+    else:
+        config = VerifyConfig(exe=exe, title_re=title_re or "")
+
+    if app_args:
+        config.args = _split_args(app_args)
+    config.startup_wait_ms = timeout
+    if no_close:
+        config.auto_close = False
+
+    session = Session()
+    click.echo(f"Verifying: {config.exe}")
+    click.echo(f"Session: {session.session_id}")
+
+    result = run_verify(config, session=session)
+
+    # Display results
+    for c in result.checks:
+        status = click.style("PASS", fg="green") if c.passed else click.style("FAIL", fg="red")
+        click.echo(f"  [{status}] {c.name}: {c.message}")
+
+    click.echo()
+    if result.passed:
+        click.echo(click.style("VERIFICATION PASSED", fg="green", bold=True))
+    else:
+        click.echo(click.style("VERIFICATION FAILED", fg="red", bold=True))
+        failed = [c for c in result.checks if not c.passed]
+        click.echo(f"  {len(failed)} check(s) failed")
+
+    click.echo(f"\nSession: {result.session_id}")
+    click.echo(f"Controls found: {result.controls_found}")
+    if result.screenshot_path:
+        click.echo(f"Screenshot: {result.screenshot_path}")
+
+    if no_close and result.pid:
+        click.echo(
+            f"\nApp left running (PID {result.pid}). "
+            f"To close: wpf-agent close --pid {result.pid}"
+        )
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
-import json
+import contextlib
+import copy
+import functools
+import os
 import pathlib
-from typing import Any, Optional
+import re
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Iterator, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr
 
+from wpf_agent import _jsonio
 from wpf_agent.constants import (
     DEFAULT_TIMEOUT_MS,
     PERSONAS_FILE,
@@ -16,6 +23,27 @@ from wpf_agent.constants import (
 )
 
 
+# Matches any regex metacharacter; a pattern without one is a plain literal.
+REGEX_META = re.compile(r"[\\\[\](){}|?*+^$.]")
+
+
+@functools.lru_cache(maxsize=32)
+def _destructive_plan(
+    patterns: tuple[str, ...],
+) -> tuple[tuple[tuple[int, str], ...], tuple[tuple[int, re.Pattern[str]], ...]]:
+    """Split *patterns* into plain literals (matched with ``str.find``) and
+    the real regexes, each compiled on its own, keeping each pattern's index.
+
+    Regexes are not joined into one alternation: inline flags, numbered
+    back-references and repeated group names only work per pattern.
+    """
+    from wpf_agent.core.target import compile_pattern
+
+    literals = tuple((i, p) for i, p in enumerate(patterns) if not REGEX_META.search(p))
+    regexes = tuple((i, compile_pattern(p)) for i, p in enumerate(patterns) if REGEX_META.search(p))
+    return literals, regexes
+
+
 class SafetyConfig(BaseModel):
     allow_destructive: bool = False
     destructive_patterns: list[str] = Field(default_factory=lambda: [
@@ -23,6 +51,24 @@ class SafetyConfig(BaseModel):
     ])
     require_double_confirm: bool = True
 
+    def destructive_match(self, text: str) -> Optional[str]:
+        """The pattern matching earliest in *text*, or None.
+
+        Literal patterns (the default list) are substring searches; only
+        patterns with regex metacharacters go through the regex engine.
+        """
+        literals, regexes = _destructive_plan(tuple(self.destructive_patterns))
+        best: Optional[tuple[int, int]] = None  # (position, pattern index)
+        for i, lit in literals:
+            pos = text.find(lit)
+            if pos != -1 and (best is None or (pos, i) < best):
+                best = (pos, i)
+        for i, regex in regexes:
+            m = regex.search(text)
+            if m is not None and (best is None or (m.start(), i) < best):
+                best = (m.start(), i)
+        return self.destructive_patterns[best[1]] if best is not None else None
+
 
 class TimeoutConfig(BaseModel):
     startup_ms: int = 15000
@@ -36,6 +82,23 @@ class ProfileMatch(BaseModel):
     title_re: Optional[str] = None
     exe: Optional[str] = None
 
+    # (source, compiled) for title_re; re-checked against the field so
+    # assignment and model_copy(update=...) never see a stale pattern.
+    _title_re_compiled: Optional[tuple[str, re.Pattern[str]]] = PrivateAttr(default=None)
+
+    @property
+    def compiled_title_re(self) -> Optional[re.Pattern[str]]:
+        """``title_re`` compiled the way title matching uses it, or None."""
+        if not self.title_re:
+            return None
+        cached = self._title_re_compiled
+        if cached is None or cached[0] != self.title_re:
+            from wpf_agent.core.target import compile_title_re
+
+            cached = (self.title_re, compile_title_re(self.title_re))
+            self._title_re_compiled = cached
+        return cached[1]
+
 
 class ProfileLaunch(BaseModel):
     exe: str
@@ -51,9 +114,141 @@ class Profile(BaseModel):
     safety: SafetyConfig = Field(default_factory=SafetyConfig)
 
 
+# Decoded profiles.json / personas.json contents keyed by path, reused
+# while the file's (mtime_ns, size) is unchanged.  Callers never share
+# state with it: raw records are deep-copied on the way out
+# (``_load_json_list``) and on the way in (``_save_json_list``), and the
+# model readers only build new models from them.  ``_load_json_index`` is
+# the one read-only view.  Bounded LRU; saves refresh their own entry.
+# Each entry also remembers the validated ``model_dump()`` of records that
+# have been read once (keyed by record identity), so later reads can use
+# ``model_construct`` instead of validating again.
+_RAW_CACHE_MAX = 16
+_RawEntry = tuple[
+    int, int, list[dict[str, Any]], dict[str, dict[str, Any]], dict[int, dict[str, Any]]
+]
+_RAW_CACHE: OrderedDict[str, _RawEntry] = OrderedDict()
+
+
+def _cached_entry(path: pathlib.Path) -> _RawEntry | None:
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    key = str(path)
+    cached = _RAW_CACHE.get(key)
+    if cached is not None and cached[:2] == (st.st_mtime_ns, st.st_size):
+        _RAW_CACHE.move_to_end(key)
+        return cached
+    return _remember(key, st, _jsonio.loads(path.read_bytes()))
+
+
+def _load_json_list(path: pathlib.Path) -> list[dict[str, Any]]:
+    entry = _cached_entry(path)
+    return copy.deepcopy(entry[2]) if entry is not None else []
+
+
+def _load_json_index(path: pathlib.Path) -> dict[str, dict[str, Any]]:
+    """Name -> record for *path* (first record wins on duplicate names). Read-only."""
+    entry = _cached_entry(path)
+    return entry[3] if entry is not None else {}
+
+
+def _save_json_list(path: pathlib.Path, data: list[dict[str, Any]]) -> None:
+    """Atomically replace *path* with *data* and refresh its cache entry.
+
+    The JSON goes to a sibling temp file that is renamed over *path*, so
+    a crash mid-write never leaves a truncated file.  The parent is only
+    created when the first open fails, and the cache is refreshed from
+    the temp file's own stat (rename keeps mtime and size).
+    """
+    payload = _jsonio.dumps_pretty(data)
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    try:
+        f = open(tmp, "wb")
+    except FileNotFoundError:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        f = open(tmp, "wb")
+    try:
+        with f:
+            f.write(payload)
+            f.flush()
+            st = os.fstat(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        tmp.unlink(missing_ok=True)
+        raise
+    _remember(str(path), st, copy.deepcopy(data))
+
+
+@contextlib.contextmanager
+def _json_transaction(
+    path: pathlib.Path,
+) -> Iterator[tuple[list[dict[str, Any]], dict[str, int]]]:
+    """Load *path* once, yield ``(records, name -> index)``, save once on exit.
+
+    The records are private copies, so the body may edit them in place.
+    The index points at the first record of each name as loaded.  Nothing
+    is written if the body raises or leaves the records unchanged
+    (compared against the cached records, which the body cannot reach).
+    """
+    entry = _cached_entry(path)
+    before = entry[2] if entry is not None else []
+    data = copy.deepcopy(before)
+    idx: dict[str, int] = {}
+    for i, d in enumerate(data):
+        idx.setdefault(d.get("name"), i)
+    yield data, idx
+    if data != before:
+        _save_json_list(path, data)
+
+
+def _remember(key: str, st: os.stat_result, data: list[dict[str, Any]]) -> _RawEntry:
+    by_name: dict[str, dict[str, Any]] = {}
+    for d in data:
+        by_name.setdefault(d.get("name"), d)
+    entry = (st.st_mtime_ns, st.st_size, data, by_name, {})
+    _RAW_CACHE[key] = entry
+    _RAW_CACHE.move_to_end(key)
+    while len(_RAW_CACHE) > _RAW_CACHE_MAX:
+        _RAW_CACHE.popitem(last=False)
+    return entry
+
+
+def _read_model(entry: _RawEntry, d: dict[str, Any], model: type, construct: Callable):
+    """Validate *d* into *model* the first time, then rebuild it with *construct*."""
+    checked = entry[4]
+    dumped = checked.get(id(d))
+    if dumped is not None:
+        return construct(dumped)
+    obj = model(**d)
+    checked[id(d)] = obj.model_dump()
+    return obj
+
+
+def _construct_profile(d: dict[str, Any]) -> Profile:
+    """Rebuild a Profile from its own ``model_dump()`` without validation."""
+    match, launch, safety = d["match"], d["launch"], d["safety"]
+    return Profile.model_construct(
+        name=d["name"],
+        match=ProfileMatch.model_construct(**match) if match is not None else None,
+        launch=(
+            ProfileLaunch.model_construct(**{**launch, "args": list(launch["args"])})
+            if launch is not None else None
+        ),
+        timeouts=TimeoutConfig.model_construct(**d["timeouts"]),
+        safety=SafetyConfig.model_construct(
+            **{**safety, "destructive_patterns": list(safety["destructive_patterns"])}
+        ),
+    )
+
+
 class ProfileStore:
     """Manages profiles.json read/write."""
 
+    _instance: Optional[ProfileStore] = None
+    _lock = threading.Lock()
+
     def __init__(self, path: str | pathlib.Path | None = None):
         self.path = pathlib.Path(path or PROFILES_FILE)
         # Backward compat: fall back to legacy root-level file
@@ -62,49 +257,71 @@ class ProfileStore:
             if legacy.exists():
                 self.path = legacy
 
+    @classmethod
+    def get_instance(cls) -> ProfileStore:
+        """Process-wide store for the default profiles.json."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._instance = None
+
     def _load_raw(self) -> list[dict[str, Any]]:
-        if not self.path.exists():
-            return []
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        return _load_json_list(self.path)
 
     def _save_raw(self, data: list[dict[str, Any]]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        _save_json_list(self.path, data)
 
     def list(self) -> list[Profile]:
-        return [Profile(**d) for d in self._load_raw()]
+        entry = _cached_entry(self.path)
+        if entry is None:
+            return []
+        return [_read_model(entry, d, Profile, _construct_profile) for d in entry[2]]
 
     def get(self, name: str) -> Profile | None:
-        for d in self._load_raw():
-            if d.get("name") == name:
-                return Profile(**d)
-        return None
+        entry = _cached_entry(self.path)
+        d = entry[3].get(name) if entry is not None else None
+        return _read_model(entry, d, Profile, _construct_profile) if d is not None else None
+
+    def transaction(self):
+        """Edit the raw records with one read and at most one write.
+
+        Yields ``(records, name -> index)``; see ``_json_transaction``.
+        """
+        return _json_transaction(self.path)
 
     def add(self, profile: Profile) -> None:
-        data = self._load_raw()
-        if any(d.get("name") == profile.name for d in data):
+        if profile.name in _load_json_index(self.path):
             raise ValueError(f"Profile '{profile.name}' already exists")
-        data.append(profile.model_dump(exclude_none=True))
-        self._save_raw(data)
+        with self.transaction() as (data, _):
+            data.append(profile.model_dump(exclude_none=True))
 
     def remove(self, name: str) -> bool:
-        data = self._load_raw()
-        new = [d for d in data if d.get("name") != name]
-        if len(new) == len(data):
+        if name not in _load_json_index(self.path):
             return False
-        self._save_raw(new)
+        with self.transaction() as (data, _):
+            data[:] = [d for d in data if d.get("name") != name]
         return True
 
     def update(self, profile: Profile) -> None:
-        data = self._load_raw()
-        for i, d in enumerate(data):
-            if d.get("name") == profile.name:
+        self.bulk_update([profile])
+
+    def bulk_update(self, profiles: list[Profile]) -> None:
+        """Replace several existing profiles in a single save.
+
+        Raises ValueError (and writes nothing) if any of them is missing.
+        """
+        with self.transaction() as (data, idx):
+            for profile in profiles:
+                i = idx.get(profile.name)
+                if i is None:
+                    raise ValueError(f"Profile '{profile.name}' not found")
                 data[i] = profile.model_dump(exclude_none=True)
-                self._save_raw(data)
-                return
-        raise ValueError(f"Profile '{profile.name}' not found")
 
     def ensure_default(self) -> None:
         if not self.path.exists():
@@ -122,9 +339,16 @@ class Persona(BaseModel):
     description: str  # e.g. "田中美咲（35歳）、事務職、..."
 
 
+def _construct_persona(d: dict[str, Any]) -> Persona:
+    return Persona.model_construct(**d)
+
+
 class PersonaStore:
     """Manages personas.json read/write."""
 
+    _instance: Optional[PersonaStore] = None
+    _lock = threading.Lock()
+
     def __init__(self, path: str | pathlib.Path | None = None):
         self.path = pathlib.Path(path or PERSONAS_FILE)
         # Backward compat: fall back to legacy root-level file
@@ -133,49 +357,71 @@ class PersonaStore:
             if legacy.exists():
                 self.path = legacy
 
+    @classmethod
+    def get_instance(cls) -> PersonaStore:
+        """Process-wide store for the default personas.json."""
+        if cls._instance is None:
+            with cls._lock:
+                if cls._instance is None:
+                    cls._instance = cls()
+        return cls._instance
+
+    @classmethod
+    def reset(cls) -> None:
+        with cls._lock:
+            cls._instance = None
+
     def _load_raw(self) -> list[dict[str, Any]]:
-        if not self.path.exists():
-            return []
-        return json.loads(self.path.read_text(encoding="utf-8"))
+        return _load_json_list(self.path)
 
     def _save_raw(self, data: list[dict[str, Any]]) -> None:
-        self.path.parent.mkdir(parents=True, exist_ok=True)
-        self.path.write_text(
-            json.dumps(data, indent=2, ensure_ascii=False), encoding="utf-8"
-        )
+        _save_json_list(self.path, data)
 
     def list(self) -> list[Persona]:
-        return [Persona(**d) for d in self._load_raw()]
+        entry = _cached_entry(self.path)
+        if entry is None:
+            return []
+        return [_read_model(entry, d, Persona, _construct_persona) for d in entry[2]]
 
     def get(self, name: str) -> Persona | None:
-        for d in self._load_raw():
-            if d.get("name") == name:
-                return Persona(**d)
-        return None
+        entry = _cached_entry(self.path)
+        d = entry[3].get(name) if entry is not None else None
+        return _read_model(entry, d, Persona, _construct_persona) if d is not None else None
+
+    def transaction(self):
+        """Edit the raw records with one read and at most one write.
+
+        Yields ``(records, name -> index)``; see ``_json_transaction``.
+        """
+        return _json_transaction(self.path)
 
     def add(self, persona: Persona) -> None:
-        data = self._load_raw()
-        if any(d.get("name") == persona.name for d in data):
+        if persona.name in _load_json_index(self.path):
             raise ValueError(f"Persona '{persona.name}' already exists")
-        data.append(persona.model_dump())
-        self._save_raw(data)
+        with self.transaction() as (data, _):
+            data.append(persona.model_dump())
 
     def remove(self, name: str) -> bool:
-        data = self._load_raw()
-        new = [d for d in data if d.get("name") != name]
-        if len(new) == len(data):
+        if name not in _load_json_index(self.path):
             return False
-        self._save_raw(new)
+        with self.transaction() as (data, _):
+            data[:] = [d for d in data if d.get("name") != name]
         return True
 
     def update(self, persona: Persona) -> None:
-        data = self._load_raw()
-        for i, d in enumerate(data):
-            if d.get("name") == persona.name:
+        self.bulk_update([persona])
+
+    def bulk_update(self, personas: list[Persona]) -> None:
+        """Replace several existing personas in a single save.
+
+        Raises ValueError (and writes nothing) if any of them is missing.
+        """
+        with self.transaction() as (data, idx):
+            for persona in personas:
+                i = idx.get(persona.name)
+                if i is None:
+                    raise ValueError(f"Persona '{persona.name}' not found")
                 data[i] = persona.model_dump()
-                self._save_raw(data)
-                return
-        raise ValueError(f"Persona '{persona.name}' not found")
 
     def ensure_default(self) -> None:
         if not self.path.exists():
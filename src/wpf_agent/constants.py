@@ -1,8 +1,15 @@
-"""Global constants."""
+"""Global constants.
 
+Project-relative paths (``PROJECT_ROOT``, ``SESSION_DIR``, ...) are
+resolved on first access, so importing a plain constant does not walk
+the filesystem.
+"""
+
+import functools
 import pathlib
 
 
+@functools.cache
 def _find_project_root() -> pathlib.Path:
     """Find the project root (directory containing .wpf-agent/ or .git).
 
@@ -33,16 +40,9 @@ def _find_project_root() -> pathlib.Path:
     return pathlib.Path.cwd()
 
 
-PROJECT_ROOT = _find_project_root()
-
 DEFAULT_TIMEOUT_MS = 10000
 DEFAULT_DEPTH = 4
 DEFAULT_LOG_TAIL = 20
-SESSION_DIR = str(PROJECT_ROOT / "artifacts" / "sessions")
-TICKET_DIR = str(PROJECT_ROOT / "artifacts" / "tickets")
-CONFIG_DIR = PROJECT_ROOT / ".wpf-agent"
-PROFILES_FILE = str(CONFIG_DIR / "profiles.json")
-PERSONAS_FILE = str(CONFIG_DIR / "personas.json")
 MAX_CONTROLS = 500
 SCREENSHOT_FORMAT = "png"
 
@@ -50,4 +50,23 @@ SCREENSHOT_FORMAT = "png"
 GUARD_CHECK_DELAY_MS = 50
 GUARD_MOVEMENT_THRESHOLD_PX = 2.0
 GUARD_PAUSE_DIR = pathlib.Path.home() / ".wpf-agent"
-LAUNCHED_PIDS_FILE = pathlib.Path.home() / ".wpf-agent" / "launched_pids.json"
+LAUNCHED_PIDS_FILE = pathlib.Path.home() / ".wpf-agent" / "launched_pids.jsonl"
+
+
+_LAZY_PATHS = {
+    "PROJECT_ROOT": lambda root: root,
+    "SESSION_DIR": lambda root: str(root / "artifacts" / "sessions"),
+    "TICKET_DIR": lambda root: str(root / "artifacts" / "tickets"),
+    "CONFIG_DIR": lambda root: root / ".wpf-agent",
+    "PROFILES_FILE": lambda root: str(root / ".wpf-agent" / "profiles.json"),
+    "PERSONAS_FILE": lambda root: str(root / ".wpf-agent" / "personas.json"),
+}
+
+
+def __getattr__(name: str):
+    factory = _LAZY_PATHS.get(name)
+    if factory is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = factory(_find_project_root())
+    globals()[name] = value
+    return value
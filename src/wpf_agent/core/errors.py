@@ -49,6 +49,10 @@ class MultipleElementsFoundError(WpfAgentError):
             )
         super().__init__("\n".join(lines))
 
+    def __reduce__(self):
+        # args holds the formatted message, not the constructor arguments.
+        return type(self), (self.selector_desc, self.candidates)
+
 
 class UserInterruptError(WpfAgentError):
     """User interrupted the operation via mouse movement or pause state."""
@@ -57,3 +61,6 @@ class UserInterruptError(WpfAgentError):
         self.reason = reason
         self.detail = detail
         super().__init__(f"User interrupt: {reason}. {detail}")
+
+    def __reduce__(self):
+        return type(self), (self.reason, self.detail)
@@ -27,9 +27,13 @@ class Session:
         self.uia_dir = self.base_dir / "uia"
 
     def start(self) -> None:
+        """Create the session directory.
+
+        ``screens/`` and ``uia/`` are left to the first screenshot or
+        snapshot written (their writers create the parent), so runs that
+        take none leave no empty directories behind.
+        """
         self.base_dir.mkdir(parents=True, exist_ok=True)
-        self.screens_dir.mkdir(exist_ok=True)
-        self.uia_dir.mkdir(exist_ok=True)
 
     def next_step(self) -> int:
         self.step_count += 1
@@ -49,6 +53,10 @@ class Session:
     def actions_path(self) -> pathlib.Path:
         return self.base_dir / "actions.json"
 
+    def actions_log_path(self) -> pathlib.Path:
+        """Append-only JSONL of recorded actions, written as the run goes."""
+        return self.base_dir / "actions.jsonl"
+
     @property
     def elapsed_s(self) -> float:
         return time.time() - self.started_at
@@ -2,17 +2,20 @@
 
 from __future__ import annotations
 
-import json as _json
+import functools
+import os
 import pathlib
 import re
 import subprocess
+import sys
 import threading
 import time
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import psutil
 
-from wpf_agent.config import Profile, ProfileMatch
+from wpf_agent import _jsonio
+from wpf_agent.config import REGEX_META, Profile, ProfileMatch
 from wpf_agent.constants import LAUNCHED_PIDS_FILE
 from wpf_agent.core.errors import TargetNotFoundError
 
@@ -22,37 +25,170 @@ from wpf_agent.core.errors import TargetNotFoundError
 # so that `wpf-agent ui close` can verify it only closes processes
 # that *we* started.
 
-def record_launched_pid(pid: int, exe: str) -> None:
-    """Persist a launched PID to disk."""
-    entries = _load_launched_entries()
-    entries.append({"pid": pid, "exe": exe, "ts": time.time()})
+# The file is append-only JSONL: ``{"pid", "exe", "ts"}`` when a PID is
+# recorded and ``{"pid", "removed": true}`` when it is dropped.  Each
+# process replays it once and then only reads lines appended since (by
+# other wpf-agent processes), keyed on the file's inode and size.  It is
+# compacted once tombstones make up a quarter of the lines.
+
+_COMPACT_MIN_LINES = 32
+_launched_lock = threading.Lock()
+_launched: dict[int, dict] = {}
+_launched_state: dict[str, Any] = {"ino": None, "offset": 0, "lines": 0, "tombstones": 0}
+
+
+def _apply_launched_line(line: bytes) -> None:
+    try:
+        entry = _jsonio.loads(line)
+        pid = entry["pid"]
+    except (ValueError, TypeError, KeyError):
+        return
+    _launched_state["lines"] += 1
+    if entry.get("removed"):
+        _launched_state["tombstones"] += 1
+        _launched.pop(pid, None)
+    else:
+        _launched[pid] = entry
+
+
+def _import_legacy_launched() -> None:
+    """Carry entries over from the old JSON-array file, then drop it."""
+    legacy = LAUNCHED_PIDS_FILE.with_suffix(".json")
+    try:
+        entries = _jsonio.loads(legacy.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return
+    if isinstance(entries, list):
+        _append_launched([e for e in entries if isinstance(e, dict) and "pid" in e])
+    try:
+        legacy.unlink()
+    except OSError:
+        pass
+
+
+def _sync_launched() -> None:
+    """Bring ``_launched`` up to date with the file (caller holds the lock)."""
+    try:
+        st = LAUNCHED_PIDS_FILE.stat()
+    except FileNotFoundError:
+        _launched.clear()
+        _launched_state.update(ino=None, offset=0, lines=0, tombstones=0)
+        _import_legacy_launched()
+        if LAUNCHED_PIDS_FILE.is_file():
+            _sync_launched()
+        return
+    if st.st_ino != _launched_state["ino"] or st.st_size < _launched_state["offset"]:
+        _launched.clear()
+        _launched_state.update(ino=st.st_ino, offset=0, lines=0, tombstones=0)
+    if st.st_size == _launched_state["offset"]:
+        return
+    with open(LAUNCHED_PIDS_FILE, "rb") as f:
+        f.seek(_launched_state["offset"])
+        chunk = f.read()
+    # Only consume complete lines; a partial trailing line is read next time.
+    end = chunk.rfind(b"\n") + 1
+    for line in chunk[:end].splitlines():
+        _apply_launched_line(line)
+    _launched_state["offset"] += end
+
+
+def _append_launched(entries: list[dict]) -> None:
+    if not entries:
+        return
+    data = b"".join(_jsonio.dumps_line(e) for e in entries)
     LAUNCHED_PIDS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    LAUNCHED_PIDS_FILE.write_text(
-        _json.dumps(entries, indent=2), encoding="utf-8"
-    )
+    with open(LAUNCHED_PIDS_FILE, "ab") as f:
+        f.write(data)
 
 
-def _load_launched_entries() -> list[dict]:
-    if LAUNCHED_PIDS_FILE.is_file():
-        try:
-            return _json.loads(LAUNCHED_PIDS_FILE.read_text(encoding="utf-8"))
-        except Exception:
-            return []
-    return []
+def _compact_launched() -> None:
+    """Rewrite the file with only live entries (caller holds the lock)."""
+    tmp = LAUNCHED_PIDS_FILE.with_name(LAUNCHED_PIDS_FILE.name + ".tmp")
+    data = b"".join(_jsonio.dumps_line(e) for e in _launched.values())
+    try:
+        tmp.write_bytes(data)
+        os.replace(tmp, LAUNCHED_PIDS_FILE)
+    except OSError:
+        tmp.unlink(missing_ok=True)
+        return
+    st = LAUNCHED_PIDS_FILE.stat()
+    _launched_state.update(ino=st.st_ino, offset=len(data), lines=len(_launched), tombstones=0)
+
+
+def record_launched_pid(pid: int, exe: str) -> None:
+    """Persist a launched PID to disk."""
+    with _launched_lock:
+        _sync_launched()
+        _append_launched([{"pid": pid, "exe": exe, "ts": time.time()}])
+        _sync_launched()
 
 
 def is_launched_pid(pid: int) -> bool:
     """Return True if *pid* was started by wpf-agent launch."""
-    return any(e["pid"] == pid for e in _load_launched_entries())
+    with _launched_lock:
+        _sync_launched()
+        return pid in _launched
 
 
 def remove_launched_pid(pid: int) -> None:
     """Remove a PID from the launched list (after close)."""
-    entries = [e for e in _load_launched_entries() if e["pid"] != pid]
-    LAUNCHED_PIDS_FILE.parent.mkdir(parents=True, exist_ok=True)
-    LAUNCHED_PIDS_FILE.write_text(
-        _json.dumps(entries, indent=2), encoding="utf-8"
-    )
+    with _launched_lock:
+        _sync_launched()
+        if pid not in _launched:
+            return
+        _append_launched([{"pid": pid, "removed": True}])
+        _sync_launched()
+        lines, tombstones = _launched_state["lines"], _launched_state["tombstones"]
+        if lines >= _COMPACT_MIN_LINES and tombstones * 4 >= lines:
+            _compact_launched()
+
+
+def _find_process(name: str) -> tuple[int, str] | None:
+    """``(pid, name)`` of the lowest-PID process called *name* (case-insensitive).
+
+    On Windows this is one Toolhelp snapshot walked in-process instead of
+    a psutil.Process per PID; psutil is the fallback elsewhere.
+    """
+    if sys.platform == "win32":
+        from wpf_agent._winproc import find_processes
+
+        matches = find_processes(name)
+        if not matches:
+            return None
+        first = min(matches, key=lambda m: m["pid"])
+        return first["pid"], first["process"]
+
+    name_lower = name.lower()
+    for proc in psutil.process_iter(["pid", "name"]):
+        try:
+            if proc.info["name"] and proc.info["name"].lower() == name_lower:
+                return proc.info["pid"], proc.info["name"]
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            continue
+    return None
+
+
+def _pid_alive_posix(pid: int) -> bool:
+    """Return True if *pid* names a running process (signal 0 probe)."""
+    if pid < 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+if sys.platform == "win32":
+    from wpf_agent._winproc import pid_alive, window_exists
+else:
+    pid_alive = _pid_alive_posix
+
+    def window_exists(hwnd: int) -> bool:
+        """Window handles only exist on Windows; nothing to revalidate."""
+        return True
 
 
 class ResolvedTarget:
@@ -73,12 +209,136 @@ class ResolvedTarget:
 
     @property
     def is_alive(self) -> bool:
-        return psutil.pid_exists(self.pid)
+        return pid_alive(self.pid)
 
     def __repr__(self) -> str:
         return f"ResolvedTarget(pid={self.pid}, name={self.process_name!r})"
 
 
+@functools.lru_cache(maxsize=256)
+def compile_pattern(pattern: str, flags: int = 0) -> re.Pattern[str]:
+    """Compile *pattern* once per (pattern, flags) pair.
+
+    Shared by every user-supplied regex (window titles, assertion
+    patterns, destructive patterns), so one cache bounds them all.
+    """
+    return re.compile(pattern, flags)
+
+
+def compile_title_re(pattern: str | re.Pattern[str]) -> re.Pattern[str]:
+    """Compile a window-title regex the way title_re matching uses it.
+
+    Callers may put the result in a target_spec instead of the string.
+    """
+    if isinstance(pattern, re.Pattern):
+        return pattern
+    return compile_pattern(pattern, re.IGNORECASE)
+
+
+def _title_matcher(regex: re.Pattern[str]) -> Callable[[str], Any]:
+    """Return a title predicate for *regex*.
+
+    Case-insensitive patterns without regex metacharacters (the common
+    ``"My App"`` case) become a plain substring test.
+    """
+    pattern = regex.pattern
+    if regex.flags & re.IGNORECASE and not REGEX_META.search(pattern):
+        needle = pattern.lower()
+        return lambda title: needle in title.lower()
+    return regex.search
+
+
+_desktop_local = threading.local()
+
+
+def _desktop():
+    """The UIA ``Desktop`` for this thread, created on first use.
+
+    Per thread rather than module-wide: the COM objects behind it belong
+    to the apartment of the thread that created them.
+    """
+    desktop = getattr(_desktop_local, "desktop", None)
+    if desktop is None:
+        from pywinauto import Desktop
+
+        desktop = _desktop_local.desktop = Desktop(backend="uia")
+    return desktop
+
+
+@functools.lru_cache(maxsize=256)
+def _proc_name(pid: int, create_time: float) -> str:
+    """Process name, memoized per (pid, create_time) so a reused PID misses."""
+    return psutil.Process(pid).name()
+
+
+def spawn_app(cmd: list[str], cwd: str | None = None) -> subprocess.Popen:
+    """Start an app under test, detached from our stdin/stdout.
+
+    The MCP server speaks JSON-RPC over stdio, so a child that inherited
+    those pipes could corrupt the stream and would hold them open after
+    the server exits.  stderr is kept for diagnostics.  The Popen is
+    returned (not just the pid) so its exit can be polled and reaped.
+    """
+    return subprocess.Popen(
+        cmd,
+        cwd=cwd,
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        close_fds=True,
+    )
+
+
+# Launch wait: poll with backoff until the main window shows (Windows),
+# up to LAUNCH_TIMEOUT seconds.  Without a window API the old fixed
+# settle time is kept.
+LAUNCH_TIMEOUT = 10.0
+LAUNCH_SETTLE = 2.0
+
+
+def _wait_for_startup(proc: subprocess.Popen) -> bool:
+    """Wait for a just-launched *proc* to come up; False if it exited.
+
+    A process that is still running without a window at the deadline
+    counts as started, as it did with the fixed sleep.
+    """
+    if sys.platform == "win32":
+        from wpf_agent._winproc import main_windows
+
+        has_window = main_windows
+        deadline = time.monotonic() + LAUNCH_TIMEOUT
+    else:
+        has_window = None
+        deadline = time.monotonic() + LAUNCH_SETTLE
+    delay = 0.05
+    while True:
+        if proc.poll() is not None:
+            return False
+        if has_window is not None and has_window(proc.pid):
+            return True
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return True
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 1.5, 0.25)
+
+
+_SHORTHAND_RE = re.compile(r"(pid|process|title_re):(.*)", re.DOTALL)
+
+
+def parse_shorthand(text: str) -> dict[str, Any] | None:
+    """Turn ``pid:<N>`` / ``process:<name>`` / ``title_re:<regex>`` into a
+    target_spec; None if *text* has none of those prefixes."""
+    m = _SHORTHAND_RE.match(text)
+    if m is None:
+        return None
+    kind, value = m.groups()
+    return {kind: int(value) if kind == "pid" else value}
+
+
+# How long a resolved target is reused before re-resolving.
+TARGET_CACHE_TTL = 30.0
+
+
 class TargetRegistry:
     """Singleton registry for resolved targets."""
 
@@ -88,6 +348,11 @@ class TargetRegistry:
     def __init__(self):
         self._targets: dict[str, ResolvedTarget] = {}
         self._counter = 0
+        # lookup key -> (resolved_at, target_id, target)
+        self._cache: dict[tuple, tuple[float, str, ResolvedTarget]] = {}
+        # (pid, window_handle) -> target_id, so re-resolving a live
+        # process hands back its existing target (and connected app).
+        self._by_pid: dict[tuple[int, int | None], str] = {}
 
     @classmethod
     def get_instance(cls) -> TargetRegistry:
@@ -107,21 +372,51 @@ class TargetRegistry:
         return f"target-{self._counter}"
 
     def resolve(self, spec: dict[str, Any]) -> tuple[str, ResolvedTarget]:
-        """Resolve a target_spec dict to a ResolvedTarget."""
+        """Resolve a target_spec dict to a ResolvedTarget.
+
+        pid/process/title_re lookups are cached (see ``_cached``); exe
+        specs always launch a new process.
+        """
         if "pid" in spec:
-            return self._resolve_by_pid(spec["pid"])
+            pid = spec["pid"]
+            return self._cached(("pid", pid), lambda: self._resolve_by_pid(pid))
         if "process" in spec:
-            return self._resolve_by_process(spec["process"])
+            name = spec["process"]
+            return self._cached(("process", name), lambda: self._resolve_by_process(name))
         if "exe" in spec:
             return self._resolve_by_exe(
                 spec["exe"], spec.get("args", []), spec.get("cwd")
             )
         if "title_re" in spec:
-            return self._resolve_by_title(spec["title_re"])
+            regex = compile_title_re(spec["title_re"])
+            return self._cached(("title_re", regex.pattern), lambda: self._resolve_by_title(regex))
         raise TargetNotFoundError(f"Invalid target_spec: {spec}")
 
+    def _cached(self, key: tuple, resolver) -> tuple[str, ResolvedTarget]:
+        """Reuse the target resolved for *key* within ``TARGET_CACHE_TTL``
+        seconds while its process is alive and its window (if any) still
+        exists; otherwise call *resolver*."""
+        cached = self._cache.get(key)
+        if cached is not None:
+            resolved_at, tid, target = cached
+            if (
+                time.monotonic() - resolved_at < TARGET_CACHE_TTL
+                and target.is_alive
+                and (target.window_handle is None or window_exists(target.window_handle))
+            ):
+                return tid, target
+            del self._cache[key]
+        tid, target = resolver()
+        self._cache[key] = (time.monotonic(), tid, target)
+        return tid, target
+
     def resolve_profile(self, profile: Profile) -> tuple[str, ResolvedTarget]:
-        """Resolve from a Profile."""
+        """Resolve from a Profile.
+
+        Match-based profiles are cached like ``resolve`` lookups;
+        launch profiles, and matches that resolve by ``exe`` (which also
+        launches), always start a new process.
+        """
         if profile.launch:
             spec: dict[str, Any] = {
                 "exe": profile.launch.exe,
@@ -131,21 +426,41 @@ class TargetRegistry:
                 spec["cwd"] = profile.launch.cwd
             return self.resolve(spec)
         if profile.match:
-            return self._resolve_match(profile.match)
+            m = profile.match
+            if m.pid is None and not m.process and m.exe:
+                return self._resolve_match(m)
+            key = ("profile", profile.name, m.pid, m.process, m.exe, m.title_re)
+            return self._cached(key, lambda: self._resolve_match(m))
         raise TargetNotFoundError(
             f"Profile '{profile.name}' has no match or launch config"
         )
 
+    def forget_pid(self, pid: int) -> None:
+        """Drop every cached resolution that points at *pid* (e.g. after closing it)."""
+        for key in [k for k, v in self._cache.items() if v[2].pid == pid]:
+            del self._cache[key]
+        for key in [k for k in self._by_pid if k[0] == pid]:
+            del self._by_pid[key]
+
     def get(self, target_id: str) -> ResolvedTarget:
         t = self._targets.get(target_id)
         if t is None:
             raise TargetNotFoundError(f"Unknown target_id: {target_id}")
         return t
 
-    def _register(self, target: ResolvedTarget) -> str:
+    def _register(self, target: ResolvedTarget) -> tuple[str, ResolvedTarget]:
+        """Register *target*, or return the live one already registered for
+        the same process and window."""
+        key = (target.pid, target.window_handle)
+        tid = self._by_pid.get(key)
+        if tid is not None:
+            existing = self._targets.get(tid)
+            if existing is not None and existing.is_alive:
+                return tid, existing
         tid = self._next_id()
         self._targets[tid] = target
-        return tid
+        self._by_pid[key] = tid
+        return tid, target
 
     def _resolve_match(self, match: ProfileMatch) -> tuple[str, ResolvedTarget]:
         if match.pid is not None:
@@ -155,64 +470,53 @@ class TargetRegistry:
         if match.exe:
             return self._resolve_by_exe(match.exe, [], None)
         if match.title_re:
-            return self._resolve_by_title(match.title_re)
+            return self._resolve_by_title(match.compiled_title_re)
         raise TargetNotFoundError("Empty match specification")
 
     def _resolve_by_pid(self, pid: int) -> tuple[str, ResolvedTarget]:
-        if not psutil.pid_exists(pid):
+        if not pid_alive(pid):
             raise TargetNotFoundError(f"PID {pid} not found")
         proc = psutil.Process(pid)
         t = ResolvedTarget(pid=pid, process_name=proc.name())
-        tid = self._register(t)
-        return tid, t
+        return self._register(t)
 
     def _resolve_by_process(self, name: str) -> tuple[str, ResolvedTarget]:
-        name_lower = name.lower()
-        for proc in psutil.process_iter(["pid", "name"]):
-            try:
-                if proc.info["name"] and proc.info["name"].lower() == name_lower:
-                    t = ResolvedTarget(
-                        pid=proc.info["pid"], process_name=proc.info["name"]
-                    )
-                    tid = self._register(t)
-                    return tid, t
-            except (psutil.NoSuchProcess, psutil.AccessDenied):
-                continue
-        raise TargetNotFoundError(f"Process '{name}' not found")
+        found = _find_process(name)
+        if found is None:
+            raise TargetNotFoundError(f"Process '{name}' not found")
+        t = ResolvedTarget(pid=found[0], process_name=found[1])
+        return self._register(t)
 
     def _resolve_by_exe(
         self, exe: str, args: list[str], cwd: str | None
     ) -> tuple[str, ResolvedTarget]:
         exe_path = str(pathlib.Path(exe).resolve())
         cmd = [exe_path] + args
-        proc = subprocess.Popen(cmd, cwd=cwd)
-        time.sleep(2)
-        if proc.poll() is not None:
+        proc = spawn_app(cmd, cwd)
+        if not _wait_for_startup(proc):
             raise TargetNotFoundError(f"Process exited immediately: {exe}")
         basename = exe.replace("\\", "/").rsplit("/", 1)[-1]
         record_launched_pid(proc.pid, exe)
         t = ResolvedTarget(pid=proc.pid, process_name=basename)
-        tid = self._register(t)
-        return tid, t
+        return self._register(t)
 
-    def _resolve_by_title(self, pattern: str) -> tuple[str, ResolvedTarget]:
-        from pywinauto import Desktop
-
-        desktop = Desktop(backend="uia")
-        regex = re.compile(pattern, re.IGNORECASE)
-        for w in desktop.windows():
+    def _resolve_by_title(
+        self, pattern: str | re.Pattern[str]
+    ) -> tuple[str, ResolvedTarget]:
+        regex = compile_title_re(pattern)
+        matches = _title_matcher(regex)
+        for w in _desktop().windows():
             try:
                 title = w.window_text()
-                if regex.search(title):
+                if matches(title):
                     pid = w.process_id()
                     proc = psutil.Process(pid)
                     t = ResolvedTarget(
                         pid=pid,
-                        process_name=proc.name(),
+                        process_name=_proc_name(pid, proc.create_time()),
                         window_handle=w.handle,
                     )
-                    tid = self._register(t)
-                    return tid, t
+                    return self._register(t)
             except Exception:
                 continue
-        raise TargetNotFoundError(f"No window matching '{pattern}'")
+        raise TargetNotFoundError(f"No window matching '{regex.pattern}'")
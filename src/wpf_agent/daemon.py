@@ -0,0 +1,231 @@
+"""Opt-in resident CLI process (``wpf-agent daemon start``).
+
+The daemon imports the CLI once and keeps the profile/persona stores and
+target registry warm.  It serves exactly one project: its address and
+auth key are published in a per-user state file keyed by the project
+root (see ``state_path``; never inside the project, whose ``.wpf-agent/``
+is committed), and a CLI invocation for that project forwards its argv, cwd
+and environment there instead of running in-process; output is
+captured and replayed by the client.  Only short commands are forwarded:
+test runs stay in the caller's process so their progress streams, Ctrl+C
+stops them, and they never hold up other calls.
+
+Without a daemon file nothing changes, and a dead daemon just means the
+command runs locally.  This module is imported on every CLI call, so
+anything heavier than ``os``/``sys`` is imported only once a daemon
+state file exists.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import sys
+
+TYPE_CHECKING = False  # not imported from typing: it is not otherwise needed here
+if TYPE_CHECKING:
+    import pathlib
+    from typing import Any
+
+
+# Commands that need the caller's own stdin/tty, manage the daemon itself,
+# or run a whole test session (long-running, streaming progress).
+LOCAL_ONLY = frozenset({
+    "daemon", "mcp-serve", "run", "init", "install-skills",
+    "random", "scenario", "explore", "verify", "replay",
+})
+
+
+def _runtime_dir() -> str:
+    """Per-user directory for daemon state files.
+
+    ``%LOCALAPPDATA%`` on Windows (inside the user's profile, so other
+    users cannot read it); ``$XDG_RUNTIME_DIR`` elsewhere, falling back
+    to a private directory under the temp dir.
+    """
+    if sys.platform == "win32":
+        base = os.environ.get("LOCALAPPDATA") or os.path.join(
+            os.path.expanduser("~"), "AppData", "Local"
+        )
+        return os.path.join(base, "wpf-agent", "daemon")
+    xdg = os.environ.get("XDG_RUNTIME_DIR")
+    if xdg:
+        return os.path.join(xdg, "wpf-agent")
+    import tempfile
+
+    return os.path.join(tempfile.gettempdir(), f"wpf-agent-{os.getuid()}")
+
+
+def _no_daemon() -> bool:
+    """Cheap pre-check: True if no daemon has published state for this user.
+
+    Daemons remove their state file on exit, so an absent or empty
+    runtime directory settles it without resolving the project root.
+    """
+    try:
+        return not os.listdir(_runtime_dir())
+    except OSError:
+        return True
+
+
+def _is_private(directory: pathlib.Path) -> bool:
+    """True if *directory* is ours alone (always true on Windows, see above)."""
+    if sys.platform == "win32":
+        return True
+    try:
+        st = directory.stat()
+    except OSError:
+        return False
+    return st.st_uid == os.getuid() and not st.st_mode & 0o077
+
+
+def state_path() -> pathlib.Path:
+    """This project's daemon state file (address + auth key)."""
+    import hashlib
+    import pathlib
+
+    from wpf_agent.constants import _find_project_root
+
+    root = os.path.normcase(str(_find_project_root().resolve()))
+    key = hashlib.sha256(root.encode("utf-8")).hexdigest()[:16]
+    return pathlib.Path(_runtime_dir()) / f"{key}.json"
+
+
+def _read_state(path: pathlib.Path) -> dict[str, Any] | None:
+    import json
+
+    if not _is_private(path.parent):
+        return None
+    try:
+        with open(path, encoding="utf-8") as f:
+            state = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return state if isinstance(state, dict) else None
+
+
+def _request(msg: dict[str, Any]) -> dict[str, Any] | None:
+    """Send *msg* to this project's daemon; None if there is none reachable."""
+    state = _read_state(state_path())
+    if state is None:
+        return None
+    # Only imported once a daemon file exists.
+    from multiprocessing.connection import AuthenticationError, Client
+
+    try:
+        with Client(state["address"], authkey=bytes.fromhex(state["authkey"])) as conn:
+            conn.send(msg)
+            return conn.recv()
+    except (OSError, EOFError, KeyError, ValueError, AuthenticationError):
+        return None
+
+
+def forward(argv: list[str]) -> int | None:
+    """Run *argv* in the daemon and replay its output; None to run locally."""
+    if not argv or argv[0] in LOCAL_ONLY or _no_daemon():
+        return None
+    reply = _request({"op": "run", "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)})
+    if reply is None:
+        return None
+    for stream, data in ((sys.stdout, reply["stdout"]), (sys.stderr, reply["stderr"])):
+        stream.flush()
+        stream.buffer.write(data)
+        stream.buffer.flush()
+    return reply["code"]
+
+
+def stop() -> bool:
+    """Ask the daemon to exit; True if one answered."""
+    return _request({"op": "stop"}) is not None
+
+
+@contextlib.contextmanager
+def _environ(env: dict[str, str] | None):
+    """Run with the client's environment (API keys, WPF_AGENT_* switches)."""
+    if env is None:
+        yield
+        return
+    saved = dict(os.environ)
+    os.environ.clear()
+    os.environ.update(env)
+    try:
+        yield
+    finally:
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+def _run_cli(main, argv: list[str], cwd: str, env: dict[str, str] | None = None) -> dict[str, Any]:
+    import traceback
+
+    # Text streams over bytes so commands writing to the binary stream
+    # (click.get_binary_stream) are captured too.
+    out = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    err = io.TextIOWrapper(io.BytesIO(), encoding="utf-8", write_through=True)
+    code = 0
+    home = os.getcwd()
+    try:
+        os.chdir(cwd)
+        with _environ(env), contextlib.redirect_stdout(out), contextlib.redirect_stderr(err):
+            try:
+                main.main(args=argv, prog_name="wpf-agent")
+            except SystemExit as exc:
+                code = exc.code if isinstance(exc.code, int) else (0 if exc.code is None else 1)
+            except Exception:
+                traceback.print_exc()
+                code = 1
+    except OSError as exc:
+        err.write(f"daemon: cannot enter {cwd}: {exc}\n")
+        code = 1
+    finally:
+        os.chdir(home)
+    return {"code": code, "stdout": out.buffer.getvalue(), "stderr": err.buffer.getvalue()}
+
+
+def _remove_own_state(path: pathlib.Path) -> None:
+    """Delete *path* unless a newer daemon has already replaced it."""
+    state = _read_state(path)
+    if state is not None and state.get("pid") == os.getpid():
+        with contextlib.suppress(OSError):
+            path.unlink()
+
+
+def serve() -> None:
+    """Accept CLI requests until a ``stop`` request arrives (blocking)."""
+    import json
+    from multiprocessing.connection import AuthenticationError, Listener
+
+    from wpf_agent.cli import main
+
+    path = state_path()
+    authkey = os.urandom(32)
+    path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    if not _is_private(path.parent):
+        raise RuntimeError(f"daemon state directory {path.parent} is accessible to other users")
+    with Listener(authkey=authkey) as listener:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            json.dump({"address": listener.address, "authkey": authkey.hex(), "pid": os.getpid()}, f)
+        try:
+            while True:
+                try:
+                    conn = listener.accept()
+                except (OSError, AuthenticationError):
+                    # Failed handshake (wrong key, client gave up): keep serving.
+                    continue
+                with conn:
+                    try:
+                        msg = conn.recv()
+                    except (EOFError, OSError):
+                        continue
+                    if msg.get("op") == "stop":
+                        # Gone before the reply, so a ``daemon start``
+                        # that stopped us can write its own file safely.
+                        _remove_own_state(path)
+                        conn.send({"stopped": True})
+                        return
+                    with contextlib.suppress(OSError):
+                        conn.send(_run_cli(main, msg["argv"], msg["cwd"], msg.get("env")))
+        finally:
+            _remove_own_state(path)
@@ -2,15 +2,14 @@
 
 from __future__ import annotations
 
-import json
-import sys
-import traceback
+import time
 from typing import Any
 
 from mcp.server.fastmcp import FastMCP
 
+from wpf_agent import _jsonio
 from wpf_agent.core.errors import MultipleElementsFoundError, WpfAgentError
-from wpf_agent.core.target import ResolvedTarget, TargetRegistry
+from wpf_agent.core.target import ResolvedTarget, TargetRegistry, parse_shorthand
 from wpf_agent.uia.engine import UIAEngine
 from wpf_agent.uia.screenshot import capture_screenshot
 from wpf_agent.uia.selector import Selector
@@ -20,6 +19,18 @@ mcp = FastMCP("wpf-agent")
 
 # ── Helpers ───────────────────────────────────────────────────────
 
+# Back-to-back list_windows calls reuse the last response for this many
+# seconds.  Any tool that touches a target (and may open or close
+# windows) drops it first.
+LIST_WINDOWS_TTL = 0.5
+_windows_cache: tuple[float, str] | None = None
+
+
+def _invalidate_windows() -> None:
+    global _windows_cache
+    _windows_cache = None
+
+
 def _resolve_target(
     window_query: str | None = None, target_id: str | None = None
 ) -> ResolvedTarget:
@@ -31,64 +42,50 @@ def _resolve_target(
       - ``process:<name>``   — resolve by process name
       - ``title_re:<regex>`` — resolve by window title regex
     """
+    _invalidate_windows()
     registry = TargetRegistry.get_instance()
     if target_id:
         # Auto-resolve shorthand formats so callers can skip resolve_target
-        if target_id.startswith("pid:"):
-            pid = int(target_id.split(":", 1)[1])
-            _, t = registry.resolve({"pid": pid})
-            return t
-        if target_id.startswith("process:"):
-            name = target_id.split(":", 1)[1]
-            _, t = registry.resolve({"process": name})
-            return t
-        if target_id.startswith("title_re:"):
-            pattern = target_id.split(":", 1)[1]
-            _, t = registry.resolve({"title_re": pattern})
-            return t
-        return registry.get(target_id)
-    if window_query:
-        # Support same shorthand prefixes as target_id
-        if window_query.startswith("pid:"):
-            pid = int(window_query.split(":", 1)[1])
-            _, t = registry.resolve({"pid": pid})
-            return t
-        if window_query.startswith("process:"):
-            name = window_query.split(":", 1)[1]
-            _, t = registry.resolve({"process": name})
-            return t
-        if window_query.startswith("title_re:"):
-            pattern = window_query.split(":", 1)[1]
-            _, t = registry.resolve({"title_re": pattern})
-            return t
-        _, t = registry.resolve({"title_re": window_query})
-        return t
-    raise WpfAgentError("Provide window_query or target_id")
+        spec = parse_shorthand(target_id)
+        if spec is None:
+            return registry.get(target_id)
+    elif window_query:
+        # Same shorthand prefixes; anything else is a title regex
+        spec = parse_shorthand(window_query) or {"title_re": window_query}
+    else:
+        raise WpfAgentError("Provide window_query or target_id")
+    _, t = registry.resolve(spec)
+    return t
+
+
+_EMPTY_SELECTOR = Selector()
 
 
 def _to_selector(s: dict[str, Any] | None) -> Selector:
-    if s is None:
-        return Selector()
-    return Selector(**{k: v for k, v in s.items() if v is not None})
+    if not s:
+        return _EMPTY_SELECTOR
+    if None in s.values():
+        s = {k: v for k, v in s.items() if v is not None}
+    return Selector(**s)
 
 
 def _ok(data: Any) -> str:
-    return json.dumps({"success": True, "data": data}, ensure_ascii=False, default=str)
+    return _jsonio.dumps({"success": True, "data": data}, default=str)
 
 
 def _err(msg: str) -> str:
-    return json.dumps({"success": False, "error": msg}, ensure_ascii=False)
+    return _jsonio.dumps({"success": False, "error": msg})
 
 
 def _err_ambiguous(exc: MultipleElementsFoundError) -> str:
-    return json.dumps(
+    return _jsonio.dumps(
         {
             "success": False,
             "error": str(exc),
             "error_type": "multiple_elements",
             "candidates": exc.candidates,
         },
-        ensure_ascii=False,
+        default=str,
     )
 
 
@@ -97,11 +94,16 @@ def _err_ambiguous(exc: MultipleElementsFoundError) -> str:
 @mcp.tool()
 def list_windows() -> str:
     """List currently visible top-level windows."""
+    global _windows_cache
+    now = time.monotonic()
+    if _windows_cache is not None and now - _windows_cache[0] < LIST_WINDOWS_TTL:
+        return _windows_cache[1]
     try:
-        data = UIAEngine.list_windows()
-        return _ok(data)
+        response = _ok(UIAEngine.list_windows())
     except Exception as exc:
         return _err(str(exc))
+    _windows_cache = (now, response)
+    return response
 
 
 @mcp.tool()
@@ -114,6 +116,7 @@ def resolve_target(target_spec: dict) -> str:
       {"exe": "C:/path/MyApp.exe", "args": ["--dev"]}
       {"title_re": ".*MyApp.*"}
     """
+    _invalidate_windows()
     try:
         registry = TargetRegistry.get_instance()
         tid, t = registry.resolve(target_spec)
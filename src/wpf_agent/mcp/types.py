@@ -1,4 +1,9 @@
-"""Pydantic models for MCP tool arguments and responses."""
+"""Pydantic models for MCP tool arguments and responses.
+
+These describe the tool contract; they are not on the call path.
+FastMCP validates tool arguments from the signatures in ``server.py``,
+and responses are built there as plain dicts (``_ok`` / ``_err``).
+"""
 
 from __future__ import annotations
 
@@ -5,6 +5,7 @@ from __future__ import annotations
 import json
 import sys
 import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from typing import Any, Callable
 
 from wpf_agent.core.session import Session
@@ -38,12 +39,18 @@ class AgentLoop:
         self.logger = StepLogger(session)
         self.recorder = ActionRecorder(session)
         self._running = False
+        self._selectors: dict[str, Any] = {}
+        self._snapshot_writer: ThreadPoolExecutor | None = None
 
     def run(self, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
         """Execute a pre-planned list of actions (from AI or scenario)."""
         self.session.start()
         self.logger.open()
         self._running = True
+        # Writes each pre-step snapshot while that step's action runs.
+        self._snapshot_writer = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="wpf-agent-snapshot"
+        )
         results: list[dict[str, Any]] = []
 
         try:
@@ -70,7 +77,10 @@ class AgentLoop:
                 if self.step_delay_ms > 0:
                     time.sleep(self.step_delay_ms / 1000.0)
         finally:
+            # Also reached on Ctrl+C (KeyboardInterrupt).
+            self._snapshot_writer.shutdown(wait=True)
             self.recorder.save()
+            self.logger.checkpoint()
             self.logger.close()
             self._running = False
 
@@ -82,39 +92,52 @@ class AgentLoop:
     def _execute_step(
         self, step: int, action: str, args: dict[str, Any]
     ) -> dict[str, Any]:
-        from wpf_agent.runner.replay import _execute_action
+        from wpf_agent.runner.replay import run_action
 
-        # Capture pre-step snapshot
+        # Capture the pre-step snapshot here (it must show the UI before
+        # the action, and UIA objects belong to this thread's COM
+        # apartment); serializing and writing it overlaps the action.
+        snap_path = self.session.uia_snapshot_path(step)
+        saving: Future | None
         try:
             snap = capture_snapshot(self.target)
-            snap_path = self.session.uia_snapshot_path(step)
-            save_snapshot(snap, snap_path)
+            saving = self._snapshot_writer.submit(save_snapshot, snap, snap_path)
         except Exception:
-            snap_path = None
+            saving = None
 
         # Execute action
-        try:
-            result = _execute_action(self.target, action, args)
-            self.logger.log_step(
-                step, action, args,
-                result=result,
-                uia_snapshot_path=str(snap_path) if snap_path else None,
-            )
-            return {"step": step, "action": action, "result": result, "success": True}
-        except Exception as exc:
-            # Capture failure screenshot
+        ok, payload = run_action(self.target, action, args, self._selectors, self.session)
+
+        # The snapshot is on disk before the step is logged or reported.
+        if saving is not None:
             try:
-                ss_path = capture_screenshot(
-                    target=self.target,
-                    save_path=self.session.screenshot_path(step),
-                )
+                saving.result()
             except Exception:
-                ss_path = None
+                saving = None
+        if saving is None:
+            snap_path = None
 
+        if ok:
             self.logger.log_step(
                 step, action, args,
-                error=str(exc),
-                screenshot_path=str(ss_path) if ss_path else None,
+                result=payload,
                 uia_snapshot_path=str(snap_path) if snap_path else None,
             )
-            return {"step": step, "action": action, "error": str(exc), "success": False}
+            return {"step": step, "action": action, "result": payload, "success": True}
+
+        # Capture failure screenshot
+        try:
+            ss_path = capture_screenshot(
+                target=self.target,
+                save_path=self.session.screenshot_path(step),
+            )
+        except Exception:
+            ss_path = None
+
+        self.logger.log_step(
+            step, action, args,
+            error=payload,
+            screenshot_path=str(ss_path) if ss_path else None,
+            uia_snapshot_path=str(snap_path) if snap_path else None,
+        )
+        return {"step": step, "action": action, "error": payload, "success": False}
@@ -2,32 +2,144 @@
 
 from __future__ import annotations
 
-import json
+import os
 import pathlib
+import struct
 import sys
 import time
 from typing import Any
 
+from wpf_agent import _jsonio
 from wpf_agent.core.session import Session
 
 
+_TAIL_BLOCK = 64 * 1024
+
+
+def _tail_lines(path: pathlib.Path, n: int) -> list[bytes]:
+    """Last *n* non-empty lines of *path*, reading backwards in blocks."""
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        buf = b""
+        while pos > 0 and buf.count(b"\n") <= n:
+            step = min(_TAIL_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            buf = f.read(step) + buf
+    lines = [line for line in buf.splitlines() if line.strip()]
+    if pos > 0:
+        lines = lines[1:]  # the first line may be cut off mid-block
+    return lines[-n:] if n > 0 else []
+
+
+# Opt-in MessagePack step log (``WPF_AGENT_LOG_FORMAT=msgpack``): each
+# record is the packed entry followed by its length as a 4-byte
+# big-endian trailer, so the tail can be walked backwards record by record.
+_TRAILER = struct.Struct(">I")
+
+
+def _msgpack():
+    """The msgpack module if ``WPF_AGENT_LOG_FORMAT=msgpack`` and it is installed."""
+    if os.environ.get("WPF_AGENT_LOG_FORMAT") != "msgpack":
+        return None
+    try:
+        import msgpack
+    except ImportError:
+        return None
+    return msgpack
+
+
+def _tail_records(path: pathlib.Path, n: int) -> list[bytes]:
+    """Last *n* records of a trailer-framed msgpack log."""
+    records: list[bytes] = []
+    with open(path, "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos >= _TRAILER.size and len(records) < n:
+            f.seek(pos - _TRAILER.size)
+            (size,) = _TRAILER.unpack(f.read(_TRAILER.size))
+            start = pos - _TRAILER.size - size
+            if start < 0:
+                break  # torn or foreign data: keep what was read
+            f.seek(start)
+            records.append(f.read(size))
+            pos = start
+    records.reverse()
+    return records
+
+
+def _unpack_tail(msgpack, records: list[bytes]) -> list[dict[str, Any]]:
+    """Decode *records*, keeping only the newest run that decodes cleanly.
+
+    A torn or corrupt record (e.g. a write cut short by a crash) stops
+    the walk instead of raising; everything before it is unreachable
+    through the trailers anyway.
+    """
+    entries: list[dict[str, Any]] = []
+    for record in reversed(records):
+        try:
+            entry = msgpack.unpackb(record, raw=False)
+        except (ValueError, TypeError, msgpack.UnpackException):
+            break
+        if not isinstance(entry, dict):
+            break
+        entries.append(entry)
+    entries.reverse()
+    return entries
+
+
+def _echo_line(line: bytes) -> None:
+    """Write an encoded log line to stderr, bypassing the text layer
+    when there is a binary buffer underneath."""
+    err = sys.stderr
+    buf = getattr(err, "buffer", None)
+    if buf is None:
+        err.write(line.decode("utf-8"))
+        return
+    err.flush()  # keep order with text already written to stderr
+    buf.write(line)
+    buf.flush()
+
+
 class StepLogger:
-    """Append-only structured log for a session."""
+    """Append-only structured log for a session.
+
+    Each step is also echoed to stderr (the MCP server's log channel and
+    the CLI's progress output) unless ``WPF_AGENT_STEP_ECHO=0``.
+
+    Steps are JSON lines in ``runner.log``.  With
+    ``WPF_AGENT_LOG_FORMAT=msgpack`` (and msgpack installed) they are
+    written to ``runner.msgpack`` instead; ``read_last_n`` decodes
+    whichever the session has.
+    """
 
     def __init__(self, session: Session):
         self.session = session
-        self._log_path = session.log_path()
+        self._packer = _msgpack()
+        self._msgpack_path = session.log_path().with_suffix(".msgpack")
+        self._log_path = self._msgpack_path if self._packer else session.log_path()
         self._fh = None
+        self._echo = os.environ.get("WPF_AGENT_STEP_ECHO", "1") != "0"
 
     def open(self) -> None:
         self._log_path.parent.mkdir(parents=True, exist_ok=True)
-        self._fh = open(self._log_path, "a", encoding="utf-8")
+        # Unbuffered binary: each step is one write of already-encoded
+        # bytes, so evidence collection can read it while the run goes on.
+        self._fh = open(self._log_path, "ab", buffering=0)
 
     def close(self) -> None:
         if self._fh:
             self._fh.close()
             self._fh = None
 
+    def checkpoint(self) -> None:
+        """Force the steps written so far to disk (fsync).
+
+        Each step already reaches the OS as one write; this is for the
+        points where durability matters, e.g. the end of a run.
+        """
+        if self._fh:
+            os.fsync(self._fh.fileno())
+
     def log_step(
         self,
         step: int,
@@ -48,44 +160,101 @@ class StepLogger:
             "screenshot": screenshot_path,
             "uia_snapshot": uia_snapshot_path,
         }
-        line = json.dumps(entry, ensure_ascii=False, default=str)
+        if self._packer is not None:
+            if self._fh:
+                packed = self._packer.packb(entry, use_bin_type=True, default=str)
+                self._fh.write(packed + _TRAILER.pack(len(packed)))
+            if self._echo:
+                _echo_line(_jsonio.dumps_line(entry, default=str))
+            return
+        line = _jsonio.dumps_line(entry, default=str)
         if self._fh:
-            self._fh.write(line + "\n")
-            self._fh.flush()
-        # In MCP mode, log to stderr
-        print(line, file=sys.stderr)
+            self._fh.write(line)
+        if self._echo:
+            _echo_line(line)
 
     def read_last_n(self, n: int = 20) -> list[dict[str, Any]]:
-        if not self._log_path.exists():
+        if n <= 0:
             return []
-        lines = self._log_path.read_text(encoding="utf-8").strip().splitlines()
-        return [json.loads(l) for l in lines[-n:]]
+        if self._msgpack_path.is_file():
+            try:
+                import msgpack
+            except ImportError:
+                # Written with the ``fast`` extra; unreadable here, so
+                # treat the log as missing rather than failing the reader.
+                return []
+            return _unpack_tail(msgpack, _tail_records(self._msgpack_path, n))
+        try:
+            lines = _tail_lines(self.session.log_path(), n)
+        except FileNotFoundError:
+            return []
+        return [_jsonio.loads(line) for line in lines]
+
+
+def write_actions_json(src: pathlib.Path, dest: pathlib.Path) -> None:
+    """Transcode an actions JSONL log into the JSON array replay reads.
+
+    Streams line by line: one action per line inside ``[`` ... ``]``.
+    """
+    dest.parent.mkdir(parents=True, exist_ok=True)
+    with open(dest, "wb") as out:
+        out.write(b"[")
+        sep = b"\n"
+        try:
+            with open(src, "rb") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        out.write(sep + line)
+                        sep = b",\n"
+        except FileNotFoundError:
+            pass
+        out.write(b"\n]\n" if sep != b"\n" else b"]\n")
 
 
 class ActionRecorder:
-    """Record actions for replay."""
+    """Record actions for replay.
+
+    Each action is appended to ``actions.jsonl`` as it is recorded, so a
+    crashed run keeps its actions; ``save()`` writes ``actions.json``.
+    """
 
     def __init__(self, session: Session):
         self.session = session
-        self._actions: list[dict[str, Any]] = []
+        self._log_path = session.actions_log_path()
+        self._fh = None
+        self._count = 0
 
     def record(self, action: str, args: dict[str, Any]) -> None:
-        self._actions.append({
-            "step": len(self._actions) + 1,
+        if self._fh is None:
+            self._log_path.parent.mkdir(parents=True, exist_ok=True)
+            # Append after a save() so later saves keep the earlier actions.
+            mode = "ab" if self._count else "wb"
+            self._fh = open(self._log_path, mode, buffering=0)
+        self._count += 1
+        entry = {
+            "step": self._count,
             "action": action,
             "args": args,
             "timestamp": time.time(),
-        })
+        }
+        self._fh.write(_jsonio.dumps_line(entry, default=str))
 
     def save(self) -> pathlib.Path:
+        if self._fh is not None:
+            self._fh.close()
+            self._fh = None
         path = self.session.actions_path()
-        path.parent.mkdir(parents=True, exist_ok=True)
-        path.write_text(
-            json.dumps(self._actions, indent=2, ensure_ascii=False, default=str),
-            encoding="utf-8",
-        )
+        if self._count:
+            write_actions_json(self._log_path, path)
+        else:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(b"[]")
         return path
 
     @property
     def actions(self) -> list[dict[str, Any]]:
-        return list(self._actions)
+        if self._count == 0:
+            return []
+        with open(self._log_path, "rb") as f:
+            return [_jsonio.loads(line) for line in f if line.strip()]
@@ -36,6 +36,8 @@ def replay_actions(
     logger = StepLogger(session)
     logger.open()
     results = []
+    # Recorded sequences repeat the same few selectors; build each once.
+    selectors: dict[str, Selector] = {}
 
     try:
         for i, action_rec in enumerate(actions):
@@ -43,13 +45,13 @@ def replay_actions(
             action = action_rec["action"]
             args = action_rec.get("args", {})
 
-            try:
-                result = _execute_action(target, action, args)
-                logger.log_step(step, action, args, result=result)
-                results.append({"step": step, "action": action, "result": result})
-            except Exception as exc:
-                logger.log_step(step, action, args, error=str(exc))
-                results.append({"step": step, "action": action, "error": str(exc)})
+            ok, payload = run_action(target, action, args, selectors, session)
+            if ok:
+                logger.log_step(step, action, args, result=payload)
+                results.append({"step": step, "action": action, "result": payload})
+            else:
+                logger.log_step(step, action, args, error=payload)
+                results.append({"step": step, "action": action, "error": payload})
 
             if step_delay_ms > 0:
                 time.sleep(step_delay_ms / 1000.0)
@@ -59,13 +61,46 @@ def replay_actions(
     return results
 
 
+def run_action(
+    target: ResolvedTarget,
+    action: str,
+    args: dict[str, Any],
+    selectors: dict[str, Selector],
+    session: Session,
+) -> tuple[bool, Any]:
+    """Execute one action: ``(True, result)`` or ``(False, error message)``.
+
+    The one place a failed step becomes data, shared by replay and the
+    agent loop.
+    """
+    try:
+        selector = _selector_for(args.get("selector"), selectors)
+        return True, _execute_action(target, action, args, selector, session)
+    except Exception as exc:
+        return False, str(exc)
+
+
+def _selector_for(
+    selector_data: dict[str, Any] | None, cache: dict[str, Selector]
+) -> Selector | None:
+    """Return the Selector for *selector_data*, reusing one built earlier."""
+    if not selector_data:
+        return None
+    key = json.dumps(selector_data, sort_keys=True, default=str)
+    selector = cache.get(key)
+    if selector is None:
+        selector = cache[key] = Selector(**selector_data)
+    return selector
+
+
 def _execute_action(
-    target: ResolvedTarget, action: str, args: dict[str, Any]
+    target: ResolvedTarget,
+    action: str,
+    args: dict[str, Any],
+    selector: Selector | None,
+    session: Session,
 ) -> dict[str, Any]:
     """Execute a single action."""
-    selector_data = args.get("selector")
-    selector = Selector(**selector_data) if selector_data else None
-
     if action == "click":
         if selector is None:
             raise ReplayError("click requires a selector")
@@ -0,0 +1,21 @@
+"""Cached YAML loading for scenario and test-config files."""
+
+from __future__ import annotations
+
+import copy
+import functools
+import pathlib
+from typing import Any
+
+
+@functools.lru_cache(maxsize=32)
+def _parse(path: str, mtime_ns: int, size: int) -> Any:
+    import yaml
+
+    return yaml.safe_load(pathlib.Path(path).read_text(encoding="utf-8"))
+
+
+def load_yaml(path: pathlib.Path) -> Any:
+    """Parse *path* once per (mtime, size) and return a private copy."""
+    st = path.stat()
+    return copy.deepcopy(_parse(str(path.resolve()), st.st_mtime_ns, st.st_size))
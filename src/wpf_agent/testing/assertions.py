@@ -2,11 +2,10 @@
 
 from __future__ import annotations
 
-import re
 from typing import Any
 
 from wpf_agent.core.errors import ScenarioError
-from wpf_agent.core.target import ResolvedTarget
+from wpf_agent.core.target import ResolvedTarget, compile_pattern
 from wpf_agent.uia.engine import UIAEngine, _find_element
 from wpf_agent.uia.selector import Selector
 
@@ -101,7 +100,7 @@ def check_assertion(
 
         if assertion_type == "regex":
             actual = elem.window_text()
-            ok = bool(re.search(expected, actual))
+            ok = compile_pattern(expected).search(actual) is not None
             return AssertionResult(
                 ok,
                 f"regex: pattern={expected!r} text={actual!r}",
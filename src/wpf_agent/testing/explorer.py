@@ -9,13 +9,12 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import yaml
-
 from wpf_agent.config import SafetyConfig
 from wpf_agent.core.safety import is_destructive
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import ResolvedTarget
 from wpf_agent.runner.logging import ActionRecorder, StepLogger
+from wpf_agent.testing._yamlio import load_yaml
 from wpf_agent.testing.oracles import run_all_oracles
 from wpf_agent.uia.engine import UIAEngine
 from wpf_agent.uia.screenshot import capture_screenshot
@@ -38,7 +37,7 @@ class ExploreConfig:
     @classmethod
     def from_file(cls, path: pathlib.Path) -> ExploreConfig:
         """Load ExploreConfig from a YAML file."""
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = load_yaml(path)
 
         safety = SafetyConfig()
         if "safety" in raw:
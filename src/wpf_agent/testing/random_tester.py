@@ -8,14 +8,13 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import yaml
-
 from wpf_agent.config import SafetyConfig
 from wpf_agent.core.errors import SafetyViolationError
 from wpf_agent.core.safety import is_destructive
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import ResolvedTarget
 from wpf_agent.runner.logging import ActionRecorder, StepLogger
+from wpf_agent.testing._yamlio import load_yaml
 from wpf_agent.testing.oracles import OracleVerdict, run_all_oracles
 from wpf_agent.uia.engine import UIAEngine
 from wpf_agent.uia.screenshot import capture_screenshot
@@ -48,7 +47,7 @@ class RandomConfig:
     @classmethod
     def from_file(cls, path: pathlib.Path) -> RandomConfig:
         """Load RandomConfig from a YAML file."""
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = load_yaml(path)
 
         action_space = ActionSpace()
         if "action_space" in raw and "actions" in raw["action_space"]:
@@ -7,13 +7,12 @@ import time
 from dataclasses import dataclass, field
 from typing import Any
 
-import yaml
-
 from wpf_agent.config import ProfileStore
 from wpf_agent.core.errors import ScenarioError
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import ResolvedTarget, TargetRegistry
 from wpf_agent.runner.logging import ActionRecorder, StepLogger
+from wpf_agent.testing._yamlio import load_yaml
 from wpf_agent.testing.assertions import AssertionResult, check_assertion
 from wpf_agent.testing.oracles import run_all_oracles
 from wpf_agent.uia.engine import UIAEngine
@@ -42,7 +41,7 @@ class Scenario:
 
     @classmethod
     def from_file(cls, path: pathlib.Path) -> Scenario:
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = load_yaml(path)
         steps = []
         for s in raw.get("steps", []):
             steps.append(ScenarioStep(
@@ -85,7 +84,7 @@ def run_scenario(
     if target is None:
         registry = TargetRegistry.get_instance()
         if scenario.profile:
-            store = ProfileStore()
+            store = ProfileStore.get_instance()
             profile = store.get(scenario.profile)
             if profile is None:
                 raise ScenarioError(f"Profile '{scenario.profile}' not found")
@@ -4,23 +4,24 @@ from __future__ import annotations
 
 import json
 import pathlib
-import subprocess
 import time
 from dataclasses import dataclass, field
 from typing import Any
 
 import psutil
-import yaml
 
 from wpf_agent.core.errors import SelectorNotFoundError, TargetNotFoundError
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import (
     ResolvedTarget,
     TargetRegistry,
+    pid_alive,
     record_launched_pid,
     remove_launched_pid,
+    spawn_app,
 )
 from wpf_agent.runner.logging import StepLogger
+from wpf_agent.testing._yamlio import load_yaml
 from wpf_agent.testing.assertions import AssertionResult, check_assertion
 from wpf_agent.testing.oracles import (
     check_error_dialogs,
@@ -52,7 +53,7 @@ class VerifyConfig:
     @classmethod
     def from_file(cls, path: pathlib.Path) -> VerifyConfig:
         """Load from a verification-spec YAML file."""
-        raw = yaml.safe_load(path.read_text(encoding="utf-8"))
+        raw = load_yaml(path)
         app = raw.get("app", {})
         return cls(
             exe=app.get("exe", ""),
@@ -121,7 +122,7 @@ def run_verify(
         pid = _launch_app(config.exe, config.args, config.cwd)
         time.sleep(config.startup_wait_ms / 1000.0)
 
-        alive = psutil.pid_exists(pid)
+        alive = pid_alive(pid)
         checks.append(VerifyCheck(
             name="app_launches",
             passed=alive,
@@ -202,7 +203,7 @@ def _build_result(
 def _launch_app(exe: str, args: list[str], cwd: str | None) -> int:
     """Start the application and return its PID."""
     cmd = [exe] + args
-    proc = subprocess.Popen(cmd, cwd=cwd)
+    proc = spawn_app(cmd, cwd)
     record_launched_pid(proc.pid, exe)
     return proc.pid
 
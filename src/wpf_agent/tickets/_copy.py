@@ -0,0 +1,54 @@
+"""Copy evidence files and write ticket files on a small thread pool."""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, Mapping
+
+_MAX_WORKERS = 8
+
+
+def _copy_one(src: pathlib.Path, dst: pathlib.Path) -> None:
+    # copyfile uses the platform fast path (sendfile / CopyFile2);
+    # copystat restores the rest of copy2's semantics.
+    shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def copy_into(sources: Iterable[str | os.PathLike], dest_dir: pathlib.Path) -> list[str]:
+    """Copy each existing file in *sources* into *dest_dir*, keeping its name.
+
+    Missing sources are skipped.  When two sources share a name the later
+    one wins, as with sequential copies.  *dest_dir* is created only if
+    something is copied.  Returns the copied names, sorted.
+    """
+    by_name: dict[str, pathlib.Path] = {}
+    for s in sources:
+        src = pathlib.Path(s)
+        if src.is_file():
+            by_name[src.name] = src
+    if not by_name:
+        return []
+
+    dest_dir.mkdir(parents=True, exist_ok=True)
+    if len(by_name) == 1:
+        (name, src), = by_name.items()
+        _copy_one(src, dest_dir / name)
+    else:
+        with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(by_name))) as ex:
+            # list() re-raises the first copy error, as the old loop did.
+            list(ex.map(lambda item: _copy_one(item[1], dest_dir / item[0]), by_name.items()))
+    return sorted(by_name)
+
+
+def write_files(files: Mapping[pathlib.Path, bytes]) -> None:
+    """Write each payload in *files* to its path, overlapping the writes."""
+    if len(files) <= 1:
+        for path, data in files.items():
+            path.write_bytes(data)
+        return
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(files))) as ex:
+        list(ex.map(lambda item: item[0].write_bytes(item[1]), files.items()))
@@ -0,0 +1,36 @@
+"""Ticket timestamps and collision-free ticket directory names."""
+
+from __future__ import annotations
+
+import datetime
+import pathlib
+import time
+from typing import Callable
+
+
+def dir_stamp(clock: Callable[[], float] = time.time) -> str:
+    """Local time as ``YYYYmmdd-HHMMSS`` for ticket directory names."""
+    return datetime.datetime.fromtimestamp(clock()).strftime("%Y%m%d-%H%M%S")
+
+
+def iso_stamp(clock: Callable[[], float] = time.time) -> str:
+    """Local time as ``YYYY-mm-ddTHH:MM:SS``."""
+    return datetime.datetime.fromtimestamp(clock()).isoformat(timespec="seconds")
+
+
+def make_ticket_dir(parent: pathlib.Path, name: str) -> pathlib.Path:
+    """Create and return a new ``parent/name`` directory.
+
+    Tickets named from the same second would otherwise share (and
+    overwrite) one directory; later ones get a ``-2``, ``-3``... suffix.
+    """
+    parent.mkdir(parents=True, exist_ok=True)
+    candidate = parent / name
+    n = 1
+    while True:
+        try:
+            candidate.mkdir()
+            return candidate
+        except FileExistsError:
+            n += 1
+            candidate = parent / f"{name}-{n}"
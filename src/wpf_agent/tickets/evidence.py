@@ -2,16 +2,16 @@
 
 from __future__ import annotations
 
-import json
 import pathlib
-import shutil
 from typing import Any
 
+from wpf_agent import _jsonio
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import ResolvedTarget
 from wpf_agent.runner.logging import StepLogger
 from wpf_agent.uia.screenshot import capture_screenshot
 from wpf_agent.uia.snapshot import capture_snapshot, diff_snapshots, load_snapshot, save_snapshot
+from wpf_agent.tickets._copy import copy_into
 
 
 def collect_evidence(
@@ -81,28 +81,15 @@ def package_evidence(
     screens_dir.mkdir(parents=True, exist_ok=True)
     uia_dir.mkdir(parents=True, exist_ok=True)
 
-    for ss in evidence.get("screenshots", []):
-        src = pathlib.Path(ss)
-        if src.exists():
-            shutil.copy2(src, screens_dir / src.name)
-
-    for snap in evidence.get("uia_snapshots", []):
-        src = pathlib.Path(snap)
-        if src.exists():
-            shutil.copy2(src, uia_dir / src.name)
+    copy_into(evidence.get("screenshots", []), screens_dir)
+    copy_into(evidence.get("uia_snapshots", []), uia_dir)
 
     # Save runner log
     if evidence.get("recent_logs"):
         log_path = ticket_dir / "runner.log"
-        log_path.write_text(
-            json.dumps(evidence["recent_logs"], indent=2, ensure_ascii=False, default=str),
-            encoding="utf-8",
-        )
+        log_path.write_bytes(_jsonio.dumps_pretty(evidence["recent_logs"], default=str))
 
     # Save UIA diff
     if evidence.get("uia_diff"):
         diff_path = uia_dir / "diff.json"
-        diff_path.write_text(
-            json.dumps(evidence["uia_diff"], indent=2, ensure_ascii=False, default=str),
-            encoding="utf-8",
-        )
+        diff_path.write_bytes(_jsonio.dumps_pretty(evidence["uia_diff"], default=str))
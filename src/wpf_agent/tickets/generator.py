@@ -2,15 +2,17 @@
 
 from __future__ import annotations
 
-import json
 import pathlib
-import time
 from typing import Any
 
+from wpf_agent import _jsonio
 from wpf_agent.constants import TICKET_DIR
 from wpf_agent.core.session import Session
 from wpf_agent.core.target import ResolvedTarget
+from wpf_agent.runner.logging import write_actions_json
 from wpf_agent.tickets.evidence import collect_evidence, package_evidence
+from wpf_agent.tickets._stamp import dir_stamp, make_ticket_dir
+from wpf_agent.tickets.index import record_ticket
 from wpf_agent.tickets.templates import default_environment, render_ticket_md
 
 
@@ -32,11 +34,11 @@ def generate_ticket(
 
     Returns the path to the ticket directory.
     """
-    timestamp = time.strftime("%Y%m%d-%H%M%S")
+    timestamp = dir_stamp()
     short_id = session.session_id[:8]
-    ticket_name = f"TICKET-{timestamp}-{short_id}"
-    ticket_dir = pathlib.Path(TICKET_DIR) / session.session_id / ticket_name
-    ticket_dir.mkdir(parents=True, exist_ok=True)
+    ticket_dir = make_ticket_dir(
+        pathlib.Path(TICKET_DIR) / session.session_id, f"TICKET-{timestamp}-{short_id}"
+    )
 
     # Collect and package evidence
     evidence = collect_evidence(session, target, failure_step=failure_step)
@@ -74,11 +76,13 @@ def generate_ticket(
     )
     (ticket_dir / "ticket.md").write_text(md, encoding="utf-8")
 
-    # Save repro.actions.json
+    # Save repro.actions.json (mid-run, from the live actions log)
     actions_src = session.actions_path()
     if actions_src.exists():
         import shutil
         shutil.copy2(actions_src, ticket_dir / "repro.actions.json")
+    elif session.actions_log_path().exists():
+        write_actions_json(session.actions_log_path(), ticket_dir / "repro.actions.json")
 
     # Save ticket.json (machine-readable)
     ticket_json = {
@@ -93,10 +97,10 @@ def generate_ticket(
         "session_id": session.session_id,
         "timestamp": timestamp,
     }
-    (ticket_dir / "ticket.json").write_text(
-        json.dumps(ticket_json, indent=2, ensure_ascii=False, default=str),
-        encoding="utf-8",
+    (ticket_dir / "ticket.json").write_bytes(
+        _jsonio.dumps_pretty(ticket_json, default=str)
     )
+    record_ticket(TICKET_DIR, ticket_dir, session.session_id)
 
     return ticket_dir
 
@@ -0,0 +1,81 @@
+"""Append-only ticket manifest (``<TICKET_DIR>/.index.jsonl``).
+
+Each created ticket appends one JSON line ``{"path", "session", "ts"}``,
+so lookups read the manifest instead of walking the ticket tree.  The
+manifest is only an index: a missing or unreadable one means "walk the
+tree", and entries whose directory has since been triaged into
+``fix/`` or ``wontfix/`` are followed there.
+"""
+
+from __future__ import annotations
+
+import os
+import pathlib
+import time
+from typing import Any, Iterator
+
+from wpf_agent import _jsonio
+
+INDEX_NAME = ".index.jsonl"
+_TRIAGE_DIRS = ("fix", "wontfix")
+_BLOCK = 4096
+
+
+def index_path(base: str | pathlib.Path) -> pathlib.Path:
+    return pathlib.Path(base) / INDEX_NAME
+
+
+def record_ticket(base: str | pathlib.Path, ticket_dir: pathlib.Path, session_id: str = "") -> None:
+    """Append *ticket_dir* to the manifest under *base* (best effort)."""
+    entry = {"path": str(ticket_dir), "session": session_id, "ts": time.time()}
+    line = _jsonio.dumps_line(entry)
+    try:
+        with open(index_path(base), "ab") as f:
+            f.write(line)
+    except OSError:
+        pass
+
+
+def locate(base: str | pathlib.Path, entry: dict[str, Any]) -> pathlib.Path | None:
+    """Return the current ticket.md for *entry*, following triage moves."""
+    # Plain string joins: this runs for every manifest entry scanned.
+    md = os.path.join(entry["path"], "ticket.md")
+    if os.path.isfile(md):
+        return pathlib.Path(md)
+    name = os.path.basename(os.path.normpath(entry["path"]))
+    for d in _TRIAGE_DIRS:
+        moved = os.path.join(base, d, name, "ticket.md")
+        if os.path.isfile(moved):
+            return pathlib.Path(moved)
+    return None
+
+
+def _parse(line: bytes) -> dict[str, Any] | None:
+    try:
+        entry = _jsonio.loads(line)
+    except ValueError:
+        return None
+    return entry if isinstance(entry, dict) and "path" in entry else None
+
+
+def iter_entries_reversed(base: str | pathlib.Path) -> Iterator[dict[str, Any]]:
+    """Yield manifest entries newest first, reading the file from the end.
+
+    Malformed lines are skipped.
+    """
+    with open(index_path(base), "rb") as f:
+        pos = f.seek(0, os.SEEK_END)
+        tail = b""
+        while pos > 0:
+            step = min(_BLOCK, pos)
+            pos -= step
+            f.seek(pos)
+            lines = (f.read(step) + tail).split(b"\n")
+            tail = lines.pop(0)
+            for line in reversed(lines):
+                entry = _parse(line)
+                if entry is not None:
+                    yield entry
+        entry = _parse(tail)
+        if entry is not None:
+            yield entry
@@ -26,17 +26,28 @@ class UIAEngine:
     # ------------------------------------------------------------------
 
     @staticmethod
-    def list_windows() -> list[dict[str, Any]]:
+    def list_windows(visible_only: bool = False) -> list[dict[str, Any]]:
+        """List top-level windows.
+
+        With *visible_only*, hidden and untitled windows are skipped before
+        their remaining properties are queried.
+        """
         desktop = Desktop(backend="uia")
         results = []
         for w in desktop.windows():
             try:
+                visible = w.is_visible()
+                if visible_only and not visible:
+                    continue
+                title = w.window_text()
+                if visible_only and not title.strip():
+                    continue
                 results.append({
-                    "title": w.window_text(),
+                    "title": title,
                     "pid": w.process_id(),
                     "handle": w.handle,
                     "control_type": w.element_info.control_type,
-                    "visible": w.is_visible(),
+                    "visible": visible,
                     "rect": _rect_dict(w.rectangle()),
                 })
             except Exception:
@@ -77,16 +88,8 @@ class UIAEngine:
         controls: list[dict[str, Any]] = []
         _walk(win, controls, depth=depth, current=0, filter_type=filter_type)
         if search:
-            queries = [s.strip().lower() for s in search.split(",") if s.strip()]
-            controls = [
-                c for c in controls
-                if any(
-                    q in (c.get("automation_id") or "").lower()
-                    or q in (c.get("name") or "").lower()
-                    or q in (c.get("value") or "").lower()
-                    for q in queries
-                )
-            ]
+            queries = [s.strip().casefold() for s in search.split(",") if s.strip()]
+            controls = [c for c in controls if _matches_search(c, queries)]
         return controls[:MAX_CONTROLS]
 
     # ------------------------------------------------------------------
@@ -399,6 +402,16 @@ def _enumerate_candidates(
     return results
 
 
+def _matches_search(control: dict[str, Any], queries: list[str]) -> bool:
+    """True if any casefolded query is a substring of aid, name or value."""
+    haystack = "\0".join((
+        (control.get("automation_id") or "").casefold(),
+        (control.get("name") or "").casefold(),
+        (control.get("value") or "").casefold(),
+    ))
+    return any(q in haystack for q in queries)
+
+
 def _walk(
     elem: UIAWrapper,
     out: list[dict[str, Any]],
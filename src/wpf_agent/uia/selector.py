@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from typing import Any, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class Selector(BaseModel):
@@ -14,7 +14,12 @@ class Selector(BaseModel):
     1. automation_id (most reliable)
     2. name + control_type
     3. bounding_rect center click (last resort)
+
+    Immutable, so one instance can be shared (the MCP server's empty
+    selector, replay's per-run selector cache).
     """
+    model_config = ConfigDict(frozen=True)
+
     automation_id: Optional[str] = None
     name: Optional[str] = None
     control_type: Optional[str] = None
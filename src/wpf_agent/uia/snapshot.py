@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-import json
 import pathlib
 from typing import Any
 
+from wpf_agent import _jsonio
 from wpf_agent.constants import DEFAULT_DEPTH, MAX_CONTROLS
 from wpf_agent.core.target import ResolvedTarget
 
@@ -21,11 +21,11 @@ def capture_snapshot(
 
 def save_snapshot(snapshot: list[dict[str, Any]], path: pathlib.Path) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(json.dumps(snapshot, indent=2, ensure_ascii=False), encoding="utf-8")
+    path.write_bytes(_jsonio.dumps_pretty(snapshot))
 
 
 def load_snapshot(path: pathlib.Path) -> list[dict[str, Any]]:
-    return json.loads(path.read_text(encoding="utf-8"))
+    return _jsonio.loads(path.read_bytes())
 
 
 def diff_snapshots(
@@ -0,0 +1,199 @@
+"""Tests for the CLI command registry and command helpers."""
+
+import json
+import pathlib
+
+import click
+
+from wpf_agent.cli import _COMMANDS, _HELP, LazyGroup, main
+
+
+def test_main_is_lazy_group():
+    assert isinstance(main, LazyGroup)
+    ctx = click.Context(main)
+    assert main.list_commands(ctx) == sorted(_COMMANDS)
+
+
+def test_all_registered_commands_load():
+    ctx = click.Context(main)
+    for name in _COMMANDS:
+        cmd = main.get_command(ctx, name)
+        assert isinstance(cmd, click.Command)
+        assert cmd.name == name
+
+
+def test_unknown_command_returns_none():
+    ctx = click.Context(main)
+    assert main.get_command(ctx, "no-such-command") is None
+
+
+def test_fast_help_lists_registered_commands():
+    from wpf_agent.__main__ import _HELP
+
+    section = _HELP.split("Commands:\n", 1)[1]
+    names = [line.split()[0] for line in section.splitlines() if line.strip()]
+    assert names == sorted(_COMMANDS)
+
+
+def test_fast_path_version(capsys):
+    from wpf_agent import __version__
+    from wpf_agent.__main__ import _fast_path
+
+    assert _fast_path(["-V"]) is True
+    assert __version__ in capsys.readouterr().out
+    assert _fast_path(["ui", "--help"]) is False
+
+
+def test_brief_alive_pid_parsing():
+    from wpf_agent.__main__ import _brief_alive_pid, _fast_path
+
+    assert _brief_alive_pid(["--pid", "42", "--brief"]) == 42
+    assert _brief_alive_pid(["--brief", "--pid", "42"]) == 42
+    assert _brief_alive_pid(["--pid=42", "--brief"]) == 42
+    assert _brief_alive_pid(["--pid", "42"]) is None
+    assert _brief_alive_pid(["--process", "App", "--brief"]) is None
+    assert _fast_path([]) is False
+
+
+def test_profile_store_shared_within_invocation():
+    from wpf_agent.cli._common import profile_store
+
+    with click.Context(main) as ctx:
+        ctx.ensure_object(dict)
+        with click.Context(click.Command("sub"), parent=ctx):
+            assert profile_store() is profile_store()
+
+
+def test_iter_tickets_finds_one_and_two_level_layouts(tmp_path):
+    from wpf_agent.cli.cmds.tickets import _iter_tickets
+
+    for rel in ("TICKET-a", "sess/TICKET-b", "fix/TICKET-c"):
+        d = tmp_path / rel
+        d.mkdir(parents=True)
+        (d / "ticket.md").write_text("#", encoding="utf-8")
+    (tmp_path / "a" / "b" / "TICKET-too-deep").mkdir(parents=True)
+    (tmp_path / "a" / "b" / "TICKET-too-deep" / "ticket.md").write_text("#")
+
+    found = sorted(pathlib.Path(p).parent.name for p, _ in _iter_tickets(tmp_path))
+    assert found == ["TICKET-a", "TICKET-b", "TICKET-c"]
+
+
+def test_static_help_matches_command_docstrings():
+    from wpf_agent.cli.cmds.ui import _UI_COMMANDS, _UI_HELP, ui_cmd
+
+    for group, table, help_table in ((main, _COMMANDS, _HELP), (ui_cmd, _UI_COMMANDS, _UI_HELP)):
+        assert set(help_table) == set(table)
+        ctx = click.Context(group)
+        for name, text in help_table.items():
+            cmd = group.get_command(ctx, name)
+            assert cmd.get_short_help_str(limit=200) == text, name
+
+
+def test_all_ui_subcommands_load():
+    from wpf_agent.cli.cmds.ui import _UI_COMMANDS, ui_cmd
+
+    ctx = click.Context(ui_cmd)
+    assert ui_cmd.list_commands(ctx) == sorted(_UI_COMMANDS)
+    for name in _UI_COMMANDS:
+        cmd = ui_cmd.get_command(ctx, name)
+        assert isinstance(cmd, click.Command)
+        assert cmd.name == name
+
+
+def test_verify_split_args_keeps_quoted_windows_paths():
+    from wpf_agent.cli.cmds.verify import _split_args
+
+    assert _split_args(r'"C:\Program Files\data.db" --mode fast') == [
+        r"C:\Program Files\data.db", "--mode", "fast",
+    ]
+    assert _split_args("") == []
+
+
+def test_bundled_skills_lists_dirs_with_skill_md(tmp_path):
+    from wpf_agent.cli.cmds.install_skills import _bundled_skills
+
+    for name in ("wpf-ui", "wpf-setup", "no-md"):
+        (tmp_path / name).mkdir()
+    (tmp_path / "wpf-ui" / "SKILL.md").write_text("ui", encoding="utf-8")
+    (tmp_path / "wpf-setup" / "SKILL.md").write_text("setup", encoding="utf-8")
+    (tmp_path / "README.md").write_text("x", encoding="utf-8")
+
+    found = _bundled_skills(tmp_path)
+    assert [name for name, _ in found] == ["wpf-setup", "wpf-ui"]
+    assert found[1][1].read_text(encoding="utf-8") == "ui"
+
+
+def test_control_filter_combines_all_filters():
+    from wpf_agent.cli.cmds.ui.query import _control_filter
+
+    controls = [
+        {"control_type": "Button", "name": "Save File", "automation_id": "SaveBtn"},
+        {"control_type": "Button", "name": "", "automation_id": "HiddenBtn"},
+        {"control_type": "Edit", "name": "Save path", "automation_id": ""},
+        {"control_type": "Text", "name": None, "automation_id": None},
+    ]
+    assert _control_filter(None, None, None, False, False) is None
+
+    keep = _control_filter("Button, Edit", "save", None, True, False)
+    assert [c["automation_id"] for c in controls if keep(c)] == ["SaveBtn", ""]
+
+    keep = _control_filter(None, None, "btn", False, True)
+    assert [c["automation_id"] for c in controls if keep(c)] == ["SaveBtn", "HiddenBtn"]
+
+
+def test_update_claude_md_large_file_matches_small_path(tmp_path, monkeypatch):
+    from wpf_agent.cli.cmds import install_skills as mod
+
+    monkeypatch.setattr(mod, "_load_snippet", lambda: f"{mod._MARKER_START}\nnew\n{mod._MARKER_END}\n")
+    filler = "line\n" * 20000
+    cases = {
+        "append": filler + "\n\n",
+        "update": f"top\n{mod._MARKER_START}\nold\n{mod._MARKER_END}\n" + filler,
+    }
+    for name, content in cases.items():
+        results = []
+        for threshold in (10**9, 1):
+            d = tmp_path / f"{name}-{threshold}"
+            d.mkdir()
+            (d / "CLAUDE.md").write_bytes(content.encode("utf-8"))
+            monkeypatch.setattr(mod, "_MMAP_THRESHOLD", threshold)
+            mod._update_claude_md(d, skip_confirm=True)
+            results.append((d / "CLAUDE.md").read_bytes())
+        assert results[0] == results[1], name
+
+
+def test_untriaged_ticket_jsons_skips_triage_dirs(tmp_path):
+    from wpf_agent.cli.cmds.tickets import _untriaged_ticket_jsons
+
+    for rel in ("TICKET-1", "sess/TICKET-2", "fix/TICKET-3", "wontfix/TICKET-4", "sess/fix/TICKET-5"):
+        d = tmp_path / rel
+        d.mkdir(parents=True)
+        (d / "ticket.json").write_text("{}", encoding="utf-8")
+
+    found = [pathlib.Path(p).relative_to(tmp_path).parent.as_posix() for p in _untriaged_ticket_jsons(tmp_path)]
+    assert found == ["TICKET-1", "sess/TICKET-2", "sess/fix/TICKET-5"]
+
+
+def test_load_pending_skips_triaged_without_false_positives(tmp_path):
+    from wpf_agent.cli.cmds.tickets import _load_pending
+
+    triaged = tmp_path / "a.json"
+    triaged.write_text(json.dumps({"title": "a", "triage": {"decision": "fix"}}), encoding="utf-8")
+    assert _load_pending(str(triaged)) is None
+
+    mention = tmp_path / "b.json"
+    mention.write_text(json.dumps({"title": 'needs "triage" "decision"', "summary": "s"}), encoding="utf-8")
+    assert _load_pending(str(mention)) == {
+        "path": str(tmp_path), "title": 'needs "triage" "decision"', "summary": "s", "timestamp": "",
+    }
+
+
+def test_shell_complete_does_not_import_commands():
+    import sys
+
+    ctx = click.Context(main)
+    sys.modules.pop("wpf_agent.cli.cmds.verify", None)
+    items = main.shell_complete(ctx, "ve")
+    assert [i.value for i in items] == ["verify"]
+    assert items[0].help == _HELP["verify"]
+    assert "wpf_agent.cli.cmds.verify" not in sys.modules
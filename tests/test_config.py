@@ -4,6 +4,8 @@ import json
 import pathlib
 import tempfile
 
+import pytest
+
 from wpf_agent.config import (
     Persona,
     PersonaStore,
@@ -116,3 +118,182 @@ def test_safety_config_defaults():
     assert s.allow_destructive is False
     assert "delete" in s.destructive_patterns
     assert s.require_double_confirm is True
+
+
+def test_profile_store_caches_until_file_changes(tmp_path, monkeypatch):
+    path = tmp_path / "profiles.json"
+    store = ProfileStore(path)
+    store.add(Profile(name="a", match=ProfileMatch(process="a.exe")))
+
+    reads = []
+    real_read_bytes = pathlib.Path.read_bytes
+
+    def counting_read_bytes(self):
+        reads.append(self)
+        return real_read_bytes(self)
+
+    monkeypatch.setattr(pathlib.Path, "read_bytes", counting_read_bytes)
+
+    # The save primed the cache
+    assert store.get("a") is not None
+    assert store.get("a") is not None
+    assert len(reads) == 0
+
+    # External edit changes size/mtime -> reparsed
+    path.write_text(
+        json.dumps([{"name": "b", "match": {"process": "b.exe"}}]),
+        encoding="utf-8",
+    )
+    assert [p.name for p in ProfileStore(path).list()] == ["b"]
+    assert [p.name for p in ProfileStore(path).list()] == ["b"]
+    assert len(reads) == 1
+
+
+def test_raw_cache_is_bounded(tmp_path, monkeypatch):
+    from wpf_agent import config
+
+    monkeypatch.setattr(config, "_RAW_CACHE", config.OrderedDict())
+    for i in range(config._RAW_CACHE_MAX + 4):
+        PersonaStore(tmp_path / f"p{i}.json").add(Persona(name="x", description="d"))
+    assert len(config._RAW_CACHE) == config._RAW_CACHE_MAX
+    assert str(tmp_path / "p0.json") not in config._RAW_CACHE
+
+
+def test_profile_store_get_instance_is_shared():
+    ProfileStore.reset()
+    try:
+        assert ProfileStore.get_instance() is ProfileStore.get_instance()
+    finally:
+        ProfileStore.reset()
+
+
+def test_persona_store_get_instance_is_shared():
+    PersonaStore.reset()
+    try:
+        assert PersonaStore.get_instance() is PersonaStore.get_instance()
+    finally:
+        PersonaStore.reset()
+
+
+def test_get_uses_first_record_for_duplicate_names(tmp_path):
+    path = tmp_path / "personas.json"
+    path.write_text(
+        json.dumps([
+            {"name": "a", "description": "first"},
+            {"name": "a", "description": "second"},
+        ]),
+        encoding="utf-8",
+    )
+    store = PersonaStore(path)
+    assert store.get("a").description == "first"
+    assert store.get("missing") is None
+    assert store.remove("a") is True
+    assert store.list() == []
+
+
+def test_cached_reads_construct_equal_models(tmp_path):
+    path = tmp_path / "profiles.json"
+    path.write_text(
+        json.dumps([{
+            "name": "a",
+            "match": {"process": "a.exe"},
+            "launch": {"exe": "a.exe", "args": ["--x"]},
+            "safety": {"allow_destructive": True},
+        }]),
+        encoding="utf-8",
+    )
+    store = ProfileStore(path)
+    first = store.get("a")  # validated
+    second = store.get("a")  # constructed from the validated dump
+    assert second == first
+    assert store.list() == [first]
+    assert isinstance(second.match, ProfileMatch)
+    assert second.safety.allow_destructive is True
+    assert second.timeouts.startup_ms == 15000
+
+    second.launch.args.append("--y")
+    second.safety.destructive_patterns.append("nuke")
+    assert store.get("a") == first
+
+
+def test_profile_match_compiled_title_re_follows_field():
+    m = ProfileMatch(title_re="my.*app")
+    first = m.compiled_title_re
+    assert first.search("MY test APP") and m.compiled_title_re is first
+    edited = m.model_copy(update={"title_re": "other"})
+    assert edited.compiled_title_re.pattern == "other"
+    assert ProfileMatch().compiled_title_re is None
+    assert "_title_re_compiled" not in m.model_dump()
+
+
+def test_save_is_atomic_and_creates_parent(tmp_path, monkeypatch):
+    import os
+
+    path = tmp_path / "nested" / "profiles.json"
+    store = ProfileStore(path)
+    store.add(Profile(name="a"))
+    assert [p.name for p in store.list()] == ["a"]
+
+    def failing_replace(src, dst):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(os, "replace", failing_replace)
+    with pytest.raises(OSError):
+        store.add(Profile(name="b"))
+    monkeypatch.undo()
+    assert [d["name"] for d in json.loads(path.read_text(encoding="utf-8"))] == ["a"]
+    assert sorted(os.listdir(path.parent)) == ["profiles.json"]
+
+
+def test_bulk_update_saves_once_and_is_all_or_nothing(tmp_path, monkeypatch):
+    import wpf_agent.config as config
+
+    store = ProfileStore(tmp_path / "profiles.json")
+    for name in ("a", "b"):
+        store.add(Profile(name=name))
+
+    saves = []
+    real_save = config._save_json_list
+    monkeypatch.setattr(config, "_save_json_list", lambda p, d: (saves.append(p), real_save(p, d)))
+
+    store.bulk_update([
+        Profile(name="a", match=ProfileMatch(process="a.exe")),
+        Profile(name="b", match=ProfileMatch(process="b.exe")),
+    ])
+    assert len(saves) == 1
+    assert store.get("b").match.process == "b.exe"
+
+    with pytest.raises(ValueError, match="'missing' not found"):
+        store.bulk_update([Profile(name="a"), Profile(name="missing")])
+    assert len(saves) == 1
+    assert store.get("a").match.process == "a.exe"
+
+    store.update(store.get("a"))  # unchanged record: nothing to write
+    assert len(saves) == 1
+
+
+def test_raw_records_are_not_shared_with_the_cache(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.json")
+    store.add(Profile(name="a"))
+
+    records = store._load_raw()
+    records[0]["launch"] = {"exe": "edited.exe"}
+    assert store.get("a").launch is None
+
+    saved = [{"name": "b"}]
+    store._save_raw(saved)
+    saved[0]["launch"] = {"exe": "edited.exe"}
+    assert store.get("b").launch is None
+
+
+def test_transaction_saves_in_place_edits(tmp_path):
+    store = ProfileStore(tmp_path / "profiles.json")
+    store.add(Profile(name="a"))
+    store.get("a")  # warm the cache
+
+    with store.transaction() as (data, idx):
+        data[idx["a"]]["launch"] = {"exe": "app.exe"}
+
+    on_disk = json.loads((tmp_path / "profiles.json").read_text(encoding="utf-8"))
+    assert on_disk[0]["launch"] == {"exe": "app.exe"}
+    assert store.get("a").launch.exe == "app.exe"
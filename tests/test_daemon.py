@@ -0,0 +1,107 @@
+"""Tests for the opt-in CLI daemon."""
+
+import threading
+import time
+
+from wpf_agent import daemon
+
+
+def test_forward_runs_locally_without_daemon(tmp_path, monkeypatch):
+    monkeypatch.setattr(daemon, "state_path", lambda: tmp_path / "daemon.json")
+    assert daemon.forward(["tickets", "list-pending"]) is None
+    assert daemon.stop() is False
+
+
+def test_forward_skips_project_lookup_when_no_daemon_runs(tmp_path, monkeypatch):
+    def boom():
+        raise AssertionError("state_path() resolved without any daemon state")
+
+    monkeypatch.setattr(daemon, "_runtime_dir", lambda: str(tmp_path / "missing"))
+    monkeypatch.setattr(daemon, "state_path", boom)
+    assert daemon.forward(["tickets", "list-pending"]) is None
+    (tmp_path / "missing").mkdir()
+    assert daemon.forward(["tickets", "list-pending"]) is None
+
+
+def test_forward_round_trip(tmp_path, monkeypatch, capfdbinary):
+    state = tmp_path / "daemon.json"
+    monkeypatch.setattr(daemon, "_runtime_dir", lambda: str(tmp_path))
+    monkeypatch.setattr(daemon, "state_path", lambda: state)
+    server = threading.Thread(target=daemon.serve, daemon=True)
+    server.start()
+    for _ in range(100):
+        if state.exists() and state.stat().st_size:
+            break
+        time.sleep(0.02)
+
+    assert daemon.forward(["--version"]) == 0
+    assert daemon.forward(["no-such-command"]) == 2
+    assert daemon.forward(["mcp-serve"]) is None  # never forwarded
+    assert daemon.forward(["random", "run"]) is None  # test runs stay local
+    out, err = capfdbinary.readouterr()
+    assert b"wpf-agent, version" in out
+    assert b"No such command" in err
+
+    assert daemon.stop() is True
+    server.join(5)
+    assert not server.is_alive()
+    assert not state.exists()
+
+
+def test_run_cli_uses_client_environment(tmp_path, monkeypatch):
+    import os
+
+    import click
+
+    @click.command()
+    def show():
+        click.echo(os.environ.get("WPF_AGENT_STEP_ECHO", "unset"))
+
+    monkeypatch.delenv("WPF_AGENT_STEP_ECHO", raising=False)
+    env = {**os.environ, "WPF_AGENT_STEP_ECHO": "0"}
+    reply = daemon._run_cli(show, [], str(tmp_path), env)
+    assert reply["code"] == 0
+    assert reply["stdout"] == b"0\n"
+    # The daemon's own environment is restored afterwards.
+    assert "WPF_AGENT_STEP_ECHO" not in os.environ
+
+
+def test_state_path_is_per_user_not_in_project(tmp_path, monkeypatch):
+    import sys
+
+    import pytest
+
+    from wpf_agent import constants
+
+    if sys.platform != "win32":
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path / "run"))
+    monkeypatch.setattr(constants, "_find_project_root", lambda: tmp_path / "proj-a")
+    a = daemon.state_path()
+    monkeypatch.setattr(constants, "_find_project_root", lambda: tmp_path / "proj-b")
+    b = daemon.state_path()
+    assert a != b and a.parent == b.parent
+    assert tmp_path / "proj-a" not in a.parents
+
+    if sys.platform == "win32":
+        return
+    shared = tmp_path / "shared"
+    shared.mkdir(mode=0o777)
+    shared.chmod(0o777)
+    (shared / "x.json").write_text('{"address": "nowhere", "authkey": "00"}')
+    assert daemon._read_state(shared / "x.json") is None
+    monkeypatch.setattr(daemon, "state_path", lambda: shared / "x.json")
+    with pytest.raises(RuntimeError):
+        daemon.serve()
+
+
+def test_serve_leaves_a_newer_daemons_state_file(tmp_path, monkeypatch):
+    import json
+    import os
+
+    state = tmp_path / "daemon.json"
+    state.write_text(json.dumps({"pid": os.getpid() + 1}))
+    daemon._remove_own_state(state)
+    assert state.exists()
+    state.write_text(json.dumps({"pid": os.getpid()}))
+    daemon._remove_own_state(state)
+    assert not state.exists()
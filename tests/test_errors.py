@@ -25,3 +25,17 @@ def test_hierarchy():
 def test_exception_message():
     e = TargetNotFoundError("PID 999 not found")
     assert "PID 999" in str(e)
+
+
+def test_errors_with_custom_init_pickle_round_trip():
+    import pickle
+
+    from wpf_agent.core.errors import MultipleElementsFoundError, UserInterruptError
+
+    e = MultipleElementsFoundError("name='OK'", [{"automation_id": "a", "name": "OK"}])
+    back = pickle.loads(pickle.dumps(e))
+    assert (back.selector_desc, back.candidates, str(back)) == (e.selector_desc, e.candidates, str(e))
+
+    u = UserInterruptError("mouse moved", "resume with ui resume")
+    back = pickle.loads(pickle.dumps(u))
+    assert (back.reason, back.detail, str(back)) == (u.reason, u.detail, str(u))
@@ -0,0 +1,38 @@
+"""Tests for the JSON helpers."""
+
+import json
+
+from wpf_agent import _jsonio
+
+
+def test_dumps_round_trips_without_orjson(monkeypatch):
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    data = {"name": "保存", "n": 1}
+    assert _jsonio.dumps(data) == '{"name":"保存","n":1}'
+    assert json.loads(_jsonio.dumps(data, indent=True)) == data
+    assert _jsonio.loads(_jsonio.dumps_pretty(data)) == data
+
+
+def test_dumps_round_trips():
+    data = {"name": "保存", "items": [1, None, "x"]}
+    assert json.loads(_jsonio.dumps(data)) == data
+    assert "保存" in _jsonio.dumps(data, indent=True)
+    assert _jsonio.loads(_jsonio.dumps_pretty(data)) == data
+
+
+def test_dump_streams_same_document(monkeypatch):
+    import io
+
+    data = [{"name": "保存", "rect": {"left": 1}}] * 3
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    buf = io.BytesIO()
+    _jsonio.dump(data, buf, indent=True)
+    assert buf.getvalue().decode("utf-8") == _jsonio.dumps(data, indent=True)
+
+
+def test_dumps_line_is_one_compact_line(monkeypatch):
+    data = {"name": "保存", "at": object()}
+    line = _jsonio.dumps_line(data, default=str)
+    assert line.endswith(b"\n") and line.count(b"\n") == 1
+    monkeypatch.setattr(_jsonio, "orjson", None)
+    assert _jsonio.dumps_line({"name": "保存"}) == '{"name":"保存"}\n'.encode("utf-8")
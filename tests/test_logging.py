@@ -2,6 +2,8 @@
 
 import json
 
+import pytest
+
 from wpf_agent.core.session import Session
 from wpf_agent.runner.logging import ActionRecorder, StepLogger
 
@@ -17,7 +19,9 @@ def test_step_logger(tmp_path):
     logger.open()
     logger.log_step(1, "click", {"selector": "btn"}, result={"ok": True})
     logger.log_step(2, "type_text", {"text": "hi"}, error="not found")
+    logger.checkpoint()
     logger.close()
+    logger.checkpoint()  # no-op once closed
 
     entries = logger.read_last_n(10)
     assert len(entries) == 2
@@ -42,3 +46,128 @@ def test_action_recorder(tmp_path):
     assert len(data) == 2
     assert data[0]["action"] == "click"
     assert data[1]["action"] == "type_text"
+
+
+def test_action_recorder_streams_jsonl(tmp_path):
+    session = Session()
+    session.base_dir = tmp_path / "test"
+    session.screens_dir = session.base_dir / "screens"
+    session.uia_dir = session.base_dir / "uia"
+    session.start()
+
+    recorder = ActionRecorder(session)
+    assert json.loads(recorder.save().read_text()) == []
+
+    recorder.record("click", {"selector": "btn1"})
+    # On disk before save(), one action per line.
+    lines = session.actions_log_path().read_text().splitlines()
+    assert [json.loads(line)["action"] for line in lines] == ["click"]
+
+    recorder.save()
+    recorder.record("type_text", {"text": "hello"})
+    data = json.loads(recorder.save().read_text())
+    assert [d["step"] for d in data] == [1, 2]
+    assert recorder.actions == data
+
+
+def test_read_last_n_spans_tail_blocks(tmp_path, monkeypatch):
+    from wpf_agent.runner import logging as step_logging
+
+    monkeypatch.setattr(step_logging, "_TAIL_BLOCK", 64)
+    monkeypatch.setenv("WPF_AGENT_STEP_ECHO", "0")
+    session = Session()
+    session.base_dir = tmp_path / "test"
+    session.screens_dir = session.base_dir / "screens"
+    session.uia_dir = session.base_dir / "uia"
+    session.start()
+
+    logger = StepLogger(session)
+    logger.open()
+    for i in range(50):
+        logger.log_step(i, "click", {"selector": f"btn{i}"})
+    # Readable before close: the file is unbuffered, one write per step.
+    assert [e["step"] for e in StepLogger(session).read_last_n(3)] == [47, 48, 49]
+    logger.close()
+
+    assert [e["step"] for e in logger.read_last_n(20)] == list(range(30, 50))
+    assert len(logger.read_last_n(500)) == 50
+    assert logger.read_last_n(0) == []
+
+
+def test_msgpack_step_log_tail(tmp_path, monkeypatch):
+    pytest.importorskip("msgpack")
+    monkeypatch.setenv("WPF_AGENT_LOG_FORMAT", "msgpack")
+    monkeypatch.setenv("WPF_AGENT_STEP_ECHO", "0")
+    session = Session()
+    session.base_dir = tmp_path / "test"
+    session.start()
+
+    logger = StepLogger(session)
+    logger.open()
+    for i in range(1, 6):
+        logger.log_step(i, "click", {"selector": {"name": f"btn{i}"}}, result={"ok": True})
+    logger.close()
+
+    assert not session.log_path().exists()
+    assert session.log_path().with_suffix(".msgpack").exists()
+    entries = logger.read_last_n(2)
+    assert [e["step"] for e in entries] == [4, 5]
+    assert entries[-1]["args"] == {"selector": {"name": "btn5"}}
+    # Readers without the env var still find the msgpack log.
+    monkeypatch.delenv("WPF_AGENT_LOG_FORMAT")
+    assert len(StepLogger(session).read_last_n(10)) == 5
+
+
+def test_msgpack_step_log_survives_torn_tail_and_missing_module(tmp_path, monkeypatch):
+    import sys
+
+    pytest.importorskip("msgpack")
+    monkeypatch.setenv("WPF_AGENT_LOG_FORMAT", "msgpack")
+    monkeypatch.setenv("WPF_AGENT_STEP_ECHO", "0")
+    session = Session()
+    session.base_dir = tmp_path / "test"
+    session.screens_dir = session.base_dir / "screens"
+    session.uia_dir = session.base_dir / "uia"
+    session.start()
+
+    logger = StepLogger(session)
+    logger.open()
+    for i in range(1, 4):
+        logger.log_step(i, "click", {"selector": f"btn{i}"})
+    logger.close()
+    path = session.log_path().with_suffix(".msgpack")
+    intact = path.read_bytes()
+
+    # A step cut short mid-write: the new trailer points at garbage.
+    path.write_bytes(intact + b"\x85\xa4st\x00\x00\x00\x07")
+    assert StepLogger(session).read_last_n(10) == []
+    # Garbage whose trailer reaches back before the file start.
+    path.write_bytes(intact + b"\xff\xff\xff\xff")
+    assert StepLogger(session).read_last_n(10) == []
+    path.write_bytes(intact)
+    assert [e["step"] for e in StepLogger(session).read_last_n(10)] == [1, 2, 3]
+
+    # A reader without msgpack installed sees no log instead of crashing.
+    monkeypatch.setitem(sys.modules, "msgpack", None)
+    assert StepLogger(session).read_last_n(10) == []
+
+
+def test_step_echo_goes_to_stderr(tmp_path, monkeypatch, capfd):
+    import io
+
+    monkeypatch.delenv("WPF_AGENT_STEP_ECHO", raising=False)
+    monkeypatch.delenv("WPF_AGENT_LOG_FORMAT", raising=False)
+    session = Session()
+    session.base_dir = tmp_path / "test"
+    session.start()
+
+    logger = StepLogger(session)
+    logger.log_step(1, "click", {"selector": {"name": "保存"}})
+    err = capfd.readouterr().err
+    assert json.loads(err)["args"] == {"selector": {"name": "保存"}}
+
+    # A text-only stderr (no .buffer) still gets the line.
+    fake = io.StringIO()
+    monkeypatch.setattr("sys.stderr", fake)
+    logger.log_step(2, "click", {})
+    assert json.loads(fake.getvalue())["step"] == 2
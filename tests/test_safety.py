@@ -33,3 +33,41 @@ def test_is_destructive_true():
 def test_is_destructive_false():
     config = SafetyConfig()
     assert is_destructive("click", {"selector": "OpenFile"}, config) is False
+
+
+def test_patterns_are_regexes_and_track_mutation():
+    config = SafetyConfig(destructive_patterns=[r"del(ete)?\b", "nuke|wipe"])
+    assert is_destructive("press", {"key": "del"}, config) is True
+    assert is_destructive("click", {"selector": "Wipe"}, config) is True
+    assert is_destructive("click", {"selector": "Mode"}, config) is False
+    config.destructive_patterns.append("mode")
+    with pytest.raises(SafetyViolationError, match="pattern='mode'"):
+        check_safety("click", "Mode", config)
+
+
+def test_empty_patterns_match_nothing():
+    config = SafetyConfig(destructive_patterns=[])
+    assert is_destructive("click", {"selector": "DeleteAll"}, config) is False
+    check_safety("click", "DeleteAll", config)
+
+
+def test_literal_and_regex_patterns_report_earliest_hit():
+    from wpf_agent.config import _destructive_plan
+
+    config = SafetyConfig(destructive_patterns=["remove", r"drop\b", "close"])
+    literals, regexes = _destructive_plan(tuple(config.destructive_patterns))
+    assert [p for _, p in literals] == ["remove", "close"]
+    assert [r.pattern for _, r in regexes] == [r"drop\b"]
+    assert config.destructive_match("click drop then remove") == r"drop\b"
+    assert config.destructive_match("click remove then drop") == "remove"
+    assert config.destructive_match("click dropdown") is None
+    assert SafetyConfig().destructive_match("click save") is None
+
+
+def test_patterns_keep_inline_flags_backrefs_and_group_names():
+    config = SafetyConfig(destructive_patterns=["delete", "(?i)wipe"])
+    assert is_destructive("click", {"name": "Wipe all"}, config) is True
+    config = SafetyConfig(destructive_patterns=[r"(a)\1x", "(?P<g>nuke)", "(?P<g>drop)"])
+    assert config.destructive_match("click aax") == r"(a)\1x"
+    assert config.destructive_match("click drop") == "(?P<g>drop)"
+    assert config.destructive_match("click ax") is None
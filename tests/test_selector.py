@@ -36,3 +36,12 @@ def test_to_find_kwargs_empty():
 def test_describe_with_index():
     s = Selector(automation_id="Item", index=3)
     assert "idx=3" in s.describe()
+
+
+def test_selector_is_immutable():
+    import pydantic
+    import pytest
+
+    s = Selector(name="OK")
+    with pytest.raises(pydantic.ValidationError):
+        s.name = "Cancel"
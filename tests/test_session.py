@@ -11,8 +11,9 @@ def test_session_creates_dirs(tmp_path):
     s.uia_dir = s.base_dir / "uia"
     s.start()
     assert s.base_dir.exists()
-    assert s.screens_dir.exists()
-    assert s.uia_dir.exists()
+    # Sub-directories appear with their first file.
+    assert not s.screens_dir.exists()
+    assert not s.uia_dir.exists()
 
 
 def test_session_step_counter():
@@ -0,0 +1,203 @@
+"""Tests for target resolution."""
+
+import os
+import re
+import sys
+
+import pytest
+
+from wpf_agent.config import Profile, ProfileMatch
+from wpf_agent.core.target import TargetRegistry, compile_pattern, compile_title_re
+
+
+def test_resolve_profile_reuses_cached_target(monkeypatch):
+    registry = TargetRegistry()
+    calls = []
+    real = registry._resolve_match
+
+    def counting(match):
+        calls.append(match)
+        return real(match)
+
+    monkeypatch.setattr(registry, "_resolve_match", counting)
+    prof = Profile(name="self", match=ProfileMatch(pid=os.getpid()))
+
+    tid1, t1 = registry.resolve_profile(prof)
+    tid2, t2 = registry.resolve_profile(prof)
+    assert (tid1, t1) == (tid2, t2)
+    assert len(calls) == 1
+
+    # Re-resolving a live process hands back the same registered target.
+    registry._cache.clear()
+    tid3, t3 = registry.resolve_profile(prof)
+    assert (tid3, t3) == (tid1, t1)
+    assert len(calls) == 2
+    assert registry._counter == 1
+
+
+def test_cached_target_with_a_closed_window_is_re_resolved(monkeypatch):
+    from wpf_agent.core import target as target_mod
+    from wpf_agent.core.target import ResolvedTarget
+
+    registry = TargetRegistry()
+    resolved = []
+
+    def resolver():
+        resolved.append(1)
+        return f"target-{len(resolved)}", ResolvedTarget(os.getpid(), "self", 0x1234)
+
+    registry._cached(("title_re", "App"), resolver)
+    registry._cached(("title_re", "App"), resolver)
+    assert len(resolved) == 1
+
+    monkeypatch.setattr(target_mod, "window_exists", lambda hwnd: False)
+    tid, _ = registry._cached(("title_re", "App"), resolver)
+    assert tid == "target-2"
+
+
+def test_match_exe_profile_is_never_cached(monkeypatch):
+    registry = TargetRegistry()
+    launches = []
+
+    def fake_launch(exe, args, cwd):
+        launches.append(exe)
+        return f"target-{len(launches)}", object()
+
+    monkeypatch.setattr(registry, "_resolve_by_exe", fake_launch)
+    prof = Profile(name="app", match=ProfileMatch(exe="app.exe"))
+    registry.resolve_profile(prof)
+    registry.resolve_profile(prof)
+    assert launches == ["app.exe", "app.exe"]
+
+
+def test_resolve_by_pid_is_cached_until_forgotten():
+    registry = TargetRegistry()
+    tid1, _ = registry.resolve({"pid": os.getpid()})
+    tid2, _ = registry.resolve({"pid": os.getpid()})
+    assert tid1 == tid2
+
+    registry.forget_pid(os.getpid())
+    tid3, _ = registry.resolve({"pid": os.getpid()})
+    assert tid3 != tid1
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="os.kill terminates on Windows")
+def test_pid_alive_posix_probe():
+    import subprocess
+
+    from wpf_agent.core.target import _pid_alive_posix
+
+    assert _pid_alive_posix(os.getpid())
+    proc = subprocess.Popen([sys.executable, "-c", "pass"])
+    proc.wait()
+    assert not _pid_alive_posix(proc.pid)
+    assert not _pid_alive_posix(-1)
+
+
+def test_parse_shorthand():
+    from wpf_agent.core.target import parse_shorthand
+
+    assert parse_shorthand("pid:42") == {"pid": 42}
+    assert parse_shorthand("process:App.exe") == {"process": "App.exe"}
+    assert parse_shorthand("title_re:^a:b$") == {"title_re": "^a:b$"}
+    assert parse_shorthand("target-3") is None
+    assert parse_shorthand("Pid:42") is None
+    with pytest.raises(ValueError):
+        parse_shorthand("pid:abc")
+
+
+def test_compile_title_re_is_shared_and_case_insensitive():
+    regex = compile_title_re("^Calc")
+    assert regex is compile_title_re("^Calc")
+    assert compile_title_re(regex) is regex
+    assert regex.flags & re.IGNORECASE
+    assert regex.match("calculator")
+
+
+def test_title_matcher_plain_and_regex():
+    from wpf_agent.core.target import _title_matcher
+
+    plain = _title_matcher(compile_title_re("My App"))
+    assert plain("Untitled - my app")
+    assert not plain("My Ap")
+    anchored = _title_matcher(compile_title_re("^My App$"))
+    assert anchored("my app")
+    assert not anchored("Untitled - My App")
+
+
+def test_resolve_by_process_finds_self():
+    import psutil
+
+    name = psutil.Process(os.getpid()).name()
+    _, target = TargetRegistry().resolve({"process": name.upper()})
+    assert target.process_name == name
+    assert psutil.Process(target.pid).name() == name
+
+
+def _fresh_launched(monkeypatch, path):
+    from wpf_agent.core import target
+
+    monkeypatch.setattr(target, "LAUNCHED_PIDS_FILE", path)
+    monkeypatch.setattr(target, "_launched", {})
+    monkeypatch.setattr(target, "_launched_state", {"ino": None, "offset": 0, "lines": 0, "tombstones": 0})
+    return target
+
+
+def test_launched_pids_append_and_compact(tmp_path, monkeypatch):
+    path = tmp_path / "launched_pids.jsonl"
+    target = _fresh_launched(monkeypatch, path)
+
+    for pid in range(1, 41):
+        target.record_launched_pid(pid, "app.exe")
+    assert target.is_launched_pid(7) and not target.is_launched_pid(99)
+    for pid in range(1, 14):
+        target.remove_launched_pid(pid)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 53
+    # The 14th tombstone makes a quarter of the lines: only live entries remain.
+    target.remove_launched_pid(14)
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 26
+    assert not target.is_launched_pid(7) and target.is_launched_pid(15)
+
+    # Another process appending is picked up incrementally.
+    with open(path, "a", encoding="utf-8") as f:
+        f.write('{"pid": 500, "exe": "other.exe", "ts": 0}\n')
+    assert target.is_launched_pid(500)
+
+
+def test_launched_pids_import_legacy_file(tmp_path, monkeypatch):
+    legacy = tmp_path / "launched_pids.json"
+    legacy.write_text('[{"pid": 42, "exe": "a.exe", "ts": 0}]', encoding="utf-8")
+    target = _fresh_launched(monkeypatch, tmp_path / "launched_pids.jsonl")
+
+    assert target.is_launched_pid(42)
+    assert not legacy.exists()
+    target.remove_launched_pid(42)
+    assert not target.is_launched_pid(42)
+
+
+def test_wait_for_startup_polls_instead_of_sleeping(monkeypatch, capfd):
+    import time
+
+    from wpf_agent.core import target as target_mod
+
+    monkeypatch.setattr(target_mod, "LAUNCH_SETTLE", 0.3)
+    monkeypatch.setattr(target_mod, "LAUNCH_TIMEOUT", 0.3)
+    dead = target_mod.spawn_app([sys.executable, "-c", "print('noise')"])
+    assert target_mod._wait_for_startup(dead) is False
+
+    live = target_mod.spawn_app([sys.executable, "-c", "import time; time.sleep(5)"])
+    try:
+        start = time.monotonic()
+        assert target_mod._wait_for_startup(live) is True
+        assert time.monotonic() - start < 2
+    finally:
+        live.kill()
+        live.wait()
+    # Launched apps do not inherit our stdout (the MCP transport).
+    assert "noise" not in capfd.readouterr().out
+
+
+def test_compile_pattern_is_shared_and_cached():
+    assert compile_pattern(r"^Total: \d+$") is compile_pattern(r"^Total: \d+$")
+    assert compile_pattern(r"^Total: \d+$").search("Total: 42")
+    assert compile_title_re("app") is compile_pattern("app", re.IGNORECASE)
@@ -0,0 +1,64 @@
+"""Tests for evidence copying and ticket directory helpers."""
+
+import os
+
+from wpf_agent.tickets._copy import copy_into
+
+
+def test_copy_into_skips_missing_and_keeps_stat(tmp_path):
+    srcs = []
+    for i in range(3):
+        f = tmp_path / f"step-{i}.png"
+        f.write_bytes(bytes([i]) * 10)
+        os.utime(f, (1_000_000, 1_000_000 + i))
+        srcs.append(str(f))
+    srcs.append(str(tmp_path / "missing.png"))
+
+    dest = tmp_path / "ticket" / "screens"
+    assert copy_into(srcs, dest) == ["step-0.png", "step-1.png", "step-2.png"]
+    for i in range(3):
+        out = dest / f"step-{i}.png"
+        assert out.read_bytes() == bytes([i]) * 10
+        assert int(out.stat().st_mtime) == 1_000_000 + i
+
+
+def test_copy_into_nothing_to_copy_creates_no_dir(tmp_path):
+    dest = tmp_path / "screens"
+    assert copy_into([str(tmp_path / "nope.png")], dest) == []
+    assert not dest.exists()
+
+
+def test_copy_into_same_name_last_wins(tmp_path):
+    (tmp_path / "a").mkdir()
+    (tmp_path / "b").mkdir()
+    (tmp_path / "a" / "s.png").write_bytes(b"a")
+    (tmp_path / "b" / "s.png").write_bytes(b"b")
+    dest = tmp_path / "out"
+    assert copy_into([tmp_path / "a" / "s.png", tmp_path / "b" / "s.png"], dest) == ["s.png"]
+    assert (dest / "s.png").read_bytes() == b"b"
+
+
+def test_write_files_writes_every_payload(tmp_path):
+    from wpf_agent.tickets._copy import write_files
+
+    files = {tmp_path / "ticket.md": "# 保存\n".encode("utf-8"), tmp_path / "ticket.json": b"{}"}
+    write_files(files)
+    for path, data in files.items():
+        assert path.read_bytes() == data
+
+
+def test_make_ticket_dir_suffixes_same_second(tmp_path):
+    from wpf_agent.tickets._stamp import make_ticket_dir
+
+    names = [make_ticket_dir(tmp_path / "t", "TICKET-x").name for _ in range(3)]
+    assert names == ["TICKET-x", "TICKET-x-2", "TICKET-x-3"]
+
+
+def test_stamps_use_injected_clock():
+    import time
+
+    from wpf_agent.tickets._stamp import dir_stamp, iso_stamp
+
+    t = time.mktime((2024, 3, 5, 7, 8, 9, 0, 0, -1))
+    assert dir_stamp(lambda: t) == "20240305-070809"
+    assert iso_stamp(lambda: t) == "2024-03-05T07:08:09"
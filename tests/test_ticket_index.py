@@ -0,0 +1,36 @@
+"""Tests for the ticket manifest."""
+
+from wpf_agent.tickets import index
+
+
+def _make_ticket(base, rel):
+    d = base / rel
+    d.mkdir(parents=True)
+    (d / "ticket.md").write_text("#", encoding="utf-8")
+    return d
+
+
+def test_reversed_entries_span_blocks(tmp_path):
+    for i in range(300):
+        index.record_ticket(tmp_path, tmp_path / f"TICKET-{i:04d}", "s")
+    names = [e["path"].rsplit("TICKET-", 1)[1] for e in index.iter_entries_reversed(tmp_path)]
+    assert names == [f"{i:04d}" for i in reversed(range(300))]
+
+
+def test_locate_follows_triage_move(tmp_path):
+    d = _make_ticket(tmp_path, "sess/TICKET-a")
+    index.record_ticket(tmp_path, d, "sess")
+    entry = next(index.iter_entries_reversed(tmp_path))
+    assert index.locate(tmp_path, entry) == d / "ticket.md"
+
+    moved = tmp_path / "wontfix" / "TICKET-a"
+    moved.parent.mkdir()
+    d.rename(moved)
+    assert index.locate(tmp_path, entry) == moved / "ticket.md"
+
+
+def test_malformed_lines_are_skipped(tmp_path):
+    index.record_ticket(tmp_path, tmp_path / "TICKET-a")
+    with open(index.index_path(tmp_path), "a", encoding="utf-8") as f:
+        f.write("{not json\n")
+    assert len(list(index.iter_entries_reversed(tmp_path))) == 1
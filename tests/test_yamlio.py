@@ -0,0 +1,22 @@
+"""Tests for cached YAML loading."""
+
+import os
+
+from wpf_agent.testing._yamlio import _parse, load_yaml
+
+
+def test_load_yaml_caches_until_file_changes(tmp_path):
+    path = tmp_path / "scenario.yaml"
+    path.write_text("id: a\nsteps:\n  - action: click\n", encoding="utf-8")
+    _parse.cache_clear()
+
+    first = load_yaml(path)
+    first["steps"].append({"action": "mutated"})
+    second = load_yaml(path)
+    assert second == {"id": "a", "steps": [{"action": "click"}]}
+    assert _parse.cache_info().hits == 1
+
+    path.write_text("id: bb\n", encoding="utf-8")
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert load_yaml(path) == {"id": "bb"}
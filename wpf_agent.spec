@@ -17,6 +17,34 @@ a = Analysis(
     hiddenimports=[
         'wpf_agent',
         'wpf_agent.cli',
+        # Subcommands are imported lazily by name, so list them explicitly
+        'wpf_agent.cli._common',
+        'wpf_agent.cli.cmds.init',
+        'wpf_agent.cli.cmds.install_skills',
+        'wpf_agent.cli.cmds.mcp_serve',
+        'wpf_agent.cli.cmds.profiles',
+        'wpf_agent.cli.cmds.personas',
+        'wpf_agent.cli.cmds.run',
+        'wpf_agent.cli.cmds.attach',
+        'wpf_agent.cli.cmds.launch',
+        'wpf_agent.cli.cmds.close',
+        'wpf_agent.cli.cmds.ui',
+        'wpf_agent.cli.cmds.ui._common',
+        'wpf_agent.cli.cmds.ui.actions',
+        'wpf_agent.cli.cmds.ui.guard',
+        'wpf_agent.cli.cmds.ui.process',
+        'wpf_agent.cli.cmds.ui.query',
+        'wpf_agent.cli.cmds.ui.session',
+        'wpf_agent.cli.cmds.scenario',
+        'wpf_agent.cli.cmds.random_cmd',
+        'wpf_agent.cli.cmds.explore',
+        'wpf_agent.cli.cmds.verify',
+        'wpf_agent.cli.cmds.replay',
+        'wpf_agent.cli.cmds.tickets',
+        'wpf_agent.cli.cmds.daemon',
+        'wpf_agent._jsonio',
+        'wpf_agent._winproc',
+        'wpf_agent.daemon',
         'wpf_agent.config',
         'wpf_agent.constants',
         'wpf_agent.core.errors',
@@ -33,6 +61,7 @@ a = Analysis(
         'wpf_agent.runner.agent_loop',
         'wpf_agent.runner.replay',
         'wpf_agent.runner.logging',
+        'wpf_agent.testing._yamlio',
         'wpf_agent.testing.scenario',
         'wpf_agent.testing.random_tester',
         'wpf_agent.testing.assertions',
@@ -41,6 +70,9 @@ a = Analysis(
         'wpf_agent.tickets.generator',
         'wpf_agent.tickets.templates',
         'wpf_agent.tickets.evidence',
+        'wpf_agent.tickets.index',
+        'wpf_agent.tickets._copy',
+        'wpf_agent.tickets._stamp',
         'pywinauto',
         'mcp',
         'click',